@@ -70,7 +70,7 @@ def main():
         # Submit evidence of success.
         client.evidence.submit(
             promise_id=promise.id,
-            type="output",
+            type="api_callback",
             submitted_by=agent.id,
             payload={
                 "tool": "search_web",
@@ -87,7 +87,7 @@ def main():
         # Submit evidence of failure so the ledger captures *why* it broke.
         client.evidence.submit(
             promise_id=promise.id,
-            type="log",
+            type="api_callback",
             submitted_by=agent.id,
             payload={
                 "error": str(exc),
@@ -44,7 +44,7 @@ print(f"Promise created: {promise.id}  status={promise.status}")
 #    Evidence is any verifiable artefact linked to a promise.
 evidence = client.evidence.submit(
     promise_id=promise.id,
-    type="output",
+    type="api_callback",
     submitted_by=agent_a.id,
     payload={
         "format": "json",
@@ -1,6 +1,10 @@
 """Soz Ledger integration for CrewAI."""
 
-from soz_ledger_crewai.callbacks import soz_task_callback
+from soz_ledger_crewai.callbacks import (
+    BatchedTaskCallback,
+    soz_batched_task_callback,
+    soz_task_callback,
+)
 
-__all__ = ["soz_task_callback"]
+__all__ = ["BatchedTaskCallback", "soz_batched_task_callback", "soz_task_callback"]
 __version__ = "0.1.0"
@@ -1,15 +1,49 @@
-"""Soz Ledger callback factory for CrewAI.
+"""Soz Ledger callback factories for CrewAI.
 
-Provides a factory function that returns a task callback compatible with
+Provides factory functions that return task callbacks compatible with
 CrewAI's ``Task(callback=...)`` parameter. Each completed task is automatically
-recorded as a fulfilled promise on the Soz Ledger trust protocol.
+recorded as a fulfilled promise on the Soz Ledger trust protocol:
+
+- :func:`soz_task_callback` sends a single ``promises.record`` request per
+  task, inline.
+- :func:`soz_batched_task_callback` hands records to a background
+  ``WriteBehindQueue`` that batches them across tasks, and is flushed when
+  the crew completes.
 """
 
 from __future__ import annotations
 
 from typing import Any, Callable
 
-from soz_ledger import SozLedgerClient
+from soz_ledger import SozLedgerClient, WriteBehindQueue
+
+
+def _task_record(output: Any, agent_entity_id: str, promisee_id: str) -> dict:
+    """Build ``promises.record`` arguments from a CrewAI ``TaskOutput``."""
+    # Extract useful fields from CrewAI's TaskOutput
+    description = getattr(output, "description", None) or "CrewAI task completed"
+    agent_name = getattr(output, "agent", None) or "unknown_agent"
+    raw_output = getattr(output, "raw", None) or str(output)
+
+    preview = str(raw_output)[:1000]
+
+    return {
+        "promisor_id": agent_entity_id,
+        "promisee_id": promisee_id,
+        "description": description,
+        "status": "fulfilled",
+        "evidence": [
+            {
+                "type": "api_callback",
+                "submitted_by": agent_entity_id,
+                "payload": {
+                    "agent": str(agent_name),
+                    "output_preview": preview,
+                },
+            }
+        ],
+        "category": "custom",
+    }
 
 
 def soz_task_callback(
@@ -39,30 +73,99 @@ def soz_task_callback(
     promisee_id = promisee_entity_id or agent_entity_id
 
     def callback(output: Any) -> None:
-        # Extract useful fields from CrewAI's TaskOutput
-        description = getattr(output, "description", None) or "CrewAI task completed"
-        agent_name = getattr(output, "agent", None) or "unknown_agent"
-        raw_output = getattr(output, "raw", None) or str(output)
-
-        preview = str(raw_output)[:1000]
-
-        promise = client.promises.create(
-            promisor_id=agent_entity_id,
-            promisee_id=promisee_id,
-            description=description,
-            category="custom",
-        )
+        client.promises.record(**_task_record(output, agent_entity_id, promisee_id))
+
+    return callback
+
+
+class BatchedTaskCallback:
+    """CrewAI task callback that queues records for a background sender.
+
+    Returned by :func:`soz_batched_task_callback`. Calling it only enqueues
+    the task's record; call :meth:`flush` (or :meth:`close`) once the crew
+    has finished, or pass :meth:`after_kickoff` to the crew's after-kickoff
+    callbacks.
+    """
 
-        client.evidence.submit(
-            promise_id=promise.id,
-            type="output",
-            submitted_by=agent_entity_id,
-            payload={
-                "agent": str(agent_name),
-                "output_preview": preview,
-            },
+    def __init__(
+        self,
+        writer: WriteBehindQueue,
+        agent_entity_id: str,
+        promisee_entity_id: str,
+        owns_writer: bool,
+    ) -> None:
+        self.writer = writer
+        self.agent_entity_id = agent_entity_id
+        self.promisee_entity_id = promisee_entity_id
+        self._owns_writer = owns_writer
+
+    def __call__(self, output: Any) -> None:
+        self.writer.record(
+            **_task_record(output, self.agent_entity_id, self.promisee_entity_id)
         )
 
-        client.promises.fulfill(promise.id)
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued record has been sent.
 
-    return callback
+        Returns ``False`` if ``timeout`` elapsed first.
+        """
+        return self.writer.flush(timeout)
+
+    def after_kickoff(self, output: Any) -> Any:
+        """Flush queued records and pass the crew's output through unchanged."""
+        self.flush()
+        return output
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush queued records and stop the writer if this callback created it."""
+        if self._owns_writer:
+            self.writer.close(timeout)
+        else:
+            self.writer.flush(timeout)
+
+    def __enter__(self) -> BatchedTaskCallback:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def soz_batched_task_callback(
+    client: SozLedgerClient,
+    agent_entity_id: str,
+    promisee_entity_id: str | None = None,
+    writer: WriteBehindQueue | None = None,
+) -> BatchedTaskCallback:
+    """Create a CrewAI task callback that records completed tasks in batches.
+
+    Records are sent by a background thread through the batch record
+    endpoint, so tasks never wait on the ledger::
+
+        from crewai import Crew, Task
+        from soz_ledger_crewai import soz_batched_task_callback
+
+        with soz_batched_task_callback(client, agent_entity_id="ent_abc") as callback:
+            tasks = [Task(description=d, callback=callback) for d in descriptions]
+            Crew(agents=agents, tasks=tasks).kickoff()
+        # leaving the block flushes every queued record
+
+    Args:
+        client: An initialised SozLedgerClient.
+        agent_entity_id: The entity ID of the agent making promises.
+        promisee_entity_id: The entity receiving the promise. Defaults to
+            agent_entity_id if not provided.
+        writer: A ``WriteBehindQueue`` to share with other producers. By
+            default the callback creates its own and stops it on
+            :meth:`BatchedTaskCallback.close`.
+
+    Returns:
+        A :class:`BatchedTaskCallback` compatible with CrewAI's
+        Task(callback=...).
+    """
+    owns_writer = writer is None
+    return BatchedTaskCallback(
+        writer if writer is not None else WriteBehindQueue(client),
+        agent_entity_id,
+        promisee_entity_id or agent_entity_id,
+        owns_writer,
+    )
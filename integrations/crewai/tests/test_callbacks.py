@@ -4,31 +4,22 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from soz_ledger.models import Evidence, Promise
-from soz_ledger_crewai.callbacks import soz_task_callback
+from soz_ledger.local import LocalLedger
+from soz_ledger.models import Promise, RecordedPromise
+from soz_ledger_crewai.callbacks import soz_batched_task_callback, soz_task_callback
 
 
 @pytest.fixture
 def mock_client():
     client = MagicMock()
-    client.promises.create.return_value = Promise(
-        id="promise_001",
-        promisor_id="agent_1",
-        promisee_id="user_1",
-        description="Summarise the document",
-    )
-    client.evidence.submit.return_value = Evidence(
-        id="ev_001",
-        promise_id="promise_001",
-        type="output",
-        submitted_by="agent_1",
-    )
-    client.promises.fulfill.return_value = Promise(
-        id="promise_001",
-        promisor_id="agent_1",
-        promisee_id="user_1",
-        description="Summarise the document",
-        status="fulfilled",
+    client.promises.record.return_value = RecordedPromise(
+        promise=Promise(
+            id="promise_001",
+            promisor_id="agent_1",
+            promisee_id="user_1",
+            description="Summarise the document",
+            status="fulfilled",
+        ),
     )
     return client
 
@@ -43,7 +34,7 @@ class FakeTaskOutput:
 
 
 class TestSozTaskCallback:
-    def test_callback_creates_promise_and_fulfills(self, mock_client):
+    def test_callback_records_fulfilled_promise(self, mock_client):
         callback = soz_task_callback(
             mock_client, agent_entity_id="agent_1", promisee_entity_id="user_1"
         )
@@ -55,22 +46,24 @@ class TestSozTaskCallback:
 
         callback(output)
 
-        mock_client.promises.create.assert_called_once_with(
+        mock_client.promises.record.assert_called_once_with(
             promisor_id="agent_1",
             promisee_id="user_1",
             description="Summarise the document",
+            status="fulfilled",
+            evidence=[
+                {
+                    "type": "api_callback",
+                    "submitted_by": "agent_1",
+                    "payload": {
+                        "agent": "researcher",
+                        "output_preview": "The document discusses ...",
+                    },
+                }
+            ],
             category="custom",
         )
-        mock_client.evidence.submit.assert_called_once_with(
-            promise_id="promise_001",
-            type="output",
-            submitted_by="agent_1",
-            payload={
-                "agent": "researcher",
-                "output_preview": "The document discusses ...",
-            },
-        )
-        mock_client.promises.fulfill.assert_called_once_with("promise_001")
+        assert len(mock_client.method_calls) == 1
 
     def test_callback_defaults_promisee_to_agent(self, mock_client):
         callback = soz_task_callback(mock_client, agent_entity_id="agent_1")
@@ -80,12 +73,7 @@ class TestSozTaskCallback:
 
         callback(output)
 
-        mock_client.promises.create.assert_called_once_with(
-            promisor_id="agent_1",
-            promisee_id="agent_1",
-            description="Do something",
-            category="custom",
-        )
+        assert mock_client.promises.record.call_args.kwargs["promisee_id"] == "agent_1"
 
     def test_callback_truncates_long_output(self, mock_client):
         callback = soz_task_callback(
@@ -97,8 +85,8 @@ class TestSozTaskCallback:
 
         callback(output)
 
-        call_payload = mock_client.evidence.submit.call_args.kwargs["payload"]
-        assert len(call_payload["output_preview"]) == 1000
+        [evidence] = mock_client.promises.record.call_args.kwargs["evidence"]
+        assert len(evidence["payload"]["output_preview"]) == 1000
 
     def test_callback_handles_missing_attributes(self, mock_client):
         """TaskOutput-like object with no description/agent/raw attributes."""
@@ -108,10 +96,89 @@ class TestSozTaskCallback:
 
         callback("plain string output")
 
-        mock_client.promises.create.assert_called_once_with(
-            promisor_id="agent_1",
-            promisee_id="user_1",
-            description="CrewAI task completed",
-            category="custom",
+        call = mock_client.promises.record.call_args.kwargs
+        assert call["description"] == "CrewAI task completed"
+        assert call["status"] == "fulfilled"
+
+
+class TestSozBatchedTaskCallback:
+    def test_records_from_many_tasks_are_batched(self, mock_client):
+        mock_client.promises.record_many.side_effect = lambda items: [
+            mock_client.promises.record.return_value for _ in items
+        ]
+
+        with soz_batched_task_callback(
+            mock_client, agent_entity_id="agent_1", promisee_entity_id="user_1"
+        ) as callback:
+            for i in range(5):
+                callback(FakeTaskOutput(description=f"Task {i}", agent="worker", raw="ok"))
+
+        mock_client.promises.record.assert_not_called()
+        records = [
+            r for c in mock_client.promises.record_many.call_args_list for r in c.args[0]
+        ]
+        assert [r["description"] for r in records] == [f"Task {i}" for i in range(5)]
+        assert records[0]["evidence"][0]["payload"] == {
+            "agent": "worker",
+            "output_preview": "ok",
+        }
+        assert callback.writer.stats.sent == 5
+
+    def test_after_kickoff_flushes_and_returns_output(self, mock_client):
+        writer = MagicMock()
+        callback = soz_batched_task_callback(
+            mock_client, agent_entity_id="agent_1", writer=writer
         )
-        mock_client.promises.fulfill.assert_called_once_with("promise_001")
+
+        callback(FakeTaskOutput(description="Task", agent="worker", raw="ok"))
+        result = callback.after_kickoff("crew output")
+
+        assert result == "crew output"
+        assert writer.record.call_args.kwargs["promisee_id"] == "agent_1"
+        writer.flush.assert_called_once()
+
+    def test_shared_writer_is_not_closed(self, mock_client):
+        writer = MagicMock()
+        callback = soz_batched_task_callback(
+            mock_client, agent_entity_id="agent_1", writer=writer
+        )
+
+        callback.close()
+
+        writer.flush.assert_called_once()
+        writer.close.assert_not_called()
+
+
+class TestAgainstLocalLedger:
+    """End-to-end against the in-process ledger, which validates payloads."""
+
+    @pytest.fixture
+    def ledger(self):
+        return LocalLedger()
+
+    def test_inline_callback_stores_promise(self, ledger):
+        client = ledger.client()
+        agent = client.entities.create(name="agent", type="agent")
+        user = client.entities.create(name="user", type="human")
+
+        soz_task_callback(client, agent_entity_id=agent.id, promisee_entity_id=user.id)(
+            FakeTaskOutput(description="Task", agent="worker", raw="ok")
+        )
+
+        [promise] = ledger.store.list("promises", agent.id)
+        assert promise["status"] == "fulfilled"
+        assert client.evidence.list(promise["id"])[0].type == "api_callback"
+
+    def test_batched_callback_stores_every_promise(self, ledger):
+        client = ledger.client()
+        agent = client.entities.create(name="agent", type="agent")
+        user = client.entities.create(name="user", type="human")
+
+        with soz_batched_task_callback(
+            client, agent_entity_id=agent.id, promisee_entity_id=user.id
+        ) as callback:
+            for i in range(3):
+                callback(FakeTaskOutput(description=f"Task {i}", agent="worker", raw="ok"))
+
+        assert callback.writer.stats.failed == 0
+        assert len(ledger.store.list("promises", agent.id)) == 3
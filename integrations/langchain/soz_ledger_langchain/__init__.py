@@ -1,6 +1,13 @@
 """Soz Ledger integration for LangChain."""
 
+from soz_ledger_langchain.async_callback import AsyncSozLedgerCallbackHandler
 from soz_ledger_langchain.callback import SozLedgerCallbackHandler
+from soz_ledger_langchain.tracking import RunStats, RunTracker
 
-__all__ = ["SozLedgerCallbackHandler"]
+__all__ = [
+    "AsyncSozLedgerCallbackHandler",
+    "SozLedgerCallbackHandler",
+    "RunStats",
+    "RunTracker",
+]
 __version__ = "0.1.0"
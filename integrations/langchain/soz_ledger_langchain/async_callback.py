@@ -0,0 +1,189 @@
+"""Non-blocking Soz Ledger callback handler for async LangChain runs.
+
+Same lifecycle as :class:`~soz_ledger_langchain.SozLedgerCallbackHandler`,
+but the ``promises.record`` request for each tool call runs as a background
+task on the event loop, so the agent never waits for the ledger:
+  - on_tool_start  -> remembers the tool call
+  - on_tool_end    -> schedules recording a fulfilled promise
+  - on_tool_error  -> schedules recording a broken promise
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+from soz_ledger import AsyncSozLedgerClient, SozLedgerError
+from soz_ledger.models import Promise
+from soz_ledger_langchain.tracking import _ABANDONED_STATUSES, RunStats, RunTracker
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSozLedgerCallbackHandler(AsyncCallbackHandler):
+    """Async LangChain callback handler that records tool calls as promises.
+
+    Usage::
+
+        handler = AsyncSozLedgerCallbackHandler(client, agent_entity_id="ent_abc")
+        await agent.ainvoke({"input": "..."}, config={"callbacks": [handler]})
+        await handler.flush()  # before closing the client
+
+    Ledger failures are logged and never raised into the run. Runs that
+    never end are bounded by ``max_runs`` and ``run_ttl`` and recorded as
+    ``abandoned_status``, as in the sync handler.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSozLedgerClient,
+        agent_entity_id: str,
+        promisee_entity_id: str | None = None,
+        max_runs: int = 10_000,
+        run_ttl: float | None = 3600.0,
+        abandoned_status: str = "broken",
+    ) -> None:
+        if abandoned_status not in _ABANDONED_STATUSES:
+            raise ValueError(
+                f"abandoned_status must be one of {', '.join(_ABANDONED_STATUSES)}"
+            )
+        super().__init__()
+        self.client = client
+        self.agent_entity_id = agent_entity_id
+        self.promisee_entity_id = promisee_entity_id or agent_entity_id
+        self.abandoned_status = abandoned_status
+        self._runs: RunTracker[str] = RunTracker(max_runs, run_ttl)
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def run_stats(self) -> RunStats:
+        """In-flight, finished, expired and evicted run counts."""
+        return self._runs.stats
+
+    async def expire_runs(self) -> int:
+        """Record every run that has outlived ``run_ttl``; returns how many."""
+        abandoned = self._runs.expire()
+        await self._abandon(abandoned)
+        return len(abandoned)
+
+    async def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Remember the tool call; nothing is sent until it finishes."""
+        tool_name = serialized.get("name", "unknown_tool")
+        abandoned = self._runs.add(run_id, f"Tool call: {tool_name}")
+        if abandoned:
+            self._spawn(self._abandon(abandoned))
+
+    async def on_tool_end(
+        self,
+        output: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Schedule recording a fulfilled promise when a tool succeeds."""
+        description = self._runs.pop(run_id)
+        if description is None:
+            return
+
+        preview = output[:1000] if isinstance(output, str) else str(output)[:1000]
+        self._spawn(
+            self._record(
+                description, "fulfilled", "api_callback", {"output_preview": preview}
+            )
+        )
+
+    async def on_tool_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> None:
+        """Schedule recording a broken promise when a tool fails."""
+        description = self._runs.pop(run_id)
+        if description is None:
+            return
+
+        self._spawn(
+            self._record(
+                description, "broken", "api_callback", {"error": str(error)[:1000]}
+            )
+        )
+
+    async def flush(self) -> None:
+        """Wait for every scheduled ledger call to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _spawn(self, coro: Awaitable) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        # The event loop only keeps weak references to tasks.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _record(
+        self, description: str, status: str, evidence_type: str, payload: dict[str, Any]
+    ) -> None:
+        try:
+            await self.client.promises.record(
+                promisor_id=self.agent_entity_id,
+                promisee_id=self.promisee_entity_id,
+                description=description,
+                status=status,
+                evidence=[
+                    {
+                        "type": evidence_type,
+                        "submitted_by": self.agent_entity_id,
+                        "payload": payload,
+                    }
+                ],
+                category="custom",
+            )
+        except SozLedgerError as exc:
+            logger.warning("Could not record %r: %s", description, exc)
+
+    async def _abandon(self, descriptions: list[str]) -> None:
+        if not descriptions:
+            return
+        promises = [
+            {
+                "promisor_id": self.agent_entity_id,
+                "promisee_id": self.promisee_entity_id,
+                "description": description,
+                "category": "custom",
+            }
+            for description in descriptions
+        ]
+        try:
+            if self.abandoned_status == "broken":
+                await self.client.promises.record_many(
+                    [{**promise, "status": "broken"} for promise in promises]
+                )
+                return
+            # promises:record only takes terminal outcomes, so a disputed
+            # promise has to exist before it can be disputed.
+            created = await self.client.promises.create_many(promises)
+            promise_ids = [p.id for p in created if isinstance(p, Promise)]
+            if promise_ids:
+                await self.client.promises.update_status_many(
+                    [(pid, self.abandoned_status) for pid in promise_ids]
+                )
+        except SozLedgerError as exc:
+            logger.warning(
+                "Could not resolve %d abandoned tool runs: %s", len(descriptions), exc
+            )
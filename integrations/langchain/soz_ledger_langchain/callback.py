@@ -1,20 +1,114 @@
 """Soz Ledger callback handler for LangChain.
 
-Automatically wraps every tool call as a Soz Ledger promise:
-  - on_tool_start  -> creates a promise
-  - on_tool_end    -> submits evidence + fulfills
-  - on_tool_error  -> submits evidence + breaks
+Automatically records every tool call as a Soz Ledger promise:
+  - on_tool_start  -> remembers the tool call
+  - on_tool_end    -> records a fulfilled promise with the output as evidence
+  - on_tool_error  -> records a broken promise with the error as evidence
+
+Each tool call costs a single ``promises.record`` request. Pass a
+``soz_ledger.WriteBehindQueue`` as ``writer`` to move that request off the
+tool's critical path, and ``eager_after`` to create the promise up front for
+tools that run longer than that many seconds. Runs that never end are
+expired after ``run_ttl`` seconds and resolved as ``abandoned_status``.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
 from typing import Any
 from uuid import UUID
 
 from langchain_core.callbacks import BaseCallbackHandler
 
-from soz_ledger import SozLedgerClient
+from soz_ledger import SozLedgerClient, SozLedgerError, WriteBehindQueue
 from soz_ledger.models import Promise
+from soz_ledger_langchain.tracking import _ABANDONED_STATUSES, RunStats, RunTracker
+
+logger = logging.getLogger(__name__)
+
+
+class _ToolRun:
+    """What the handler knows about a tool call that has not finished yet."""
+
+    def __init__(self, description: str) -> None:
+        self.description = description
+        self.promise: Promise | None = None
+        self.scheduled = False
+        self.finished = False
+        self.lock = threading.Lock()
+
+
+class _EagerScheduler:
+    """Creates promises for runs still going after ``delay`` seconds.
+
+    One daemon thread, started on first use, serves every run of a handler
+    from a heap ordered by due time. Cancelled entries are skipped when
+    they reach the top and compacted away once they make up half the heap.
+    """
+
+    def __init__(self, delay: float, create: Callable[[_ToolRun], None]) -> None:
+        self._delay = delay
+        self._create = create
+        self._heap: list[tuple[float, int, _ToolRun]] = []
+        self._seq = itertools.count()
+        self._cancelled = 0
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, run: _ToolRun) -> None:
+        with self._cond:
+            due = time.monotonic() + self._delay
+            heapq.heappush(self._heap, (due, next(self._seq), run))
+            run.scheduled = True
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="soz-ledger-eager", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def cancel(self, run: _ToolRun) -> None:
+        with self._cond:
+            if not run.scheduled:
+                return
+            run.scheduled = False
+            self._cancelled += 1
+            if self._cancelled * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if entry[2].scheduled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _next_due(self) -> _ToolRun:
+        with self._cond:
+            while True:
+                while self._heap and not self._heap[0][2].scheduled:
+                    heapq.heappop(self._heap)
+                    self._cancelled -= 1
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                wait = self._heap[0][0] - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                run = heapq.heappop(self._heap)[2]
+                run.scheduled = False
+                return run
+
+    def _loop(self) -> None:
+        while True:
+            run = self._next_due()
+            try:
+                self._create(run)
+            except Exception:
+                logger.exception(
+                    "Eager promise creation failed for %r", run.description
+                )
 
 
 class SozLedgerCallbackHandler(BaseCallbackHandler):
@@ -24,6 +118,21 @@ class SozLedgerCallbackHandler(BaseCallbackHandler):
 
         handler = SozLedgerCallbackHandler(client, agent_entity_id="ent_abc")
         agent.invoke({"input": "..."}, config={"callbacks": [handler]})
+
+    By default nothing is sent until the tool finishes. With ``eager_after``
+    set, a tool still running after that many seconds gets its promise
+    created from the handler's scheduler thread, so long-running work is visible on the
+    ledger while it is in progress; ``eager_after=0`` creates every promise
+    inline in ``on_tool_start``.
+
+    At most ``max_runs`` unfinished runs are tracked, each for at most
+    ``run_ttl`` seconds. Runs dropped by either limit never got an end or
+    error callback; they are recorded as ``abandoned_status`` (``"broken"``
+    or ``"disputed"``) the next time a tool starts, or when
+    :meth:`expire_runs` is called -- through ``writer`` when one is set,
+    otherwise in one batched request (two for ``"disputed"``, which has to
+    create the promise before disputing it). :attr:`run_stats` reports in-flight
+    and expired counts.
     """
 
     def __init__(
@@ -31,12 +140,44 @@ class SozLedgerCallbackHandler(BaseCallbackHandler):
         client: SozLedgerClient,
         agent_entity_id: str,
         promisee_entity_id: str | None = None,
+        writer: WriteBehindQueue | None = None,
+        eager_after: float | None = None,
+        max_runs: int = 10_000,
+        run_ttl: float | None = 3600.0,
+        abandoned_status: str = "broken",
     ) -> None:
+        if abandoned_status not in _ABANDONED_STATUSES:
+            raise ValueError(
+                f"abandoned_status must be one of {', '.join(_ABANDONED_STATUSES)}"
+            )
         super().__init__()
         self.client = client
         self.agent_entity_id = agent_entity_id
         self.promisee_entity_id = promisee_entity_id or agent_entity_id
-        self._promises: dict[UUID, Promise] = {}
+        self.writer = writer
+        self.eager_after = eager_after
+        self.abandoned_status = abandoned_status
+        self._runs: RunTracker[_ToolRun] = RunTracker(max_runs, run_ttl)
+        self._eager = (
+            _EagerScheduler(eager_after, self._create_late)
+            if eager_after is not None and eager_after > 0
+            else None
+        )
+
+    @property
+    def run_stats(self) -> RunStats:
+        """In-flight, finished, expired and evicted run counts."""
+        return self._runs.stats
+
+    def expire_runs(self) -> int:
+        """Resolve every run that has outlived ``run_ttl``; returns how many.
+
+        Expiry also happens on each ``on_tool_start``; call this from a
+        maintenance thread when tools may stop starting for long periods.
+        """
+        abandoned = self._runs.expire()
+        self._abandon(abandoned)
+        return len(abandoned)
 
     def on_tool_start(
         self,
@@ -46,17 +187,17 @@ class SozLedgerCallbackHandler(BaseCallbackHandler):
         run_id: UUID,
         **kwargs: Any,
     ) -> None:
-        """Create a promise when a tool invocation begins."""
+        """Remember the tool call, creating its promise now only if eager."""
         tool_name = serialized.get("name", "unknown_tool")
-        description = f"Tool call: {tool_name}"
+        run = _ToolRun(f"Tool call: {tool_name}")
+        abandoned = self._runs.add(run_id, run)
+        if abandoned:
+            self._abandon(abandoned)
 
-        promise = self.client.promises.create(
-            promisor_id=self.agent_entity_id,
-            promisee_id=self.promisee_entity_id,
-            description=description,
-            category="custom",
-        )
-        self._promises[run_id] = promise
+        if self._eager is not None:
+            self._eager.schedule(run)
+        elif self.eager_after is not None:
+            self._create(run)
 
     def on_tool_end(
         self,
@@ -65,20 +206,13 @@ class SozLedgerCallbackHandler(BaseCallbackHandler):
         run_id: UUID,
         **kwargs: Any,
     ) -> None:
-        """Submit evidence and fulfill the promise when a tool succeeds."""
-        promise = self._promises.pop(run_id, None)
-        if promise is None:
+        """Record a fulfilled promise when a tool succeeds."""
+        run = self._runs.pop(run_id)
+        if run is None:
             return
 
         preview = output[:1000] if isinstance(output, str) else str(output)[:1000]
-
-        self.client.evidence.submit(
-            promise_id=promise.id,
-            type="output",
-            submitted_by=self.agent_entity_id,
-            payload={"output_preview": preview},
-        )
-        self.client.promises.fulfill(promise.id)
+        self._finish(run, "fulfilled", "api_callback", {"output_preview": preview})
 
     def on_tool_error(
         self,
@@ -87,15 +221,108 @@ class SozLedgerCallbackHandler(BaseCallbackHandler):
         run_id: UUID,
         **kwargs: Any,
     ) -> None:
-        """Submit evidence and break the promise when a tool fails."""
-        promise = self._promises.pop(run_id, None)
-        if promise is None:
+        """Record a broken promise when a tool fails."""
+        run = self._runs.pop(run_id)
+        if run is None:
             return
 
-        self.client.evidence.submit(
-            promise_id=promise.id,
-            type="log",
-            submitted_by=self.agent_entity_id,
-            payload={"error": str(error)[:1000]},
-        )
-        self.client.promises.break_promise(promise.id)
+        self._finish(run, "broken", "api_callback", {"error": str(error)[:1000]})
+
+    def _create(self, run: _ToolRun) -> None:
+        with run.lock:
+            if run.finished:
+                return
+            run.promise = self.client.promises.create(
+                promisor_id=self.agent_entity_id,
+                promisee_id=self.promisee_entity_id,
+                description=run.description,
+                category="custom",
+            )
+
+    def _create_late(self, run: _ToolRun) -> None:
+        try:
+            self._create(run)
+        except SozLedgerError as exc:
+            # The outcome is then recorded in one request when the tool ends.
+            logger.warning("Could not create promise for %r: %s", run.description, exc)
+
+    def _claim(self, run: _ToolRun) -> Promise | None:
+        """Stop any eager creation for ``run`` and return its promise, if any."""
+        if self._eager is not None:
+            self._eager.cancel(run)
+        # Waits for an eager creation that is still in flight.
+        with run.lock:
+            run.finished = True
+            return run.promise
+
+    def _abandon(self, runs: list[_ToolRun]) -> None:
+        if not runs:
+            return
+        claimed = [(run, self._claim(run)) for run in runs]
+        promise_ids = [promise.id for _, promise in claimed if promise is not None]
+        missing = [run.description for run, promise in claimed if promise is None]
+        try:
+            if missing and self.abandoned_status == "broken":
+                records = [
+                    {**self._abandoned_promise(d), "status": "broken"} for d in missing
+                ]
+                if self.writer is not None:
+                    for record in records:
+                        self.writer.record(**record)
+                else:
+                    self.client.promises.record_many(records)
+            elif missing:
+                # promises:record only takes terminal outcomes, so a disputed
+                # promise has to exist before it can be disputed.
+                created = self.client.promises.create_many(
+                    [self._abandoned_promise(d) for d in missing]
+                )
+                promise_ids += [p.id for p in created if isinstance(p, Promise)]
+            if self.writer is not None:
+                for pid in promise_ids:
+                    self.writer.update_status(pid, self.abandoned_status)
+            elif promise_ids:
+                self.client.promises.update_status_many(
+                    [(pid, self.abandoned_status) for pid in promise_ids]
+                )
+        except SozLedgerError as exc:
+            logger.warning(
+                "Could not resolve %d abandoned tool runs: %s", len(runs), exc
+            )
+
+    def _abandoned_promise(self, description: str) -> dict[str, Any]:
+        return {
+            "promisor_id": self.agent_entity_id,
+            "promisee_id": self.promisee_entity_id,
+            "description": description,
+            "category": "custom",
+        }
+
+    def _finish(
+        self, run: _ToolRun, status: str, evidence_type: str, payload: dict[str, Any]
+    ) -> None:
+        promise = self._claim(run)
+        evidence = {
+            "type": evidence_type,
+            "submitted_by": self.agent_entity_id,
+            "payload": payload,
+        }
+        if promise is None:
+            sink = self.writer if self.writer is not None else self.client.promises
+            sink.record(
+                promisor_id=self.agent_entity_id,
+                promisee_id=self.promisee_entity_id,
+                description=run.description,
+                status=status,
+                evidence=[evidence],
+                category="custom",
+            )
+        elif self.writer is not None:
+            self.writer.submit_evidence(promise_id=promise.id, **evidence)
+            self.writer.update_status(promise.id, status)
+        else:
+            self.client.evidence.submit(promise_id=promise.id, **evidence)
+            if status == "fulfilled":
+                self.client.promises.fulfill(promise.id)
+            else:
+                self.client.promises.break_promise(promise.id)
@@ -0,0 +1,127 @@
+"""Bounded, time-aware bookkeeping for tool runs that have not finished.
+
+LangChain does not guarantee an ``on_tool_end`` or ``on_tool_error`` for
+every ``on_tool_start`` -- cancelled or crashed chains simply stop calling
+back. :class:`RunTracker` keeps the handlers' per-run state flat in
+long-lived workers by expiring runs after a time-to-live and evicting the
+oldest runs beyond a size cap, handing both back to the caller so the
+abandoned promises can be resolved.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+# Statuses an abandoned run's promise can be resolved to.
+_ABANDONED_STATUSES = ("broken", "disputed")
+
+
+@dataclass
+class RunStats:
+    """Counters describing the runs a handler is tracking.
+
+    ``in_flight`` is the number of runs currently tracked, ``started`` and
+    ``finished`` count runs that began and ended normally, ``expired``
+    counts runs dropped after outliving the time-to-live, and ``evicted``
+    counts runs dropped to stay within the size cap.
+    """
+
+    in_flight: int = 0
+    started: int = 0
+    finished: int = 0
+    expired: int = 0
+    evicted: int = 0
+
+
+class RunTracker(Generic[T]):
+    """Runs keyed by ``run_id``, bounded in count and age.
+
+    Args:
+        max_runs: Maximum number of runs tracked at once; starting another
+            evicts the oldest.
+        ttl: Seconds after which an unfinished run is expired, or ``None``
+            to keep runs until they finish or are evicted.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        max_runs: int = 10_000,
+        ttl: float | None = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_runs < 1:
+            raise ValueError("max_runs must be at least 1")
+        self._max_runs = max_runs
+        self._ttl = ttl
+        self._clock = clock
+        # Insertion order is start order, so the oldest run is always first.
+        self._runs: OrderedDict[UUID, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = RunStats()
+
+    def add(self, run_id: UUID, run: T) -> list[T]:
+        """Track ``run`` and return the runs abandoned to make room for it."""
+        with self._lock:
+            abandoned = self._expire()
+            self._runs[run_id] = (self._clock(), run)
+            self._runs.move_to_end(run_id)
+            self._stats.started += 1
+            while len(self._runs) > self._max_runs:
+                abandoned.append(self._runs.popitem(last=False)[1][1])
+                self._stats.evicted += 1
+            return abandoned
+
+    def pop(self, run_id: UUID) -> T | None:
+        """Stop tracking a run that has finished, returning it if known."""
+        with self._lock:
+            entry = self._runs.pop(run_id, None)
+            if entry is None:
+                return None
+            self._stats.finished += 1
+            return entry[1]
+
+    def expire(self) -> list[T]:
+        """Drop and return every run that has outlived the time-to-live."""
+        with self._lock:
+            return self._expire()
+
+    @property
+    def stats(self) -> RunStats:
+        """A snapshot of the tracker's counters."""
+        with self._lock:
+            return RunStats(
+                in_flight=len(self._runs),
+                started=self._stats.started,
+                finished=self._stats.finished,
+                expired=self._stats.expired,
+                evicted=self._stats.evicted,
+            )
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    def __contains__(self, run_id: object) -> bool:
+        return run_id in self._runs
+
+    def _expire(self) -> list[T]:
+        expired: list[T] = []
+        if self._ttl is None:
+            return expired
+        cutoff = self._clock() - self._ttl
+        while self._runs:
+            started, run = next(iter(self._runs.values()))
+            if started > cutoff:
+                break
+            self._runs.popitem(last=False)
+            expired.append(run)
+        self._stats.expired += len(expired)
+        return expired
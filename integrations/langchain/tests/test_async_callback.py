@@ -0,0 +1,195 @@
+"""Tests for AsyncSozLedgerCallbackHandler."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from soz_ledger import SozLedgerError
+from soz_ledger.local import LocalLedger
+from soz_ledger.models import Promise, RecordedPromise
+from soz_ledger_langchain.async_callback import AsyncSozLedgerCallbackHandler
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.promises.record = AsyncMock(
+        return_value=RecordedPromise(
+            promise=Promise(
+                id="promise_001",
+                promisor_id="agent_1",
+                promisee_id="user_1",
+                description="Tool call: search",
+                status="fulfilled",
+            )
+        )
+    )
+    return client
+
+
+@pytest.fixture
+def handler(mock_client):
+    return AsyncSozLedgerCallbackHandler(
+        client=mock_client,
+        agent_entity_id="agent_1",
+        promisee_entity_id="user_1",
+    )
+
+
+async def run_tool(handler, error: BaseException | None = None) -> None:
+    run_id = uuid4()
+    await handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+    if error is None:
+        await handler.on_tool_end(output="result data", run_id=run_id)
+    else:
+        await handler.on_tool_error(error=error, run_id=run_id)
+
+
+class TestLifecycle:
+    def test_tool_end_records_fulfilled_promise(self, handler, mock_client):
+        async def run():
+            await run_tool(handler)
+            await handler.flush()
+
+        asyncio.run(run())
+
+        mock_client.promises.record.assert_awaited_once_with(
+            promisor_id="agent_1",
+            promisee_id="user_1",
+            description="Tool call: search",
+            status="fulfilled",
+            evidence=[
+                {
+                    "type": "api_callback",
+                    "submitted_by": "agent_1",
+                    "payload": {"output_preview": "result data"},
+                }
+            ],
+            category="custom",
+        )
+
+    def test_tool_error_records_broken_promise(self, handler, mock_client):
+        async def run():
+            await run_tool(handler, RuntimeError("boom"))
+            await handler.flush()
+
+        asyncio.run(run())
+
+        call = mock_client.promises.record.await_args.kwargs
+        assert call["status"] == "broken"
+        assert call["evidence"][0]["payload"] == {"error": "boom"}
+
+
+class TestNonBlocking:
+    def test_callbacks_do_not_wait_for_the_ledger(self, handler, mock_client):
+        release = None
+
+        async def slow_record(**kwargs):
+            await release.wait()
+
+        mock_client.promises.record = AsyncMock(side_effect=slow_record)
+
+        async def run():
+            nonlocal release
+            release = asyncio.Event()
+            await run_tool(handler)
+            await asyncio.sleep(0)
+            assert len(handler._tasks) == 1
+
+            release.set()
+            await handler.flush()
+
+        asyncio.run(run())
+
+        assert handler._tasks == set()
+        mock_client.promises.record.assert_awaited_once()
+
+
+class TestDefensiveBehavior:
+    def test_ledger_failure_is_logged(self, handler, mock_client, caplog):
+        mock_client.promises.record.side_effect = SozLedgerError(500, {"error": "down"})
+
+        async def run():
+            await run_tool(handler)
+            await handler.flush()
+
+        asyncio.run(run())
+
+        assert "Tool call: search" in caplog.text
+
+    def test_end_without_start_is_ignored(self, handler, mock_client):
+        asyncio.run(handler.on_tool_end(output="x", run_id=uuid4()))
+
+        mock_client.promises.record.assert_not_called()
+
+
+class TestAbandonedRuns:
+    def test_expired_runs_are_recorded_as_broken(self, mock_client):
+        mock_client.promises.record_many = AsyncMock()
+        handler = AsyncSozLedgerCallbackHandler(
+            client=mock_client, agent_entity_id="agent_1", run_ttl=0
+        )
+
+        async def run():
+            await handler.on_tool_start(
+                serialized={"name": "search"}, input_str="q", run_id=uuid4()
+            )
+            return await handler.expire_runs()
+
+        assert asyncio.run(run()) == 1
+
+        [records] = mock_client.promises.record_many.await_args.args
+        assert [(r["description"], r["status"]) for r in records] == [
+            ("Tool call: search", "broken")
+        ]
+        mock_client.promises.create_many.assert_not_called()
+        assert handler.run_stats.in_flight == 0
+
+    def test_expired_runs_are_created_then_disputed(self, mock_client):
+        mock_client.promises.create_many = AsyncMock(
+            return_value=[
+                Promise(id="prm_1", promisor_id="agent_1", promisee_id="user_1", description="d")
+            ]
+        )
+        mock_client.promises.update_status_many = AsyncMock()
+        handler = AsyncSozLedgerCallbackHandler(
+            client=mock_client, agent_entity_id="agent_1", run_ttl=0,
+            abandoned_status="disputed",
+        )
+
+        async def run():
+            await handler.on_tool_start(
+                serialized={"name": "search"}, input_str="q", run_id=uuid4()
+            )
+            return await handler.expire_runs()
+
+        assert asyncio.run(run()) == 1
+
+        [updates] = mock_client.promises.update_status_many.await_args.args
+        assert updates == [("prm_1", "disputed")]
+
+
+class TestAgainstLocalLedger:
+    """End-to-end against the in-process ledger, which validates payloads."""
+
+    def test_tool_outcomes_are_stored(self):
+        ledger = LocalLedger()
+
+        async def run():
+            async with ledger.async_client() as client:
+                agent = await client.entities.create(name="agent", type="agent")
+                user = await client.entities.create(name="user", type="human")
+                handler = AsyncSozLedgerCallbackHandler(
+                    client, agent_entity_id=agent.id, promisee_entity_id=user.id
+                )
+                await run_tool(handler)
+                await run_tool(handler, error=RuntimeError("boom"))
+                await handler.flush()
+                return agent.id
+
+        agent_id = asyncio.run(run())
+
+        promises = ledger.store.list("promises", agent_id)
+        assert sorted(p["status"] for p in promises) == ["broken", "fulfilled"]
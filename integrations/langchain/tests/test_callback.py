@@ -1,46 +1,43 @@
 """Tests for SozLedgerCallbackHandler."""
 
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 
-from soz_ledger.models import Evidence, Promise
+from soz_ledger.local import LocalLedger
+from soz_ledger.models import Promise, RecordedPromise
 from soz_ledger_langchain.callback import SozLedgerCallbackHandler
 
 
+PROMISE = Promise(
+    id="promise_001",
+    promisor_id="agent_1",
+    promisee_id="user_1",
+    description="Tool call: search",
+)
+
+
 @pytest.fixture
 def mock_client():
     client = MagicMock()
-    client.promises.create.return_value = Promise(
-        id="promise_001",
-        promisor_id="agent_1",
-        promisee_id="user_1",
-        description="Tool call: search",
-    )
-    client.evidence.submit.return_value = Evidence(
-        id="ev_001",
-        promise_id="promise_001",
-        type="output",
-        submitted_by="agent_1",
-    )
-    client.promises.fulfill.return_value = Promise(
-        id="promise_001",
-        promisor_id="agent_1",
-        promisee_id="user_1",
-        description="Tool call: search",
-        status="fulfilled",
-    )
-    client.promises.break_promise.return_value = Promise(
-        id="promise_001",
-        promisor_id="agent_1",
-        promisee_id="user_1",
-        description="Tool call: search",
-        status="broken",
+    client.promises.record.return_value = RecordedPromise(
+        promise=Promise(
+            id="promise_001",
+            promisor_id="agent_1",
+            promisee_id="user_1",
+            description="Tool call: search",
+            status="fulfilled",
+        ),
     )
     return client
 
 
+def recorded(mock_client) -> dict:
+    return mock_client.promises.record.call_args.kwargs
+
+
 @pytest.fixture
 def handler(mock_client):
     return SozLedgerCallbackHandler(
@@ -53,7 +50,7 @@ def handler(mock_client):
 class TestToolStartEnd:
     """Tool start -> tool end lifecycle."""
 
-    def test_tool_start_creates_promise(self, handler, mock_client):
+    def test_tool_start_sends_nothing(self, handler, mock_client):
         run_id = uuid4()
         handler.on_tool_start(
             serialized={"name": "search"},
@@ -61,15 +58,10 @@ class TestToolStartEnd:
             run_id=run_id,
         )
 
-        mock_client.promises.create.assert_called_once_with(
-            promisor_id="agent_1",
-            promisee_id="user_1",
-            description="Tool call: search",
-            category="custom",
-        )
-        assert run_id in handler._promises
+        mock_client.promises.record.assert_not_called()
+        assert run_id in handler._runs
 
-    def test_tool_end_fulfills_promise(self, handler, mock_client):
+    def test_tool_end_records_fulfilled_promise(self, handler, mock_client):
         run_id = uuid4()
         handler.on_tool_start(
             serialized={"name": "search"},
@@ -79,14 +71,22 @@ class TestToolStartEnd:
 
         handler.on_tool_end(output="result data", run_id=run_id)
 
-        mock_client.evidence.submit.assert_called_once_with(
-            promise_id="promise_001",
-            type="output",
-            submitted_by="agent_1",
-            payload={"output_preview": "result data"},
+        mock_client.promises.record.assert_called_once_with(
+            promisor_id="agent_1",
+            promisee_id="user_1",
+            description="Tool call: search",
+            status="fulfilled",
+            evidence=[
+                {
+                    "type": "api_callback",
+                    "submitted_by": "agent_1",
+                    "payload": {"output_preview": "result data"},
+                }
+            ],
+            category="custom",
         )
-        mock_client.promises.fulfill.assert_called_once_with("promise_001")
-        assert run_id not in handler._promises
+        assert len(mock_client.method_calls) == 1
+        assert run_id not in handler._runs
 
     def test_tool_end_truncates_long_output(self, handler, mock_client):
         run_id = uuid4()
@@ -99,14 +99,14 @@ class TestToolStartEnd:
         long_output = "x" * 2000
         handler.on_tool_end(output=long_output, run_id=run_id)
 
-        call_payload = mock_client.evidence.submit.call_args.kwargs["payload"]
-        assert len(call_payload["output_preview"]) == 1000
+        [evidence] = recorded(mock_client)["evidence"]
+        assert len(evidence["payload"]["output_preview"]) == 1000
 
 
 class TestToolStartError:
     """Tool start -> tool error lifecycle."""
 
-    def test_tool_error_breaks_promise(self, handler, mock_client):
+    def test_tool_error_records_broken_promise(self, handler, mock_client):
         run_id = uuid4()
         handler.on_tool_start(
             serialized={"name": "search"},
@@ -116,14 +116,16 @@ class TestToolStartError:
 
         handler.on_tool_error(error=RuntimeError("connection failed"), run_id=run_id)
 
-        mock_client.evidence.submit.assert_called_once_with(
-            promise_id="promise_001",
-            type="log",
-            submitted_by="agent_1",
-            payload={"error": "connection failed"},
-        )
-        mock_client.promises.break_promise.assert_called_once_with("promise_001")
-        assert run_id not in handler._promises
+        call = recorded(mock_client)
+        assert call["status"] == "broken"
+        assert call["evidence"] == [
+            {
+                "type": "api_callback",
+                "submitted_by": "agent_1",
+                "payload": {"error": "connection failed"},
+            }
+        ]
+        assert run_id not in handler._runs
 
 
 class TestDefensiveBehavior:
@@ -132,11 +134,228 @@ class TestDefensiveBehavior:
     def test_tool_end_without_start_is_noop(self, handler, mock_client):
         handler.on_tool_end(output="result", run_id=uuid4())
 
-        mock_client.evidence.submit.assert_not_called()
-        mock_client.promises.fulfill.assert_not_called()
+        mock_client.promises.record.assert_not_called()
 
     def test_tool_error_without_start_is_noop(self, handler, mock_client):
         handler.on_tool_error(error=RuntimeError("fail"), run_id=uuid4())
 
-        mock_client.evidence.submit.assert_not_called()
-        mock_client.promises.break_promise.assert_not_called()
+        mock_client.promises.record.assert_not_called()
+
+
+class TestWriteBehind:
+    """The record request goes through the writer when one is given."""
+
+    def test_tool_end_enqueues_instead_of_calling_client(self, mock_client):
+        writer = MagicMock()
+        handler = SozLedgerCallbackHandler(
+            client=mock_client,
+            agent_entity_id="agent_1",
+            promisee_entity_id="user_1",
+            writer=writer,
+        )
+        run_id = uuid4()
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+
+        handler.on_tool_end(output="result data", run_id=run_id)
+
+        writer.record.assert_called_once()
+        assert writer.record.call_args.kwargs["status"] == "fulfilled"
+        mock_client.promises.record.assert_not_called()
+
+    def test_tool_error_enqueues_break(self, mock_client):
+        writer = MagicMock()
+        handler = SozLedgerCallbackHandler(
+            client=mock_client, agent_entity_id="agent_1", writer=writer
+        )
+        run_id = uuid4()
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+
+        handler.on_tool_error(error=RuntimeError("boom"), run_id=run_id)
+
+        assert writer.record.call_args.kwargs["status"] == "broken"
+        mock_client.promises.record.assert_not_called()
+
+
+class TestEagerCreation:
+    """Promises created before the tool ends when ``eager_after`` is set."""
+
+    def _handler(self, mock_client, **kwargs):
+        return SozLedgerCallbackHandler(
+            client=mock_client,
+            agent_entity_id="agent_1",
+            promisee_entity_id="user_1",
+            **kwargs,
+        )
+
+    def test_zero_threshold_creates_on_start(self, mock_client):
+        mock_client.promises.create.return_value = PROMISE
+        handler = self._handler(mock_client, eager_after=0)
+        run_id = uuid4()
+
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+        mock_client.promises.create.assert_called_once()
+
+        handler.on_tool_end(output="done", run_id=run_id)
+
+        mock_client.evidence.submit.assert_called_once_with(
+            promise_id="promise_001",
+            type="api_callback",
+            submitted_by="agent_1",
+            payload={"output_preview": "done"},
+        )
+        mock_client.promises.fulfill.assert_called_once_with("promise_001")
+        mock_client.promises.record.assert_not_called()
+
+    def test_fast_tool_is_recorded_in_one_request(self, mock_client):
+        handler = self._handler(mock_client, eager_after=60)
+        run_id = uuid4()
+
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+        handler.on_tool_end(output="done", run_id=run_id)
+
+        mock_client.promises.create.assert_not_called()
+        mock_client.promises.record.assert_called_once()
+
+    def test_fast_tools_share_one_scheduler_thread(self, mock_client):
+        handler = self._handler(mock_client, eager_after=60)
+        threads = threading.active_count()
+
+        for _ in range(100):
+            run_id = uuid4()
+            handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+            handler.on_tool_end(output="done", run_id=run_id)
+
+        assert threading.active_count() <= threads + 1
+        assert len(handler._eager._heap) <= 1
+        mock_client.promises.create.assert_not_called()
+
+    def test_slow_tool_gets_promise_created_while_running(self, mock_client):
+        created = threading.Event()
+
+        def create(**kwargs):
+            created.set()
+            return PROMISE
+
+        mock_client.promises.create.side_effect = create
+        handler = self._handler(mock_client, eager_after=0.01)
+        run_id = uuid4()
+
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+        assert created.wait(5)
+        handler.on_tool_error(error=RuntimeError("boom"), run_id=run_id)
+
+        mock_client.promises.break_promise.assert_called_once_with("promise_001")
+        mock_client.promises.record.assert_not_called()
+
+    def test_eager_promise_outcome_goes_through_writer(self, mock_client):
+        mock_client.promises.create.return_value = PROMISE
+        writer = MagicMock()
+        handler = self._handler(mock_client, eager_after=0, writer=writer)
+        run_id = uuid4()
+
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+        handler.on_tool_end(output="done", run_id=run_id)
+
+        writer.submit_evidence.assert_called_once()
+        writer.update_status.assert_called_once_with("promise_001", "fulfilled")
+        mock_client.promises.fulfill.assert_not_called()
+
+
+class TestAbandonedRuns:
+    """Runs that never end are bounded and resolved in batches."""
+
+    def test_evicted_runs_are_recorded_as_broken_in_one_request(self, mock_client):
+        handler = SozLedgerCallbackHandler(
+            client=mock_client, agent_entity_id="agent_1", promisee_entity_id="user_1",
+            max_runs=1,
+        )
+
+        handler.on_tool_start(serialized={"name": "a"}, input_str="q", run_id=uuid4())
+        handler.on_tool_start(serialized={"name": "b"}, input_str="q", run_id=uuid4())
+
+        [records] = mock_client.promises.record_many.call_args.args
+        assert [(r["description"], r["status"]) for r in records] == [
+            ("Tool call: a", "broken")
+        ]
+        mock_client.promises.create_many.assert_not_called()
+        mock_client.promises.update_status_many.assert_not_called()
+        assert handler.run_stats.evicted == 1
+        assert handler.run_stats.in_flight == 1
+
+    def test_evicted_runs_go_through_writer(self, mock_client):
+        writer = MagicMock()
+        handler = SozLedgerCallbackHandler(
+            client=mock_client, agent_entity_id="agent_1", promisee_entity_id="user_1",
+            writer=writer, max_runs=1,
+        )
+
+        handler.on_tool_start(serialized={"name": "a"}, input_str="q", run_id=uuid4())
+        handler.on_tool_start(serialized={"name": "b"}, input_str="q", run_id=uuid4())
+
+        assert writer.record.call_args.kwargs["status"] == "broken"
+        mock_client.promises.record_many.assert_not_called()
+
+    def test_expired_eager_promises_are_disputed(self, mock_client):
+        mock_client.promises.create.return_value = PROMISE
+        handler = SozLedgerCallbackHandler(
+            client=mock_client, agent_entity_id="agent_1", eager_after=0,
+            run_ttl=0, abandoned_status="disputed",
+        )
+        handler.on_tool_start(serialized={"name": "a"}, input_str="q", run_id=uuid4())
+
+        assert handler.expire_runs() == 1
+
+        mock_client.promises.create_many.assert_not_called()
+        [updates] = mock_client.promises.update_status_many.call_args.args
+        assert updates == [("promise_001", "disputed")]
+        assert handler.run_stats.expired == 1
+
+    def test_invalid_abandoned_status(self, mock_client):
+        with pytest.raises(ValueError):
+            SozLedgerCallbackHandler(
+                client=mock_client, agent_entity_id="agent_1", abandoned_status="fulfilled"
+            )
+
+
+class TestAgainstLocalLedger:
+    """End-to-end against the in-process ledger, which validates payloads."""
+
+    @pytest.fixture
+    def ledger(self):
+        return LocalLedger()
+
+    @pytest.fixture
+    def setup(self, ledger):
+        client = ledger.client()
+        agent = client.entities.create(name="agent", type="agent")
+        user = client.entities.create(name="user", type="human")
+        handler = SozLedgerCallbackHandler(
+            client=client, agent_entity_id=agent.id, promisee_entity_id=user.id
+        )
+        return client, handler
+
+    def test_tool_outcomes_are_stored(self, ledger, setup):
+        client, handler = setup
+        ok, failed = uuid4(), uuid4()
+
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=ok)
+        handler.on_tool_end(output="result data", run_id=ok)
+        handler.on_tool_start(serialized={"name": "fetch"}, input_str="q", run_id=failed)
+        handler.on_tool_error(error=RuntimeError("boom"), run_id=failed)
+
+        promises = ledger.store.list("promises", handler.agent_entity_id)
+        assert sorted(p["status"] for p in promises) == ["broken", "fulfilled"]
+        for promise in promises:
+            assert len(client.evidence.list(promise["id"])) == 1
+
+    def test_eager_promise_outcome_is_stored(self, ledger, setup):
+        client, handler = setup
+        handler.eager_after = 0
+        run_id = uuid4()
+
+        handler.on_tool_start(serialized={"name": "search"}, input_str="q", run_id=run_id)
+        handler.on_tool_end(output="done", run_id=run_id)
+
+        [promise] = ledger.store.list("promises", handler.agent_entity_id)
+        assert promise["status"] == "fulfilled"
+        assert client.evidence.list(promise["id"])[0].type == "api_callback"
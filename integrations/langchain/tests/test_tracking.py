@@ -0,0 +1,72 @@
+"""Tests for RunTracker."""
+
+from uuid import uuid4
+
+import pytest
+
+from soz_ledger_langchain.tracking import RunTracker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestRunTracker:
+    def test_add_and_pop(self, clock):
+        tracker = RunTracker(clock=clock)
+        run_id = uuid4()
+
+        assert tracker.add(run_id, "a") == []
+        assert run_id in tracker
+
+        assert tracker.pop(run_id) == "a"
+        assert tracker.pop(run_id) is None
+        assert tracker.stats.started == 1
+        assert tracker.stats.finished == 1
+        assert tracker.stats.in_flight == 0
+
+    def test_runs_past_ttl_are_expired(self, clock):
+        tracker = RunTracker(ttl=10, clock=clock)
+        tracker.add(uuid4(), "old")
+        clock.now = 5
+        tracker.add(uuid4(), "newer")
+
+        clock.now = 12
+        assert tracker.expire() == ["old"]
+
+        clock.now = 20
+        assert tracker.add(uuid4(), "fresh") == ["newer"]
+        assert tracker.stats.expired == 2
+        assert tracker.stats.in_flight == 1
+
+    def test_oldest_runs_are_evicted_beyond_max_runs(self, clock):
+        tracker = RunTracker(max_runs=2, ttl=None, clock=clock)
+        tracker.add(uuid4(), "a")
+        tracker.add(uuid4(), "b")
+
+        assert tracker.add(uuid4(), "c") == ["a"]
+        assert len(tracker) == 2
+        assert tracker.stats.evicted == 1
+
+    def test_memory_stays_flat_when_runs_never_end(self, clock):
+        tracker = RunTracker(max_runs=100, ttl=60, clock=clock)
+
+        for i in range(10_000):
+            clock.now = float(i)
+            tracker.add(uuid4(), i)
+
+        assert len(tracker) == 60
+        assert tracker.stats.expired == 10_000 - 60
+
+    def test_invalid_max_runs(self):
+        with pytest.raises(ValueError):
+            RunTracker(max_runs=0)
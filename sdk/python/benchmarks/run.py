@@ -0,0 +1,256 @@
+"""SDK throughput and latency benchmarks.
+
+Drives the clients against :class:`soz_ledger.local.LocalLedger`, so the
+numbers measure the SDK (request building, decoding, models) plus the local
+ledger, never the network. Results are written as JSON; pass a previous run
+as ``--baseline`` to fail when a metric regresses::
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json --tolerance 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import soz_ledger  # noqa: E402
+from soz_ledger import models  # noqa: E402
+from soz_ledger.local import LocalLedger  # noqa: E402
+from soz_ledger.models import Evidence, _decode, _from_dict  # noqa: E402
+
+# Metrics where a higher value is better; every other metric is a cost.
+HIGHER_IS_BETTER = ("per_sec",)
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100) if len(ordered) > 1 else ordered * 99
+    return {
+        "p50_ms": round(cuts[49] * 1000, 4),
+        "p99_ms": round(cuts[98] * 1000, 4),
+    }
+
+
+def _timed(samples: dict[str, list[float]], name: str, fn: Callable, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    samples[name].append(time.perf_counter() - started)
+    return result
+
+
+# The local ledger rescans a promisor's history on every outcome, so
+# lifecycles are spread over many pairs to keep the benchmark SDK-bound.
+PAIRS = 64
+
+
+def _setup():
+    ledger = LocalLedger()
+    client = ledger.client()
+    entities = [
+        client.entities.create(name=f"bench-{i}", type="agent") for i in range(PAIRS + 1)
+    ]
+    pairs = [(entities[i].id, entities[i + 1].id) for i in range(PAIRS)]
+    return ledger, client, pairs
+
+
+def bench_sync(lifecycles: int) -> dict:
+    """One create, evidence and fulfill request per lifecycle."""
+    _, client, pairs = _setup()
+    samples: dict[str, list[float]] = {"create": [], "evidence": [], "fulfill": []}
+    started = time.perf_counter()
+    for i in range(lifecycles):
+        promisor, promisee = pairs[i % PAIRS]
+        p = _timed(
+            samples, "create", client.promises.create,
+            promisor_id=promisor, promisee_id=promisee, description="bench",
+        )
+        _timed(
+            samples, "evidence", client.evidence.submit,
+            p.id, type="manual", submitted_by=promisor, payload={"ok": True},
+        )
+        _timed(samples, "fulfill", client.promises.fulfill, p.id)
+    elapsed = time.perf_counter() - started
+    return {
+        "lifecycles_per_sec": round(lifecycles / elapsed, 2),
+        **{op: _percentiles(s) for op, s in samples.items()},
+    }
+
+
+def bench_async(lifecycles: int, concurrency: int) -> dict:
+    """Concurrent lifecycles on one :class:`AsyncSozLedgerClient`."""
+    ledger, _, pairs = _setup()
+    latencies: list[float] = []
+
+    async def lifecycle(client, gate: asyncio.Semaphore, i: int) -> None:
+        promisor, promisee = pairs[i % PAIRS]
+        async with gate:
+            started = time.perf_counter()
+            p = await client.promises.create(
+                promisor_id=promisor, promisee_id=promisee, description="bench"
+            )
+            await client.evidence.submit(
+                p.id, type="manual", submitted_by=promisor, payload={"ok": True}
+            )
+            await client.promises.fulfill(p.id)
+            latencies.append(time.perf_counter() - started)
+
+    async def run() -> float:
+        gate = asyncio.Semaphore(concurrency)
+        async with ledger.async_client() as client:
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(lifecycle(client, gate, i) for i in range(lifecycles))
+            )
+            return time.perf_counter() - started
+
+    elapsed = asyncio.run(run())
+    return {
+        "lifecycles_per_sec": round(lifecycles / elapsed, 2),
+        "concurrency": concurrency,
+        "lifecycle": _percentiles(latencies),
+    }
+
+
+def bench_batched(lifecycles: int) -> dict:
+    """Creates and fulfillments through the batch endpoints."""
+    _, client, pairs = _setup()
+    items = [
+        {"promisor_id": promisor, "promisee_id": promisee, "description": "bench"}
+        for promisor, promisee in (pairs[i % PAIRS] for i in range(lifecycles))
+    ]
+    started = time.perf_counter()
+    created = client.promises.create_many(items)
+    client.promises.fulfill_many([p.id for p in created])
+    elapsed = time.perf_counter() - started
+    return {"lifecycles_per_sec": round(lifecycles / elapsed, 2)}
+
+
+def bench_decoding(objects: int) -> dict:
+    """Cost of decoding and building models for a large evidence listing."""
+    record = {
+        "id": "ev_1", "promise_id": "prm_1", "type": "manual",
+        "submitted_by": "ent_1", "verified": False, "payload": {"k": "v"},
+        "created_at": "2026-01-01T00:00:00Z", "hash": "0" * 64,
+    }
+    body = json.dumps([record] * objects).encode()
+
+    started = time.perf_counter()
+    decoded = _decode(body)
+    decode_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for item in decoded:
+        _from_dict(Evidence, item)
+    build_s = time.perf_counter() - started
+
+    return {
+        "decoder": "orjson" if models.orjson is not None else "json",
+        "decode_us_per_object": round(decode_s / objects * 1e6, 4),
+        "from_dict_us_per_object": round(build_s / objects * 1e6, 4),
+    }
+
+
+def bench_memory(objects: int) -> dict:
+    """Bytes allocated per model instance, measured over ``objects`` instances."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [
+        Evidence(id=f"ev_{i}", promise_id="prm_1", type="manual", submitted_by="ent_1")
+        for i in range(objects)
+    ]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    del kept
+    return {
+        "objects": objects,
+        "bytes_per_object": round(allocated / objects, 1),
+    }
+
+
+def run(lifecycles: int, concurrency: int, objects: int) -> dict:
+    return {
+        "meta": {
+            "sdk_version": soz_ledger.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "lifecycles": lifecycles,
+        },
+        "results": {
+            "sync": bench_sync(lifecycles),
+            "async": bench_async(lifecycles, concurrency),
+            "batched": bench_batched(lifecycles),
+            "decoding": bench_decoding(objects),
+            "memory": bench_memory(objects),
+        },
+    }
+
+
+def _flatten(results: dict, prefix: str = "") -> dict[str, float]:
+    flat: dict[str, float] = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Describe every metric that is worse than ``baseline`` by more than ``tolerance``."""
+    now = _flatten(current["results"])
+    regressions = []
+    for name, before in _flatten(baseline["results"]).items():
+        after = now.get(name)
+        if after is None or not before or name.endswith(("concurrency", "objects")):
+            continue
+        change = (after - before) / before
+        if name.endswith(HIGHER_IS_BETTER):
+            change = -change
+        if change > tolerance:
+            regressions.append(f"{name}: {before} -> {after} ({change:+.0%} worse)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lifecycles", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run(args.lifecycles, args.concurrency, args.objects)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    print(text)
+
+    if args.baseline:
+        regressions = compare(
+            results, json.loads(Path(args.baseline).read_text()), args.tolerance
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
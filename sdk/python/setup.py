@@ -10,6 +10,11 @@ setup(
         "httpx>=0.25.0",
     ],
     extras_require={
+        "fast": ["orjson>=3.8"],
+        "numpy": ["numpy>=1.24"],
+        "arrow": ["pyarrow>=14"],
+        "http2": ["httpx[http2]>=0.25.0"],
+        "otel": ["opentelemetry-api>=1.20"],
         "test": ["pytest>=7.0"],
     },
 )
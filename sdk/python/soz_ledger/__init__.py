@@ -1,28 +1,65 @@
+from soz_ledger.aggregator import AggregatorStats, ScoreAggregator
+from soz_ledger.analytics import DeliveryAnalytics, WebhookDeliveryStats
+from soz_ledger.async_client import AsyncSozLedgerClient
+from soz_ledger.cache import CacheStats, TrustScoreCache
 from soz_ledger.client import SozLedgerClient
+from soz_ledger.dedupe import MemoryDedupeStore, SQLiteDedupeStore
 from soz_ledger.errors import SozLedgerError
+from soz_ledger.instrumentation import Instrumentation, RequestEvent
+from soz_ledger.mirror import LedgerMirror, SyncResult
 from soz_ledger.models import (
     DeliveryLog,
     Entity,
     Evidence,
     Promise,
+    RecordedPromise,
     ScoreHistoryEntry,
     ScoreHistoryResponse,
     TrustScore,
     Webhook,
     WebhookWithSecret,
 )
+from soz_ledger.ratelimit import RateLimiter
+from soz_ledger.receiver import ReceiverStats, WebhookReceiver
+from soz_ledger.scoring import Outcome, OutcomeTable, ScoringEngine
+from soz_ledger.signing import SignatureVerifier, verify_signature
+from soz_ledger.writer import WriteBehindQueue, WriterStats
 
 __all__ = [
+    "AsyncSozLedgerClient",
     "SozLedgerClient",
     "SozLedgerError",
+    "RateLimiter",
+    "Instrumentation",
+    "RequestEvent",
+    "WebhookReceiver",
+    "ReceiverStats",
+    "MemoryDedupeStore",
+    "SQLiteDedupeStore",
+    "DeliveryAnalytics",
+    "WebhookDeliveryStats",
+    "SignatureVerifier",
+    "verify_signature",
+    "ScoringEngine",
+    "Outcome",
+    "OutcomeTable",
+    "ScoreAggregator",
+    "AggregatorStats",
+    "LedgerMirror",
+    "SyncResult",
+    "TrustScoreCache",
+    "CacheStats",
     "DeliveryLog",
     "Entity",
     "Evidence",
     "Promise",
+    "RecordedPromise",
     "ScoreHistoryEntry",
     "ScoreHistoryResponse",
     "TrustScore",
     "Webhook",
     "WebhookWithSecret",
+    "WriteBehindQueue",
+    "WriterStats",
 ]
 __version__ = "0.2.0"
@@ -0,0 +1,307 @@
+"""Trust-score counters maintained from the webhook event stream.
+
+:class:`ScoreAggregator` keeps per-entity promise counters up to date from
+``promise.*`` and ``score.updated`` webhook events, so dashboards stay live
+without polling ``scores.get`` for every entity::
+
+    aggregator = ScoreAggregator(client)
+    receiver.on("*")(aggregator.handle_event)
+
+    aggregator.get(agent_id)  # TrustScore with live counters
+
+An entity is reconciled with ``scores.get`` when it is first seen and
+whenever the stream shows a gap: an outcome for a promise whose creation
+was missed, or a ``score.updated`` event whose counts disagree with the
+local ones.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from soz_ledger.dedupe import DedupeStore, MemoryDedupeStore
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.models import TrustScore
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from soz_ledger.client import SozLedgerClient
+
+logger = logging.getLogger(__name__)
+
+_OUTCOME_EVENTS = {
+    "promise.fulfilled": "fulfilled",
+    "promise.broken": "broken",
+    "promise.expired": "expired",
+}
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+@dataclass
+class CategoryCounts:
+    """Promises in one category, as observed in the event stream."""
+
+    total: int = 0
+    fulfilled: int = 0
+    broken: int = 0
+    expired: int = 0
+
+
+@dataclass
+class EntityCounts:
+    """Live promise counters for one entity.
+
+    ``total_promises``, ``fulfilled_count``, ``broken_count`` and ``streak``
+    start from the last reconciliation and follow every event since. The
+    score endpoint only reports category ratios, so ``categories`` counts
+    the promises seen in the stream since the entity was first tracked.
+    ``score`` is the last score reported by the ledger, through
+    ``scores.get`` or a ``score.updated`` event.
+    """
+
+    entity_id: str
+    score: TrustScore
+    total_promises: int = 0
+    fulfilled_count: int = 0
+    broken_count: int = 0
+    streak: int = 0
+    categories: dict[str, CategoryCounts] = field(default_factory=dict)
+    # Events at or before this ledger timestamp are already in the counters.
+    baseline: datetime | None = None
+    # promise_id -> category, for promises created and not yet resolved.
+    active: dict[str, str] = field(default_factory=dict)
+    # Set when a reconciliation failed; the next event retries it.
+    stale: bool = False
+
+
+@dataclass
+class AggregatorStats:
+    """Counters describing what a :class:`ScoreAggregator` has done.
+
+    ``applied`` counts events that changed counters, ``duplicates`` events
+    already seen, ``ignored`` events for untracked entities or older than
+    the entity's last reconciliation, ``gaps`` detected gaps, and
+    ``reconciliations``/``reconcile_errors`` calls to ``scores.get``.
+    """
+
+    events: int = 0
+    applied: int = 0
+    duplicates: int = 0
+    ignored: int = 0
+    gaps: int = 0
+    reconciliations: int = 0
+    reconcile_errors: int = 0
+
+
+class ScoreAggregator:
+    """Per-entity trust-score counters updated in O(1) per webhook event.
+
+    Args:
+        client: The :class:`SozLedgerClient` used for reconciliation.
+        entity_ids: Entities to track. By default every promisor seen in
+            the stream is tracked.
+        dedupe: Store used to drop redelivered events by ``event_id``;
+            defaults to a :class:`~soz_ledger.dedupe.MemoryDedupeStore`.
+    """
+
+    def __init__(
+        self,
+        client: SozLedgerClient,
+        entity_ids: Iterable[str] | None = None,
+        dedupe: DedupeStore | None = None,
+    ) -> None:
+        self._client = client
+        self._only = set(entity_ids) if entity_ids is not None else None
+        self._dedupe = dedupe if dedupe is not None else MemoryDedupeStore()
+        self._lock = threading.RLock()
+        self._entities: dict[str, EntityCounts] = {}
+        # Entities with a scores.get in flight, and events held back until
+        # its snapshot is applied.
+        self._pending: dict[str, list[tuple[str, dict, datetime | None]]] = {}
+        self.stats = AggregatorStats()
+
+    def handle_event(self, event: dict[str, Any]) -> None:
+        """Apply a webhook event; suitable as a ``WebhookReceiver`` handler."""
+        event_type = event.get("event_type") or event.get("type")
+        data = event.get("data") or {}
+        if event_type == "score.updated":
+            entity_id = data.get("entity_id")
+        elif event_type == "promise.created" or event_type in _OUTCOME_EVENTS:
+            entity_id = (data.get("promise") or {}).get("promisor_id")
+        else:
+            return
+        with self._lock:
+            self.stats.events += 1
+            event_id = event.get("event_id")
+            if event_id and not self._dedupe.add(event_id):
+                self.stats.duplicates += 1
+                return
+            if not entity_id or (self._only is not None and entity_id not in self._only):
+                self.stats.ignored += 1
+                return
+        self._route(entity_id, event_type, data, _parse_time(event.get("timestamp")))
+
+    def reconcile(self, entity_id: str, at: datetime | None = None) -> bool:
+        """Reset an entity's counters from ``scores.get``.
+
+        Events up to ``at`` (or the score's ``last_updated``, whichever is
+        later) are treated as included in the snapshot. Returns whether the
+        call succeeded; on failure the entity is retried on its next event.
+        The request is made without holding the aggregator's lock.
+        """
+        try:
+            score = self._client.scores.get(entity_id)
+        except SozLedgerError:
+            logger.exception("Could not reconcile trust score for %s", entity_id)
+            with self._lock:
+                self.stats.reconcile_errors += 1
+                if entity_id in self._entities:
+                    self._entities[entity_id].stale = True
+            return False
+        with self._lock:
+            self.stats.reconciliations += 1
+            previous = self._entities.get(entity_id)
+            baselines = [t for t in (at, _parse_time(score.last_updated)) if t is not None]
+            self._entities[entity_id] = EntityCounts(
+                entity_id=entity_id,
+                score=score,
+                total_promises=score.total_promises,
+                fulfilled_count=score.fulfilled_count,
+                broken_count=score.broken_count,
+                streak=score.streak,
+                categories=previous.categories if previous else {},
+                baseline=max(baselines) if baselines else None,
+                active=previous.active if previous else {},
+            )
+        return True
+
+    def get(self, entity_id: str) -> TrustScore | None:
+        """The entity's last reported score with live counters, if tracked."""
+        with self._lock:
+            counts = self._entities.get(entity_id)
+            if counts is None:
+                return None
+            return replace(
+                counts.score,
+                total_promises=counts.total_promises,
+                fulfilled_count=counts.fulfilled_count,
+                broken_count=counts.broken_count,
+                streak=counts.streak,
+            )
+
+    def counts(self, entity_id: str) -> EntityCounts | None:
+        """The entity's raw counters, if tracked."""
+        with self._lock:
+            return self._entities.get(entity_id)
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._entities
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _route(
+        self, entity_id: str, event_type: str, data: dict, at: datetime | None
+    ) -> None:
+        with self._lock:
+            if entity_id in self._pending:
+                self._pending[entity_id].append((event_type, data, at))
+                return
+            counts = self._entities.get(entity_id)
+            created = None
+            if counts is None or counts.stale:
+                # The snapshot already reflects this event.
+                if event_type == "promise.created":
+                    created = data["promise"]
+            elif counts.baseline is not None and at is not None and at <= counts.baseline:
+                self.stats.ignored += 1
+                return
+            elif event_type == "score.updated":
+                if not self._apply_score(counts, data):
+                    return
+            elif not self._apply_promise(counts, event_type, data["promise"]):
+                return
+            self._pending[entity_id] = []
+
+        ok = False
+        try:
+            ok = self.reconcile(entity_id, at)
+        finally:
+            with self._lock:
+                held = self._pending.pop(entity_id)
+                if ok and created is not None:
+                    self._entities[entity_id].active[created.get("id")] = created.get(
+                        "category", "custom"
+                    )
+        # After a failure the next event reconciles again, and that snapshot
+        # covers the held events too.
+        if ok:
+            for event_type, data, at in held:
+                self._route(entity_id, event_type, data, at)
+
+    def _apply_promise(self, counts: EntityCounts, event_type: str, promise: dict) -> bool:
+        """Apply a promise event; returns whether it revealed a gap."""
+        promise_id = promise.get("id")
+        category = promise.get("category", "custom")
+        by_category = counts.categories.setdefault(category, CategoryCounts())
+        if event_type == "promise.created":
+            if promise_id not in counts.active:
+                counts.active[promise_id] = category
+                counts.total_promises += 1
+                by_category.total += 1
+            self.stats.applied += 1
+            return False
+
+        if promise_id in counts.active:
+            del counts.active[promise_id]
+        else:
+            created = _parse_time(promise.get("created_at"))
+            if counts.baseline is None or created is None or created > counts.baseline:
+                # Created after the snapshot, yet its creation never arrived.
+                return self._gap(counts.entity_id)
+        outcome = _OUTCOME_EVENTS[event_type]
+        setattr(by_category, outcome, getattr(by_category, outcome) + 1)
+        if outcome == "fulfilled":
+            counts.fulfilled_count += 1
+            counts.streak += 1
+        else:
+            counts.broken_count += outcome == "broken"
+            counts.streak = 0
+        self.stats.applied += 1
+        return False
+
+    def _apply_score(self, counts: EntityCounts, data: dict) -> bool:
+        """Apply a ``score.updated`` event; returns whether it revealed a gap."""
+        fields = ("total_promises", "fulfilled_count", "broken_count")
+        reported = tuple(data.get(name) for name in fields)
+        local = tuple(getattr(counts, name) for name in fields)
+        if None not in reported and reported != local:
+            return self._gap(counts.entity_id)
+        counts.score = replace(
+            counts.score,
+            overall_score=data.get("new_score", counts.score.overall_score),
+            level=data.get("new_level", counts.score.level),
+            rated=data.get("is_rated", counts.score.rated),
+        )
+        self.stats.applied += 1
+        return False
+
+    def _gap(self, entity_id: str) -> bool:
+        logger.info("Gap in the event stream for %s; reconciling", entity_id)
+        self.stats.gaps += 1
+        return True
@@ -0,0 +1,203 @@
+"""Webhook delivery-log analytics.
+
+:class:`DeliveryAnalytics` streams the delivery logs of every webhook and
+keeps running per-webhook statistics: success rate, attempt distribution,
+pending retry backlog and time to successful delivery. Each
+:meth:`~DeliveryAnalytics.refresh` only reads logs created since the
+previous one, and :meth:`~DeliveryAnalytics.checkpoint` returns a
+JSON-compatible state to resume from in another process::
+
+    analytics = DeliveryAnalytics(client, checkpoint=load_checkpoint())
+    for stats in analytics.refresh().values():
+        if stats.success_rate < 0.9:
+            alert(stats.webhook_id)
+    save_checkpoint(analytics.checkpoint())
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from soz_ledger.models import DeliveryLog
+
+if TYPE_CHECKING:
+    from soz_ledger.client import SozLedgerClient
+
+
+def _parse_time(value: str) -> datetime:
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+@dataclass
+class WebhookDeliveryStats:
+    """Running delivery statistics for one webhook.
+
+    ``attempts`` and ``successes``/``failures`` count individual delivery
+    attempts; ``attempt_distribution`` maps an attempt number to how many
+    attempts had it. ``delivered_events`` counts events that were
+    eventually delivered and ``exhausted_events`` events that failed with
+    no retry left. ``pending_retries`` is the current backlog: events whose
+    latest attempt failed and has a retry scheduled. Time to success is
+    measured from an event's first attempt, for events whose first attempt
+    was read.
+    """
+
+    webhook_id: str
+    attempts: int = 0
+    successes: int = 0
+    failures: int = 0
+    attempt_distribution: dict[int, int] = field(default_factory=dict)
+    delivered_events: int = 0
+    exhausted_events: int = 0
+    pending_retries: int = 0
+    timed_deliveries: int = 0
+    total_time_to_success: float = 0.0
+    max_time_to_success: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    @property
+    def mean_time_to_success(self) -> float | None:
+        """Mean seconds from first attempt to successful delivery."""
+        if not self.timed_deliveries:
+            return None
+        return self.total_time_to_success / self.timed_deliveries
+
+
+@dataclass
+class _WebhookState:
+    stats: WebhookDeliveryStats
+    # created_at of the newest log read; ``since`` is inclusive, so the IDs
+    # of logs created at that instant are kept to skip them next time.
+    since: str | None = None
+    seen: set[str] = field(default_factory=set)
+    # event_id -> created_at of its first attempt (None if not read), for
+    # events waiting on a retry.
+    pending: dict[str, str | None] = field(default_factory=dict)
+
+
+class DeliveryAnalytics:
+    """Incremental delivery statistics across a set of webhooks.
+
+    Args:
+        client: The client to read webhooks and delivery logs with.
+        page_size: Page size used when streaming delivery logs.
+        checkpoint: State returned by :meth:`checkpoint` to resume from.
+    """
+
+    def __init__(
+        self,
+        client: SozLedgerClient,
+        page_size: int = 100,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> None:
+        self._client = client
+        self._page_size = page_size
+        self._webhooks: dict[str, _WebhookState] = {}
+        for webhook_id, state in (checkpoint or {}).get("webhooks", {}).items():
+            stats = dict(state["stats"])
+            stats["attempt_distribution"] = {
+                int(k): v for k, v in stats["attempt_distribution"].items()
+            }
+            self._webhooks[webhook_id] = _WebhookState(
+                stats=WebhookDeliveryStats(**stats),
+                since=state["since"],
+                seen=set(state["seen"]),
+                pending=dict(state["pending"]),
+            )
+
+    def refresh(
+        self, webhook_ids: list[str] | None = None
+    ) -> dict[str, WebhookDeliveryStats]:
+        """Read new delivery logs and return the updated statistics.
+
+        ``webhook_ids`` limits the refresh to those webhooks; by default
+        every webhook returned by ``client.webhooks.iter()`` is read.
+        """
+        if webhook_ids is None:
+            webhook_ids = [w.id for w in self._client.webhooks.iter(page_size=self._page_size)]
+        for webhook_id in webhook_ids:
+            self._refresh(webhook_id)
+        return self.stats
+
+    @property
+    def stats(self) -> dict[str, WebhookDeliveryStats]:
+        """Statistics per webhook ID, as of the last refresh."""
+        return {webhook_id: state.stats for webhook_id, state in self._webhooks.items()}
+
+    def checkpoint(self) -> dict[str, Any]:
+        """Return a JSON-compatible snapshot to pass back as ``checkpoint``."""
+        return {
+            "webhooks": {
+                webhook_id: {
+                    "stats": asdict(state.stats),
+                    "since": state.since,
+                    "seen": sorted(state.seen),
+                    "pending": dict(state.pending),
+                }
+                for webhook_id, state in self._webhooks.items()
+            }
+        }
+
+    def _refresh(self, webhook_id: str) -> None:
+        state = self._webhooks.get(webhook_id)
+        if state is None:
+            state = self._webhooks[webhook_id] = _WebhookState(
+                stats=WebhookDeliveryStats(webhook_id=webhook_id)
+            )
+        logs = self._client.webhooks.iter_logs(
+            webhook_id, page_size=self._page_size, since=state.since
+        )
+        # The API does not promise an order, so the watermark only moves
+        # forward, and ``seen`` keeps the IDs read at its exact instant
+        # (``since`` is inclusive).
+        already_read = state.seen
+        newest = _parse_time(state.since) if state.since else None
+        for log in logs:
+            if log.id in already_read:
+                continue
+            self._add(state, log)
+            created = _parse_time(log.created_at)
+            if newest is None or created > newest:
+                newest = created
+                state.since = log.created_at
+                state.seen = {log.id}
+            elif created == newest:
+                state.seen.add(log.id)
+
+    @staticmethod
+    def _add(state: _WebhookState, log: DeliveryLog) -> None:
+        stats = state.stats
+        stats.attempts += 1
+        distribution = stats.attempt_distribution
+        distribution[log.attempt_number] = distribution.get(log.attempt_number, 0) + 1
+
+        if log.event_id in state.pending:
+            first_at = state.pending.pop(log.event_id)
+        else:
+            first_at = log.created_at if log.attempt_number == 1 else None
+
+        if log.success:
+            stats.successes += 1
+            stats.delivered_events += 1
+            if first_at is not None:
+                elapsed = (
+                    _parse_time(log.created_at) - _parse_time(first_at)
+                ).total_seconds()
+                stats.timed_deliveries += 1
+                stats.total_time_to_success += elapsed
+                stats.max_time_to_success = max(stats.max_time_to_success, elapsed)
+        else:
+            stats.failures += 1
+            if log.next_retry_at:
+                state.pending[log.event_id] = first_at
+            else:
+                stats.exhausted_events += 1
+        stats.pending_retries = len(state.pending)
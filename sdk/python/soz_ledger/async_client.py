@@ -0,0 +1,499 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+
+import httpx
+
+from soz_ledger.client import (
+    _BATCH_SIZE,
+    _chunks,
+    _http_options,
+    _parse_batch,
+    _parse_recorded,
+    _promise_payload,
+    _record_payload,
+    _raise_for_status,
+    _transport_error,
+)
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.instrumentation import Instrumentation
+from soz_ledger.models import (
+    DeliveryLog,
+    Entity,
+    Evidence,
+    Promise,
+    RecordedPromise,
+    ScoreHistoryEntry,
+    ScoreHistoryResponse,
+    TrustScore,
+    Webhook,
+    WebhookWithSecret,
+    _decode,
+    _from_dict,
+)
+from soz_ledger.pagination import (
+    NEXT_CURSOR_HEADER,
+    Page,
+    _page_params,
+    apaginate,
+)
+from soz_ledger.ratelimit import RateLimiter
+
+# httpx's own pool size; also caps fan-out when the pool is unbounded.
+_DEFAULT_MAX_CONNECTIONS = 100
+
+
+class _AsyncEntitiesAPI:
+    def __init__(self, client: AsyncSozLedgerClient) -> None:
+        self._client = client
+
+    async def create(
+        self,
+        name: str,
+        type: str,
+        public_key: str | None = None,
+        metadata: dict | None = None,
+    ) -> Entity:
+        data: dict = {"name": name, "type": type}
+        if public_key is not None:
+            data["public_key"] = public_key
+        if metadata is not None:
+            data["metadata"] = metadata
+
+        resp = await self._client._post("/v1/entities", json=data)
+        return _from_dict(Entity, resp)
+
+    async def get(self, entity_id: str) -> Entity:
+        resp = await self._client._get(f"/v1/entities/{entity_id}")
+        return _from_dict(Entity, resp)
+
+    async def score(self, entity_id: str) -> TrustScore:
+        resp = await self._client._get(f"/v1/entities/{entity_id}/score")
+        return _from_dict(TrustScore, resp)
+
+
+class _AsyncPromisesAPI:
+    def __init__(self, client: AsyncSozLedgerClient) -> None:
+        self._client = client
+
+    async def create(
+        self,
+        promisor_id: str,
+        promisee_id: str,
+        description: str,
+        deadline: str | None = None,
+        category: str = "custom",
+    ) -> Promise:
+        data = _promise_payload(
+            promisor_id, promisee_id, description, deadline, category
+        )
+        resp = await self._client._post("/v1/promises", json=data)
+        return _from_dict(Promise, resp)
+
+    async def record(
+        self,
+        promisor_id: str,
+        promisee_id: str,
+        description: str,
+        status: str = "fulfilled",
+        evidence: Iterable[dict] | None = None,
+        deadline: str | None = None,
+        category: str = "custom",
+    ) -> RecordedPromise:
+        data = _record_payload(
+            promisor_id, promisee_id, description, status, evidence, deadline, category
+        )
+        resp = await self._client._post("/v1/promises:record", json=data)
+        return _parse_recorded(resp)
+
+    async def record_many(
+        self, records: Iterable[dict]
+    ) -> list[RecordedPromise | SozLedgerError]:
+        results: list[RecordedPromise | SozLedgerError] = []
+        for chunk in _chunks(_record_payload(**r) for r in records):
+            resp = await self._client._post(
+                "/v1/promises:batchRecord", json={"items": chunk}
+            )
+            results.extend(
+                _parse_batch(RecordedPromise, resp, len(chunk), _parse_recorded)
+            )
+        return results
+
+    async def create_many(
+        self, promises: Iterable[dict]
+    ) -> list[Promise | SozLedgerError]:
+        results: list[Promise | SozLedgerError] = []
+        for chunk in _chunks(_promise_payload(**p) for p in promises):
+            resp = await self._client._post(
+                "/v1/promises:batchCreate", json={"items": chunk}
+            )
+            results.extend(_parse_batch(Promise, resp, len(chunk)))
+        return results
+
+    async def update_status_many(
+        self, updates: Iterable[tuple[str, str]]
+    ) -> list[Promise | SozLedgerError]:
+        results: list[Promise | SozLedgerError] = []
+        items = ({"promise_id": pid, "status": status} for pid, status in updates)
+        for chunk in _chunks(items):
+            resp = await self._client._post(
+                "/v1/promises:batchUpdateStatus", json={"items": chunk}
+            )
+            results.extend(_parse_batch(Promise, resp, len(chunk)))
+        return results
+
+    async def fulfill_many(
+        self, promise_ids: Iterable[str]
+    ) -> list[Promise | SozLedgerError]:
+        return await self.update_status_many(
+            (pid, "fulfilled") for pid in promise_ids
+        )
+
+    async def break_many(
+        self, promise_ids: Iterable[str]
+    ) -> list[Promise | SozLedgerError]:
+        return await self.update_status_many((pid, "broken") for pid in promise_ids)
+
+    async def get(self, promise_id: str) -> Promise:
+        resp = await self._client._get(f"/v1/promises/{promise_id}")
+        return _from_dict(Promise, resp)
+
+    async def fulfill(self, promise_id: str) -> Promise:
+        resp = await self._client._patch(
+            f"/v1/promises/{promise_id}/status", json={"status": "fulfilled"}
+        )
+        return _from_dict(Promise, resp)
+
+    async def break_promise(self, promise_id: str) -> Promise:
+        resp = await self._client._patch(
+            f"/v1/promises/{promise_id}/status", json={"status": "broken"}
+        )
+        return _from_dict(Promise, resp)
+
+    async def dispute(self, promise_id: str) -> Promise:
+        resp = await self._client._patch(
+            f"/v1/promises/{promise_id}/status", json={"status": "disputed"}
+        )
+        return _from_dict(Promise, resp)
+
+
+class _AsyncEvidenceAPI:
+    def __init__(self, client: AsyncSozLedgerClient) -> None:
+        self._client = client
+
+    async def submit(
+        self,
+        promise_id: str,
+        type: str,
+        submitted_by: str,
+        payload: dict | None = None,
+    ) -> Evidence:
+        data: dict = {"type": type, "submitted_by": submitted_by}
+        if payload is not None:
+            data["payload"] = payload
+
+        resp = await self._client._post(
+            f"/v1/promises/{promise_id}/evidence", json=data
+        )
+        return _from_dict(Evidence, resp)
+
+    async def list(self, promise_id: str) -> list[Evidence]:
+        resp = await self._client._get(f"/v1/promises/{promise_id}/evidence")
+        return [_from_dict(Evidence, e) for e in resp]
+
+    def iter(
+        self,
+        promise_id: str,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Evidence]:
+        """Lazily iterate over a promise's evidence, one page at a time.
+
+        ``since`` (ISO 8601, inclusive) skips evidence created before it and
+        ``limit`` stops after that many items; the next page is prefetched
+        while the current one is consumed.
+        """
+        path = f"/v1/promises/{promise_id}/evidence"
+
+        async def fetch(cursor: str | None) -> Page[Evidence]:
+            body, next_cursor = await self._client._get_page(
+                path, _page_params(page_size, cursor, since)
+            )
+            return [_from_dict(Evidence, e) for e in body], next_cursor
+
+        return apaginate(fetch, limit)
+
+
+class _AsyncScoresAPI:
+    def __init__(self, client: AsyncSozLedgerClient) -> None:
+        self._client = client
+
+    async def get(self, entity_id: str) -> TrustScore:
+        resp = await self._client._get(f"/v1/scores/{entity_id}")
+        return _from_dict(TrustScore, resp)
+
+    async def get_many(
+        self, entity_ids: Iterable[str], chunk_size: int = _BATCH_SIZE
+    ) -> dict[str, TrustScore | SozLedgerError]:
+        """Like the sync ``get_many``, but requests chunks concurrently.
+
+        At most as many chunks are in flight as the client's connection
+        pool allows (``limits.max_connections``, 100 by default).
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        chunks = list(_chunks(ids, chunk_size))
+        slots = asyncio.Semaphore(self._client._max_connections)
+
+        async def fetch(chunk: list[str]) -> dict:
+            async with slots:
+                return await self._client._post(
+                    "/v1/scores:batchGet", json={"entity_ids": chunk}
+                )
+
+        responses = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        results: dict[str, TrustScore | SozLedgerError] = {}
+        for chunk, resp in zip(chunks, responses):
+            results.update(zip(chunk, _parse_batch(TrustScore, resp, len(chunk))))
+        return results
+
+    async def history(self, entity_id: str) -> ScoreHistoryResponse:
+        resp = await self._client._get(f"/v1/scores/{entity_id}/history")
+        entries = [
+            _from_dict(ScoreHistoryEntry, h) for h in resp.get("history", [])
+        ]
+        return ScoreHistoryResponse(entity_id=resp["entity_id"], history=entries)
+
+    def iter_history(
+        self,
+        entity_id: str,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[ScoreHistoryEntry]:
+        """Lazily iterate over an entity's score history, newest first.
+
+        Pages with the history endpoint's cursor, unlike :meth:`history`,
+        which keeps its single limit/offset request. ``since`` (ISO 8601,
+        inclusive) skips entries recorded before it and ``limit`` stops
+        after that many entries; ``page_size`` entries are fetched per
+        request.
+        """
+        path = f"/v1/scores/{entity_id}/history"
+
+        async def fetch(cursor: str | None) -> Page[ScoreHistoryEntry]:
+            body, next_cursor = await self._client._get_page(
+                path, _page_params(page_size, cursor, since)
+            )
+            entries = [
+                _from_dict(ScoreHistoryEntry, h) for h in body.get("history", [])
+            ]
+            return entries, next_cursor
+
+        return apaginate(fetch, limit)
+
+
+class _AsyncWebhooksAPI:
+    def __init__(self, client: AsyncSozLedgerClient) -> None:
+        self._client = client
+
+    async def create(
+        self,
+        url: str,
+        event_types: list[str],
+    ) -> WebhookWithSecret:
+        data: dict = {"url": url, "event_types": event_types}
+        resp = await self._client._post("/v1/webhooks", json=data)
+        return _from_dict(WebhookWithSecret, resp)
+
+    async def list(self) -> list[Webhook]:
+        resp = await self._client._get("/v1/webhooks")
+        return [_from_dict(Webhook, w) for w in resp]
+
+    def iter(
+        self,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[Webhook]:
+        """Lazily iterate over the caller's webhooks, one page at a time.
+
+        ``since`` (ISO 8601, inclusive) skips webhooks created before it and
+        ``limit`` stops after that many; ``page_size`` webhooks are fetched
+        per request.
+        """
+        async def fetch(cursor: str | None) -> Page[Webhook]:
+            body, next_cursor = await self._client._get_page(
+                "/v1/webhooks", _page_params(page_size, cursor, since)
+            )
+            return [_from_dict(Webhook, w) for w in body], next_cursor
+
+        return apaginate(fetch, limit)
+
+    async def get(self, webhook_id: str) -> Webhook:
+        resp = await self._client._get(f"/v1/webhooks/{webhook_id}")
+        return _from_dict(Webhook, resp)
+
+    async def update(
+        self,
+        webhook_id: str,
+        url: str | None = None,
+        event_types: list[str] | None = None,
+        is_active: bool | None = None,
+    ) -> Webhook:
+        data: dict = {}
+        if url is not None:
+            data["url"] = url
+        if event_types is not None:
+            data["event_types"] = event_types
+        if is_active is not None:
+            data["is_active"] = is_active
+        resp = await self._client._patch(f"/v1/webhooks/{webhook_id}", json=data)
+        return _from_dict(Webhook, resp)
+
+    async def delete(self, webhook_id: str) -> None:
+        await self._client._delete(f"/v1/webhooks/{webhook_id}")
+
+    async def logs(self, webhook_id: str) -> list[DeliveryLog]:
+        resp = await self._client._get(f"/v1/webhooks/{webhook_id}/logs")
+        return [_from_dict(DeliveryLog, log) for log in resp]
+
+    def iter_logs(
+        self,
+        webhook_id: str,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[DeliveryLog]:
+        """Lazily iterate over a webhook's delivery logs, one page at a time.
+
+        ``since`` (ISO 8601, inclusive) skips attempts logged before it and
+        ``limit`` stops after that many; ``page_size`` logs are fetched per
+        request.
+        """
+        path = f"/v1/webhooks/{webhook_id}/logs"
+
+        async def fetch(cursor: str | None) -> Page[DeliveryLog]:
+            body, next_cursor = await self._client._get_page(
+                path, _page_params(page_size, cursor, since)
+            )
+            return [_from_dict(DeliveryLog, log) for log in body], next_cursor
+
+        return apaginate(fetch, limit)
+
+
+class AsyncSozLedgerClient:
+    """Asyncio variant of :class:`~soz_ledger.SozLedgerClient`.
+
+    Exposes the same sub-APIs with awaitable methods, built on
+    ``httpx.AsyncClient`` so many ledger calls can be in flight on a single
+    event loop::
+
+        async with AsyncSozLedgerClient("your_api_key") as client:
+            agent = await client.entities.create(name="my-agent", type="agent")
+
+    Accepts the same connection options as the sync client; a shared
+    ``transport`` must be an ``httpx.AsyncBaseTransport``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://localhost:8000",
+        timeout: float | httpx.Timeout = 30.0,
+        rate_limiter: RateLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        self._api_key = api_key
+        self._base_url = base_url.rstrip("/")
+        self._rate_limiter = rate_limiter
+        self._instrumentation = instrumentation
+        self._owns_transport = transport is None
+        self._max_connections = (
+            limits.max_connections if limits is not None else None
+        ) or _DEFAULT_MAX_CONNECTIONS
+        self._http = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+            **_http_options(limits, http2, transport),
+        )
+
+        self.entities = _AsyncEntitiesAPI(self)
+        self.promises = _AsyncPromisesAPI(self)
+        self.evidence = _AsyncEvidenceAPI(self)
+        self.scores = _AsyncScoresAPI(self)
+        self.webhooks = _AsyncWebhooksAPI(self)
+
+    # ── Internal HTTP helpers ────────────────────────────────────────────
+
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        limiter = self._rate_limiter
+        instr = self._instrumentation
+        attempt = 0
+        while True:
+            if limiter is not None:
+                delay = limiter.acquire(self._api_key, method, path, kwargs.get("json"))
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            event = instr.start(method, path, attempt) if instr is not None else None
+            try:
+                resp = await self._http.request(method, path, **kwargs)
+            except httpx.HTTPError as exc:
+                if event is not None:
+                    instr.finish(event, error=exc)
+                raise _transport_error(exc) from exc
+            if event is not None:
+                instr.finish(event, resp)
+
+            if limiter is not None:
+                retry_in = limiter.observe(
+                    self._api_key,
+                    method,
+                    path,
+                    kwargs.get("json"),
+                    resp.status_code,
+                    resp.headers,
+                    attempt,
+                )
+                if retry_in is not None:
+                    attempt += 1
+                    continue
+
+            _raise_for_status(resp)
+            return resp
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict | list:
+        resp = await self._send(method, path, **kwargs)
+        return _decode(resp.content)
+
+    async def _get(self, path: str) -> dict | list:
+        return await self._request("GET", path)
+
+    async def _get_page(self, path: str, params: dict) -> tuple[dict | list, str | None]:
+        resp = await self._send("GET", path, params=params)
+        return _decode(resp.content), resp.headers.get(NEXT_CURSOR_HEADER)
+
+    async def _post(self, path: str, json: dict) -> dict:
+        return await self._request("POST", path, json=json)
+
+    async def _patch(self, path: str, json: dict) -> dict:
+        return await self._request("PATCH", path, json=json)
+
+    async def _delete(self, path: str) -> None:
+        await self._send("DELETE", path)
+
+    async def close(self) -> None:
+        if self._owns_transport:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncSozLedgerClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
@@ -0,0 +1,240 @@
+"""In-process trust score cache.
+
+:class:`TrustScoreCache` sits in front of ``client.scores.get`` for callers
+that look up the same entities over and over, such as a router scoring
+candidate agents before every dispatch::
+
+    cache = TrustScoreCache(client, ttl=60, stale_ttl=300)
+    score = cache.get(entity_id)
+
+    # In a webhook receiver:
+    cache.handle_event(event)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.models import TrustScore
+
+if TYPE_CHECKING:
+    from soz_ledger.client import SozLedgerClient
+
+logger = logging.getLogger(__name__)
+
+# Promise outcomes that change the promisor's trust score.
+_PROMISE_SCORE_EVENTS = frozenset(
+    {"promise.fulfilled", "promise.broken", "promise.expired"}
+)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how a :class:`TrustScoreCache` has been used."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    score: TrustScore
+    fetched_at: float
+
+
+class TrustScoreCache:
+    """Size-bounded LRU cache of trust scores with a per-entry TTL.
+
+    An entry is served as-is for ``ttl`` seconds. For the following
+    ``stale_ttl`` seconds it is still served, and a background thread
+    refetches it (stale-while-revalidate). After that it is fetched
+    synchronously. When more than ``max_size`` entities are cached, the
+    least recently used entry is evicted.
+
+    Args:
+        client: The :class:`SozLedgerClient` used to fetch scores.
+        max_size: Maximum number of cached entities.
+        ttl: Seconds an entry is considered fresh.
+        stale_ttl: Extra seconds a stale entry may be served while it is
+            refreshed in the background; ``0`` disables revalidation.
+        clock: Monotonic time source, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        client: SozLedgerClient,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._max_size = max_size
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        # entity_id -> whether it was invalidated while a fetch was in flight
+        self._inflight: dict[str, bool] = {}
+        self.stats = CacheStats()
+
+    def get(self, entity_id: str) -> TrustScore:
+        """Return the score for ``entity_id``, fetching it when needed."""
+        with self._lock:
+            score = self._lookup(entity_id, self._clock())
+            if score is not None:
+                return score
+
+        try:
+            score = self._client.scores.get(entity_id)
+        except BaseException:
+            self._abandon([entity_id])
+            raise
+        self._store(entity_id, score)
+        return score
+
+    def get_many(
+        self, entity_ids: Iterable[str]
+    ) -> dict[str, TrustScore | SozLedgerError]:
+        """Return scores for many entities, fetching all misses in one batch.
+
+        Cached entries are served as in :meth:`get`; the rest go through
+        ``client.scores.get_many``. Per-entity errors are returned in place
+        of a score and are not cached.
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        now = self._clock()
+        results: dict[str, TrustScore | SozLedgerError] = {}
+        misses: list[str] = []
+        with self._lock:
+            for entity_id in ids:
+                score = self._lookup(entity_id, now)
+                if score is None:
+                    misses.append(entity_id)
+                else:
+                    results[entity_id] = score
+
+        if misses:
+            try:
+                fetched = self._client.scores.get_many(misses)
+            except BaseException:
+                self._abandon(misses)
+                raise
+            for entity_id, value in fetched.items():
+                if isinstance(value, TrustScore):
+                    self._store(entity_id, value)
+                else:
+                    self._abandon([entity_id])
+            results.update(fetched)
+        return {entity_id: results[entity_id] for entity_id in ids if entity_id in results}
+
+    def invalidate(self, entity_id: str) -> bool:
+        """Drop ``entity_id`` from the cache. Returns whether it was cached."""
+        with self._lock:
+            if entity_id in self._inflight:
+                self._inflight[entity_id] = True
+            removed = self._entries.pop(entity_id, None) is not None
+            if removed:
+                self.stats.invalidations += 1
+            return removed
+
+    def handle_event(self, event: dict[str, Any]) -> list[str]:
+        """Invalidate the entities whose score a webhook event changes.
+
+        Understands ``score.updated`` and the ``promise.fulfilled`` /
+        ``promise.broken`` / ``promise.expired`` outcomes. Returns the entity
+        IDs that were invalidated.
+        """
+        event_type = event.get("event_type") or event.get("type")
+        data = event.get("data") or {}
+        if event_type == "score.updated":
+            entity_ids = [data.get("entity_id")]
+        elif event_type in _PROMISE_SCORE_EVENTS:
+            entity_ids = [(data.get("promise") or {}).get("promisor_id")]
+        else:
+            return []
+        return [eid for eid in entity_ids if eid and self.invalidate(eid)]
+
+    def clear(self) -> None:
+        with self._lock:
+            for entity_id in self._inflight:
+                self._inflight[entity_id] = True
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._entries
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _lookup(self, entity_id: str, now: float) -> TrustScore | None:
+        """Serve a cached score, or record a miss. Caller holds the lock."""
+        entry = self._entries.get(entity_id)
+        if entry is not None:
+            age = now - entry.fetched_at
+            if age < self._ttl:
+                self._entries.move_to_end(entity_id)
+                self.stats.hits += 1
+                return entry.score
+            if age < self._ttl + self._stale_ttl:
+                self._entries.move_to_end(entity_id)
+                self.stats.stale_hits += 1
+                if entity_id not in self._inflight:
+                    self._inflight[entity_id] = False
+                    threading.Thread(
+                        target=self._revalidate, args=(entity_id,), daemon=True
+                    ).start()
+                return entry.score
+        self.stats.misses += 1
+        self._inflight.setdefault(entity_id, False)
+        return None
+
+    def _abandon(self, entity_ids: list[str]) -> None:
+        with self._lock:
+            for entity_id in entity_ids:
+                self._inflight.pop(entity_id, None)
+
+    def _store(self, entity_id: str, score: TrustScore) -> None:
+        with self._lock:
+            if self._inflight.pop(entity_id, False):
+                return  # invalidated mid-fetch; the result may predate it
+            self._entries[entity_id] = _Entry(score, self._clock())
+            self._entries.move_to_end(entity_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _revalidate(self, entity_id: str) -> None:
+        try:
+            score = self._client.scores.get(entity_id)
+        except Exception as exc:
+            # Any failure must clear the in-flight marker, or the entity
+            # would never be refreshed again.
+            logger.warning("Trust score refresh for %s failed: %s", entity_id, exc)
+            self._abandon([entity_id])
+            with self._lock:
+                self.stats.refresh_errors += 1
+            return
+        self._store(entity_id, score)
+        with self._lock:
+            self.stats.refreshes += 1
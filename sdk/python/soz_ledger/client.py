@@ -1,20 +1,161 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
 import httpx
 
 from soz_ledger.errors import SozLedgerError
+from soz_ledger.instrumentation import Instrumentation
 from soz_ledger.models import (
     DeliveryLog,
     Entity,
     Evidence,
     Promise,
+    RecordedPromise,
     ScoreHistoryEntry,
     ScoreHistoryResponse,
     TrustScore,
     Webhook,
     WebhookWithSecret,
+    _decode,
     _from_dict,
 )
+from soz_ledger.pagination import (
+    NEXT_CURSOR_HEADER,
+    Page,
+    _page_params,
+    paginate,
+)
+from soz_ledger.ratelimit import RateLimiter
+
+
+def _transport_error(exc: httpx.HTTPError) -> SozLedgerError:
+    """Map an httpx transport failure to a status-0 :class:`SozLedgerError`."""
+    if isinstance(exc, httpx.TimeoutException):
+        return SozLedgerError(0, {"error": "timeout", "message": str(exc)})
+    return SozLedgerError(0, {"error": "network_error", "message": str(exc)})
+
+
+def _http_options(
+    limits: httpx.Limits | None,
+    http2: bool,
+    transport: object | None,
+) -> dict:
+    """Optional httpx client arguments, omitting the ones left at defaults."""
+    options: dict = {}
+    if limits is not None:
+        options["limits"] = limits
+    if http2:
+        options["http2"] = True
+    if transport is not None:
+        options["transport"] = transport
+    return options
+
+
+def _raise_for_status(resp: httpx.Response) -> None:
+    """Raise :class:`SozLedgerError` for any non-2xx response."""
+    if resp.is_success:
+        return
+
+    body: dict | None = None
+    try:
+        body = resp.json()
+    except Exception:
+        pass
+    raise SozLedgerError(resp.status_code, body)
+
+
+# Maximum number of items the API accepts in a single batch request.
+_BATCH_SIZE = 100
+
+
+def _chunks(items: Iterable, size: int = _BATCH_SIZE) -> Iterator[list]:
+    chunk: list = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _promise_payload(
+    promisor_id: str,
+    promisee_id: str,
+    description: str,
+    deadline: str | None = None,
+    category: str = "custom",
+) -> dict:
+    data: dict = {
+        "promisor_id": promisor_id,
+        "promisee_id": promisee_id,
+        "description": description,
+        "category": category,
+    }
+    if deadline is not None:
+        data["deadline"] = deadline
+    return data
+
+
+def _record_payload(
+    promisor_id: str,
+    promisee_id: str,
+    description: str,
+    status: str = "fulfilled",
+    evidence: Iterable[dict] | None = None,
+    deadline: str | None = None,
+    category: str = "custom",
+) -> dict:
+    data = _promise_payload(promisor_id, promisee_id, description, deadline, category)
+    data["status"] = status
+    if evidence is not None:
+        data["evidence"] = list(evidence)
+    return data
+
+
+def _parse_recorded(resp: dict) -> RecordedPromise:
+    return RecordedPromise(
+        promise=_from_dict(Promise, resp["promise"]),
+        evidence=[_from_dict(Evidence, e) for e in resp.get("evidence", [])],
+    )
+
+
+def _parse_batch(
+    cls: type, resp: dict, count: int, parse: Callable[[dict], Any] | None = None
+) -> list:
+    """Turn a batch response into one model or :class:`SozLedgerError` per item.
+
+    Results are placed by their ``index`` so the output lines up with the
+    ``count`` submitted items regardless of the order the server reports
+    them in; an item the response leaves out gets a ``missing_result``
+    error. ``parse`` builds models that :func:`_from_dict` cannot, such as
+    ones with nested models.
+    """
+    out: list = [None] * count
+    for item in resp.get("results", []):
+        index = item.get("index")
+        if not isinstance(index, int) or not 0 <= index < count:
+            continue
+        if item.get("error") is not None:
+            value = SozLedgerError(item.get("status", 0), item["error"])
+        elif parse is not None:
+            value = parse(item["data"])
+        else:
+            value = _from_dict(cls, item["data"])
+        out[index] = value
+    for index, value in enumerate(out):
+        if value is None:
+            out[index] = SozLedgerError(
+                0,
+                {
+                    "error": "missing_result",
+                    "message": f"Batch response has no result for item {index}",
+                },
+            )
+    return out
 
 
 class _EntitiesAPI:
@@ -58,18 +199,99 @@ class _PromisesAPI:
         deadline: str | None = None,
         category: str = "custom",
     ) -> Promise:
-        data: dict = {
-            "promisor_id": promisor_id,
-            "promisee_id": promisee_id,
-            "description": description,
-            "category": category,
-        }
-        if deadline is not None:
-            data["deadline"] = deadline
-
+        data = _promise_payload(
+            promisor_id, promisee_id, description, deadline, category
+        )
         resp = self._client._post("/v1/promises", json=data)
         return _from_dict(Promise, resp)
 
+    def record(
+        self,
+        promisor_id: str,
+        promisee_id: str,
+        description: str,
+        status: str = "fulfilled",
+        evidence: Iterable[dict] | None = None,
+        deadline: str | None = None,
+        category: str = "custom",
+    ) -> RecordedPromise:
+        """Create a promise, attach evidence and set its final status at once.
+
+        ``status`` is ``"fulfilled"`` or ``"broken"``; each ``evidence`` item
+        takes the keyword arguments of :meth:`_EvidenceAPI.submit` except
+        ``promise_id``. One request replaces the create, submit and status
+        calls, and nothing is stored if any part is rejected.
+        """
+        data = _record_payload(
+            promisor_id, promisee_id, description, status, evidence, deadline, category
+        )
+        resp = self._client._post("/v1/promises:record", json=data)
+        return _parse_recorded(resp)
+
+    def record_many(
+        self, records: Iterable[dict]
+    ) -> list[RecordedPromise | SozLedgerError]:
+        """Record many completed promises using the batch endpoint.
+
+        Each item takes the same keyword arguments as :meth:`record`. Items
+        are sent in chunks of up to 100; each one is recorded atomically on
+        its own, and the result list holds a :class:`RecordedPromise` or a
+        :class:`SozLedgerError` per item, in input order.
+        """
+        results: list[RecordedPromise | SozLedgerError] = []
+        for chunk in _chunks(_record_payload(**r) for r in records):
+            resp = self._client._post(
+                "/v1/promises:batchRecord", json={"items": chunk}
+            )
+            results.extend(
+                _parse_batch(RecordedPromise, resp, len(chunk), _parse_recorded)
+            )
+        return results
+
+    def create_many(
+        self, promises: Iterable[dict]
+    ) -> list[Promise | SozLedgerError]:
+        """Create many promises using the batch endpoint.
+
+        Each item takes the same keyword arguments as :meth:`create`. Items
+        are sent in chunks of up to 100; the result list is in input order
+        and holds a :class:`Promise` or a :class:`SozLedgerError` per item.
+        """
+        results: list[Promise | SozLedgerError] = []
+        for chunk in _chunks(_promise_payload(**p) for p in promises):
+            resp = self._client._post(
+                "/v1/promises:batchCreate", json={"items": chunk}
+            )
+            results.extend(_parse_batch(Promise, resp, len(chunk)))
+        return results
+
+    def update_status_many(
+        self, updates: Iterable[tuple[str, str]]
+    ) -> list[Promise | SozLedgerError]:
+        """Apply many ``(promise_id, status)`` transitions in batched requests.
+
+        Returns one :class:`Promise` or :class:`SozLedgerError` per update,
+        in input order.
+        """
+        results: list[Promise | SozLedgerError] = []
+        items = ({"promise_id": pid, "status": status} for pid, status in updates)
+        for chunk in _chunks(items):
+            resp = self._client._post(
+                "/v1/promises:batchUpdateStatus", json={"items": chunk}
+            )
+            results.extend(_parse_batch(Promise, resp, len(chunk)))
+        return results
+
+    def fulfill_many(
+        self, promise_ids: Iterable[str]
+    ) -> list[Promise | SozLedgerError]:
+        return self.update_status_many((pid, "fulfilled") for pid in promise_ids)
+
+    def break_many(
+        self, promise_ids: Iterable[str]
+    ) -> list[Promise | SozLedgerError]:
+        return self.update_status_many((pid, "broken") for pid in promise_ids)
+
     def get(self, promise_id: str) -> Promise:
         resp = self._client._get(f"/v1/promises/{promise_id}")
         return _from_dict(Promise, resp)
@@ -117,6 +339,29 @@ class _EvidenceAPI:
         resp = self._client._get(f"/v1/promises/{promise_id}/evidence")
         return [_from_dict(Evidence, e) for e in resp]
 
+    def iter(
+        self,
+        promise_id: str,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Evidence]:
+        """Lazily iterate over a promise's evidence, one page at a time.
+
+        ``since`` (ISO 8601, inclusive) skips evidence created before it and
+        ``limit`` stops after that many items; the next page is prefetched
+        while the current one is consumed.
+        """
+        path = f"/v1/promises/{promise_id}/evidence"
+
+        def fetch(cursor: str | None) -> Page[Evidence]:
+            body, next_cursor = self._client._get_page(
+                path, _page_params(page_size, cursor, since)
+            )
+            return [_from_dict(Evidence, e) for e in body], next_cursor
+
+        return paginate(fetch, limit)
+
 
 class _ScoresAPI:
     def __init__(self, client: SozLedgerClient) -> None:
@@ -126,6 +371,26 @@ class _ScoresAPI:
         resp = self._client._get(f"/v1/scores/{entity_id}")
         return _from_dict(TrustScore, resp)
 
+    def get_many(
+        self, entity_ids: Iterable[str], chunk_size: int = _BATCH_SIZE
+    ) -> dict[str, TrustScore | SozLedgerError]:
+        """Fetch scores for many entities through the batch endpoint.
+
+        Duplicate IDs are requested once and lists longer than
+        ``chunk_size`` are split into sequential requests. Returns a dict in
+        input order mapping every entity ID to its :class:`TrustScore` or to
+        the :class:`SozLedgerError` reported for it (e.g. ``404``, or
+        ``missing_result`` when the response leaves it out).
+        """
+        ids = list(dict.fromkeys(entity_ids))
+        results: dict[str, TrustScore | SozLedgerError] = {}
+        for chunk in _chunks(ids, chunk_size):
+            resp = self._client._post(
+                "/v1/scores:batchGet", json={"entity_ids": chunk}
+            )
+            results.update(zip(chunk, _parse_batch(TrustScore, resp, len(chunk))))
+        return results
+
     def history(self, entity_id: str) -> ScoreHistoryResponse:
         resp = self._client._get(f"/v1/scores/{entity_id}/history")
         entries = [
@@ -133,6 +398,34 @@ class _ScoresAPI:
         ]
         return ScoreHistoryResponse(entity_id=resp["entity_id"], history=entries)
 
+    def iter_history(
+        self,
+        entity_id: str,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[ScoreHistoryEntry]:
+        """Lazily iterate over an entity's score history, newest first.
+
+        Pages with the history endpoint's cursor, unlike :meth:`history`,
+        which keeps its single limit/offset request. ``since`` (ISO 8601,
+        inclusive) skips entries recorded before it and ``limit`` stops
+        after that many entries; ``page_size`` entries are fetched per
+        request.
+        """
+        path = f"/v1/scores/{entity_id}/history"
+
+        def fetch(cursor: str | None) -> Page[ScoreHistoryEntry]:
+            body, next_cursor = self._client._get_page(
+                path, _page_params(page_size, cursor, since)
+            )
+            entries = [
+                _from_dict(ScoreHistoryEntry, h) for h in body.get("history", [])
+            ]
+            return entries, next_cursor
+
+        return paginate(fetch, limit)
+
 
 class _WebhooksAPI:
     def __init__(self, client: SozLedgerClient) -> None:
@@ -151,6 +444,26 @@ class _WebhooksAPI:
         resp = self._client._get("/v1/webhooks")
         return [_from_dict(Webhook, w) for w in resp]
 
+    def iter(
+        self,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[Webhook]:
+        """Lazily iterate over the caller's webhooks, one page at a time.
+
+        ``since`` (ISO 8601, inclusive) skips webhooks created before it and
+        ``limit`` stops after that many; ``page_size`` webhooks are fetched
+        per request.
+        """
+        def fetch(cursor: str | None) -> Page[Webhook]:
+            body, next_cursor = self._client._get_page(
+                "/v1/webhooks", _page_params(page_size, cursor, since)
+            )
+            return [_from_dict(Webhook, w) for w in body], next_cursor
+
+        return paginate(fetch, limit)
+
     def get(self, webhook_id: str) -> Webhook:
         resp = self._client._get(f"/v1/webhooks/{webhook_id}")
         return _from_dict(Webhook, resp)
@@ -179,6 +492,29 @@ class _WebhooksAPI:
         resp = self._client._get(f"/v1/webhooks/{webhook_id}/logs")
         return [_from_dict(DeliveryLog, log) for log in resp]
 
+    def iter_logs(
+        self,
+        webhook_id: str,
+        page_size: int = 100,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[DeliveryLog]:
+        """Lazily iterate over a webhook's delivery logs, one page at a time.
+
+        ``since`` (ISO 8601, inclusive) skips attempts logged before it and
+        ``limit`` stops after that many; ``page_size`` logs are fetched per
+        request.
+        """
+        path = f"/v1/webhooks/{webhook_id}/logs"
+
+        def fetch(cursor: str | None) -> Page[DeliveryLog]:
+            body, next_cursor = self._client._get_page(
+                path, _page_params(page_size, cursor, since)
+            )
+            return [_from_dict(DeliveryLog, log) for log in body], next_cursor
+
+        return paginate(fetch, limit)
+
 
 class SozLedgerClient:
     """Soz Ledger SDK client for the AI Agent Trust Protocol.
@@ -192,20 +528,43 @@ class SozLedgerClient:
 
         with SozLedgerClient("your_api_key") as client:
             agent = client.entities.create(name="my-agent", type="agent")
+
+    Pass a :class:`~soz_ledger.ratelimit.RateLimiter` as ``rate_limiter`` to
+    pace requests against the server's rate limits and retry ``429``
+    responses after ``Retry-After``. Pass an
+    :class:`~soz_ledger.instrumentation.Instrumentation` as
+    ``instrumentation`` to record per-endpoint latency, status, retry and
+    byte metrics for every attempt.
+
+    Connection handling is tuned with ``httpx`` types: ``timeout`` may be an
+    ``httpx.Timeout`` with separate connect/read/write/pool values, ``limits``
+    an ``httpx.Limits`` sizing the pool and its keep-alive expiry, and
+    ``http2=True`` enables HTTP/2 (requires the ``http2`` extra). A
+    ``transport`` shared between clients lets them reuse one connection
+    pool; such a transport is left open by :meth:`close`.
     """
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "http://localhost:8000",
-        timeout: float = 30.0,
+        timeout: float | httpx.Timeout = 30.0,
+        rate_limiter: RateLimiter | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        instrumentation: Instrumentation | None = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
+        self._rate_limiter = rate_limiter
+        self._instrumentation = instrumentation
+        self._owns_transport = transport is None
         self._http = httpx.Client(
             base_url=self._base_url,
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=timeout,
+            **_http_options(limits, http2, transport),
         )
 
         self.entities = _EntitiesAPI(self)
@@ -216,27 +575,53 @@ class SozLedgerClient:
 
     # ── Internal HTTP helpers ────────────────────────────────────────────
 
-    def _request(self, method: str, path: str, **kwargs) -> dict | list:
-        try:
-            resp = self._http.request(method, path, **kwargs)
-        except httpx.TimeoutException as exc:
-            raise SozLedgerError(0, {"error": "timeout", "message": str(exc)}) from exc
-        except httpx.HTTPError as exc:
-            raise SozLedgerError(0, {"error": "network_error", "message": str(exc)}) from exc
-
-        if not resp.is_success:
-            body: dict | None = None
+    def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        limiter = self._rate_limiter
+        instr = self._instrumentation
+        attempt = 0
+        while True:
+            if limiter is not None:
+                delay = limiter.acquire(self._api_key, method, path, kwargs.get("json"))
+                if delay > 0:
+                    time.sleep(delay)
+
+            event = instr.start(method, path, attempt) if instr is not None else None
             try:
-                body = resp.json()
-            except Exception:
-                pass
-            raise SozLedgerError(resp.status_code, body)
+                resp = self._http.request(method, path, **kwargs)
+            except httpx.HTTPError as exc:
+                if event is not None:
+                    instr.finish(event, error=exc)
+                raise _transport_error(exc) from exc
+            if event is not None:
+                instr.finish(event, resp)
+
+            if limiter is not None:
+                retry_in = limiter.observe(
+                    self._api_key,
+                    method,
+                    path,
+                    kwargs.get("json"),
+                    resp.status_code,
+                    resp.headers,
+                    attempt,
+                )
+                if retry_in is not None:
+                    attempt += 1
+                    continue
+
+            _raise_for_status(resp)
+            return resp
 
-        return resp.json()
+    def _request(self, method: str, path: str, **kwargs) -> dict | list:
+        return _decode(self._send(method, path, **kwargs).content)
 
     def _get(self, path: str) -> dict | list:
         return self._request("GET", path)
 
+    def _get_page(self, path: str, params: dict) -> tuple[dict | list, str | None]:
+        resp = self._send("GET", path, params=params)
+        return _decode(resp.content), resp.headers.get(NEXT_CURSOR_HEADER)
+
     def _post(self, path: str, json: dict) -> dict:
         return self._request("POST", path, json=json)
 
@@ -244,23 +629,13 @@ class SozLedgerClient:
         return self._request("PATCH", path, json=json)
 
     def _delete(self, path: str) -> None:
-        try:
-            resp = self._http.request("DELETE", path)
-        except httpx.TimeoutException as exc:
-            raise SozLedgerError(0, {"error": "timeout", "message": str(exc)}) from exc
-        except httpx.HTTPError as exc:
-            raise SozLedgerError(0, {"error": "network_error", "message": str(exc)}) from exc
-
-        if not resp.is_success:
-            body: dict | None = None
-            try:
-                body = resp.json()
-            except Exception:
-                pass
-            raise SozLedgerError(resp.status_code, body)
+        self._send("DELETE", path)
 
     def close(self) -> None:
-        self._http.close()
+        # Closing httpx.Client closes its transport, which a shared transport
+        # must outlive.
+        if self._owns_transport:
+            self._http.close()
 
     def __enter__(self) -> SozLedgerClient:
         return self
@@ -0,0 +1,161 @@
+"""Delivery-ID dedupe stores for webhook receivers.
+
+The ledger retries a webhook delivery that was not acknowledged after 1m,
+5m, 30m, 2h and 12h, and every attempt carries the same
+``X-SozLedger-Delivery-Id`` (see ``docs/webhooks.md``). A dedupe store
+remembers the delivery IDs a receiver has already accepted so retries are
+acknowledged without running the handlers again::
+
+    receiver = WebhookReceiver(secret, dedupe=MemoryDedupeStore())
+
+    # Several worker processes behind one load balancer:
+    receiver = WebhookReceiver(secret, dedupe=SQLiteDedupeStore("deliveries.sqlite3"))
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Protocol
+
+DELIVERY_ID_HEADER = "X-SozLedger-Delivery-Id"
+
+# Longer than the whole retry schedule (about 14.6 hours).
+DEFAULT_WINDOW = 86_400.0
+
+
+class DedupeStore(Protocol):
+    def add(self, delivery_id: str) -> bool:
+        """Remember ``delivery_id``; return ``False`` if it was already seen."""
+        ...
+
+    def discard(self, delivery_id: str) -> None:
+        """Forget ``delivery_id`` so a later retry is accepted again."""
+        ...
+
+
+class MemoryDedupeStore:
+    """Delivery IDs seen by this process, bounded in count and age.
+
+    Args:
+        max_entries: Maximum number of IDs remembered; adding another
+            forgets the oldest.
+        window: Seconds an ID is remembered for.
+        clock: Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        window: float = DEFAULT_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._window = window
+        self._clock = clock
+        # Insertion order is first-seen order, so the oldest ID is always first.
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, delivery_id: str) -> bool:
+        now = self._clock()
+        with self._lock:
+            cutoff = now - self._window
+            while self._seen and next(iter(self._seen.values())) <= cutoff:
+                self._seen.popitem(last=False)
+            if delivery_id in self._seen:
+                return False
+            self._seen[delivery_id] = now
+            if len(self._seen) > self._max_entries:
+                self._seen.popitem(last=False)
+            return True
+
+    def discard(self, delivery_id: str) -> None:
+        with self._lock:
+            self._seen.pop(delivery_id, None)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, delivery_id: object) -> bool:
+        return delivery_id in self._seen
+
+
+class SQLiteDedupeStore:
+    """Delivery IDs kept in a SQLite database shared by several processes.
+
+    Each check is a single upsert on the primary key, so a retry is
+    recognised by whichever process receives it. Rows older than
+    ``window`` are purged every ``purge_every`` additions.
+
+    Args:
+        path: Database file; use the same path in every worker process.
+        window: Seconds an ID is remembered for.
+        purge_every: Number of additions between purges of expired rows.
+        clock: Wall-clock time source, in seconds; it must agree across
+            processes.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        window: float = DEFAULT_WINDOW,
+        purge_every: int = 1_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._window = window
+        self._purge_every = purge_every
+        self._clock = clock
+        self._added = 0
+        self._conn = sqlite3.connect(
+            path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS deliveries ("
+                " id TEXT PRIMARY KEY,"
+                " seen_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS deliveries_seen_at ON deliveries (seen_at)"
+            )
+
+    def add(self, delivery_id: str) -> bool:
+        now = self._clock()
+        cutoff = now - self._window
+        with self._lock:
+            # Inserts a new ID or refreshes one that has aged out of the
+            # window; a row is only changed if the ID counts as unseen.
+            changed = self._conn.execute(
+                "INSERT INTO deliveries (id, seen_at) VALUES (?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET seen_at = excluded.seen_at"
+                " WHERE deliveries.seen_at <= ?",
+                (delivery_id, now, cutoff),
+            ).rowcount
+            if changed:
+                self._added += 1
+                if self._added % self._purge_every == 0:
+                    self._conn.execute(
+                        "DELETE FROM deliveries WHERE seen_at <= ?", (cutoff,)
+                    )
+        return bool(changed)
+
+    def discard(self, delivery_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM deliveries WHERE id = ?", (delivery_id,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM deliveries").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,233 @@
+"""Columnar export of ledger data to Arrow and Parquet.
+
+Promises, evidence and score history are converted to Arrow record batches
+of ``batch_size`` rows, with timestamp columns, dictionary-encoded statuses,
+categories and levels, and JSON text for evidence payloads. Items are read
+lazily, so exporting from the SDK's paginated iterators runs in constant
+memory::
+
+    from soz_ledger import export
+
+    export.write_parquet(Evidence, client.evidence.iter(promise.id), "evidence.parquet")
+
+    with export.ParquetExporter("history.parquet", ScoreHistoryEntry) as out:
+        for entity_id in entity_ids:
+            out.write(client.scores.iter_history(entity_id), entity_id=entity_id)
+
+Requires ``pyarrow`` (the ``arrow`` extra).
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from soz_ledger.models import Evidence, Promise, ScoreHistoryEntry
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None
+    pc = None
+    pq = None
+
+DEFAULT_BATCH_SIZE = 65_536
+
+Model = type[Promise] | type[Evidence] | type[ScoreHistoryEntry]
+
+# Matches timestamps that carry a zone; the rest are taken to be UTC, as
+# elsewhere in the SDK.
+_ZONED = r"(Z|[+-]\d\d:?\d\d)$"
+
+# Column name -> kind, per exported model. Kinds map to Arrow types in
+# _arrow_type; "json" columns hold JSON text.
+_COLUMNS: dict[type, dict[str, str]] = {
+    Promise: {
+        "id": "string",
+        "promisor_id": "string",
+        "promisee_id": "string",
+        "description": "string",
+        "category": "enum",
+        "status": "enum",
+        "deadline": "timestamp",
+        "created_at": "timestamp",
+        "fulfilled_at": "timestamp",
+    },
+    Evidence: {
+        "id": "string",
+        "promise_id": "string",
+        "type": "enum",
+        "submitted_by": "string",
+        "verified": "bool",
+        "payload": "json",
+        "created_at": "timestamp",
+    },
+    ScoreHistoryEntry: {
+        "entity_id": "string",
+        "timestamp": "timestamp",
+        "score": "float",
+        "level": "enum",
+        "version": "enum",
+    },
+}
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("soz_ledger.export requires pyarrow: pip install 'soz-ledger[arrow]'")
+
+
+def _arrow_type(kind: str) -> Any:
+    return {
+        "string": pa.string(),
+        "json": pa.string(),
+        "enum": pa.dictionary(pa.int32(), pa.string()),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "bool": pa.bool_(),
+        "float": pa.float64(),
+    }[kind]
+
+
+def schema(model: Model) -> pa.Schema:
+    """The Arrow schema used for ``model`` (``Promise``, ``Evidence`` or
+    ``ScoreHistoryEntry``)."""
+    _require_pyarrow()
+    try:
+        columns = _COLUMNS[model]
+    except KeyError:
+        raise TypeError(f"cannot export {model!r}") from None
+    return pa.schema([(name, _arrow_type(kind)) for name, kind in columns.items()])
+
+
+def record_batches(
+    model: Model,
+    items: Iterable[Any],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    entity_id: str | None = None,
+) -> Iterator[pa.RecordBatch]:
+    """Convert ``items`` to record batches of at most ``batch_size`` rows.
+
+    Items are ``model`` instances or dicts with the same keys; only one
+    batch is held in memory at a time. Score history entries carry no
+    entity, so pass ``entity_id`` (or an ``"entity_id"`` key in dict items)
+    to fill that column.
+    """
+    target = schema(model)
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    columns = _COLUMNS[model]
+    items = iter(items)
+    while chunk := list(itertools.islice(items, batch_size)):
+        arrays = []
+        for name, kind in columns.items():
+            if name == "entity_id" and entity_id is not None:
+                values = [entity_id] * len(chunk)
+            else:
+                values = [_value(item, name) for item in chunk]
+            if kind == "json":
+                values = [None if v is None else json.dumps(v) for v in values]
+            # Parsed and encoded by Arrow rather than per value in Python.
+            if kind == "timestamp":
+                arrays.append(_timestamps(pa.array(values, pa.string())))
+            elif kind == "enum":
+                arrays.append(pa.array(values, pa.string()).cast(_arrow_type(kind)))
+            else:
+                arrays.append(pa.array(values, _arrow_type(kind)))
+        yield pa.RecordBatch.from_arrays(arrays, schema=target)
+
+
+def _value(item: Any, name: str) -> Any:
+    if isinstance(item, dict):
+        return item.get(name)
+    # Model instances have no entity_id.
+    return getattr(item, name, None)
+
+
+def _timestamps(values: pa.Array) -> pa.Array:
+    """Parse ISO 8601 strings as UTC timestamps, reading naive ones as UTC."""
+    zoned = pc.match_substring_regex(values, _ZONED)
+    values = pc.if_else(zoned, values, pc.binary_join_element_wise(values, "Z", ""))
+    return values.cast(_arrow_type("timestamp"))
+
+
+class ParquetExporter:
+    """Streams one model's records into a Parquet file.
+
+    Each :meth:`write` call converts and writes its items batch by batch,
+    so a file can collect records from many iterators (e.g. the score
+    history of every entity) without holding them in memory.
+
+    Args:
+        path: Destination file.
+        model: ``Promise``, ``Evidence`` or ``ScoreHistoryEntry``.
+        batch_size: Rows per record batch and Parquet row group.
+        compression: Parquet codec, e.g. ``"zstd"``, ``"snappy"`` or ``"none"``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        model: Model,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        compression: str = "zstd",
+    ) -> None:
+        self._model = model
+        self._batch_size = batch_size
+        target = schema(model)
+        self._writer = pq.ParquetWriter(path, target, compression=compression)
+        self.rows = 0
+
+    def write(self, items: Iterable[Any], entity_id: str | None = None) -> int:
+        """Append ``items``; returns the number of rows written."""
+        written = 0
+        for batch in record_batches(self._model, items, self._batch_size, entity_id):
+            self._writer.write_batch(batch, row_group_size=self._batch_size)
+            written += batch.num_rows
+        self.rows += written
+        return written
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> ParquetExporter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def write_parquet(
+    model: Model,
+    items: Iterable[Any],
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = "zstd",
+    entity_id: str | None = None,
+) -> int:
+    """Write ``items`` to a Parquet file; returns the number of rows."""
+    with ParquetExporter(path, model, batch_size, compression) as out:
+        return out.write(items, entity_id)
+
+
+def write_arrow(
+    model: Model,
+    items: Iterable[Any],
+    path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    entity_id: str | None = None,
+) -> int:
+    """Write ``items`` as an Arrow IPC stream; returns the number of rows.
+
+    Read it back with ``pyarrow.ipc.open_stream``.
+    """
+    target = schema(model)
+    rows = 0
+    with pa.ipc.new_stream(path, target) as writer:
+        for batch in record_batches(model, items, batch_size, entity_id):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
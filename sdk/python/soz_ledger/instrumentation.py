@@ -0,0 +1,259 @@
+"""Per-endpoint request metrics and hooks for the SDK clients.
+
+An :class:`Instrumentation` passed to a client sees every HTTP attempt,
+including rate-limit retries. It keeps latency histograms, status-code
+counters, retry counts and byte totals per ``(method, route)``, where the
+route is the path with its resource ID replaced by ``{id}``::
+
+    instrumentation = Instrumentation()
+    client = SozLedgerClient("your_api_key", instrumentation=instrumentation)
+    ...
+    print(instrumentation.render_prometheus())
+
+Callbacks registered with :meth:`Instrumentation.on_request` and
+:meth:`Instrumentation.on_response` receive a :class:`RequestEvent`. When an
+OpenTelemetry tracer is given, each attempt is also exported as a client
+span.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, from 5ms to 10s.
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+RequestHook = Callable[["RequestEvent"], None]
+
+
+def _route(path: str) -> str:
+    """Collapse the resource ID in ``/v1/<resource>/<id>/...`` to ``{id}``."""
+    parts = path.split("/")
+    if len(parts) > 3 and parts[3]:
+        parts[3] = "{id}"
+    return "/".join(parts)
+
+
+def _request_size(resp: httpx.Response) -> int:
+    try:
+        return len(resp.request.content)
+    except RuntimeError:  # response built without a request
+        return 0
+
+
+@dataclass
+class RequestEvent:
+    """One HTTP attempt, as passed to request and response hooks.
+
+    ``status_code``, ``elapsed`` and the byte counts are filled in once the
+    attempt completes; ``error`` is set instead of ``status_code`` when the
+    request failed at the transport level.
+    """
+
+    method: str
+    path: str
+    route: str
+    attempt: int
+    started: float
+    elapsed: float | None = None
+    status_code: int | None = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    error: BaseException | None = None
+    span: Any = None
+
+
+@dataclass
+class LatencyHistogram:
+    """Cumulative-style latency histogram with fixed bucket bounds."""
+
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            # One slot per bound plus the +Inf overflow bucket.
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by interpolating within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i else 0.0
+                if i == len(self.buckets):
+                    return lower  # overflow bucket has no upper bound
+                return lower + (self.buckets[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+class Instrumentation:
+    """Collects per-endpoint metrics and runs request hooks.
+
+    Args:
+        buckets: Latency histogram bucket bounds in seconds.
+        tracer: Optional OpenTelemetry ``Tracer``; each attempt becomes a
+            client span named ``"<METHOD> <route>"``.
+        clock: Monotonic time source, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        tracer: Any = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._tracer = tracer
+        self._span_kind = None
+        if tracer is not None:
+            from opentelemetry.trace import SpanKind
+
+            self._span_kind = SpanKind.CLIENT
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._before: list[RequestHook] = []
+        self._after: list[RequestHook] = []
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self.status_counts: dict[tuple[str, str, str], int] = defaultdict(int)
+        self.retries: dict[tuple[str, str], int] = defaultdict(int)
+        self.bytes_sent: dict[tuple[str, str], int] = defaultdict(int)
+        self.bytes_received: dict[tuple[str, str], int] = defaultdict(int)
+
+    def on_request(self, hook: RequestHook) -> RequestHook:
+        """Register ``hook`` to run before each attempt. Usable as a decorator."""
+        self._before.append(hook)
+        return hook
+
+    def on_response(self, hook: RequestHook) -> RequestHook:
+        """Register ``hook`` to run after each attempt, failed or not."""
+        self._after.append(hook)
+        return hook
+
+    # ── Called by the clients ────────────────────────────────────────────
+
+    def start(self, method: str, path: str, attempt: int = 0) -> RequestEvent:
+        route = _route(path)
+        event = RequestEvent(method, path, route, attempt, self._clock())
+        if self._tracer is not None:
+            event.span = self._tracer.start_span(
+                f"{method} {route}",
+                kind=self._span_kind,
+                attributes={
+                    "http.request.method": method,
+                    "http.route": route,
+                    "url.path": path,
+                    "http.request.resend_count": attempt,
+                },
+            )
+        self._run_hooks(self._before, event)
+        return event
+
+    def finish(
+        self,
+        event: RequestEvent,
+        resp: httpx.Response | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        event.elapsed = self._clock() - event.started
+        event.error = error
+        if resp is not None:
+            event.status_code = resp.status_code
+            event.bytes_sent = _request_size(resp)
+            event.bytes_received = len(resp.content)
+
+        key = (event.method, event.route)
+        status = str(event.status_code) if event.status_code is not None else "error"
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram(self._buckets)
+            histogram.observe(event.elapsed)
+            self.status_counts[(event.method, event.route, status)] += 1
+            if event.attempt:
+                self.retries[key] += 1
+            self.bytes_sent[key] += event.bytes_sent
+            self.bytes_received[key] += event.bytes_received
+
+        if event.span is not None:
+            if event.status_code is not None:
+                event.span.set_attribute("http.response.status_code", event.status_code)
+            if error is not None:
+                event.span.record_exception(error)
+            event.span.end()
+        self._run_hooks(self._after, event)
+
+    # ── Export ───────────────────────────────────────────────────────────
+
+    def render_prometheus(self, prefix: str = "soz_ledger") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            name = f"{prefix}_request_duration_seconds"
+            lines += [
+                f"# HELP {name} Latency of ledger API requests.",
+                f"# TYPE {name} histogram",
+            ]
+            for (method, route), hist in sorted(self.histograms.items()):
+                labels = f'method="{method}",route="{route}"'
+                cumulative = 0
+                for bound, n in zip(self._buckets, hist.counts):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {hist.count}')
+                lines.append(f"{name}_sum{{{labels}}} {hist.sum}")
+                lines.append(f"{name}_count{{{labels}}} {hist.count}")
+
+            name = f"{prefix}_responses_total"
+            lines += [
+                f"# HELP {name} Ledger API responses by status code.",
+                f"# TYPE {name} counter",
+            ]
+            for (method, route, status), n in sorted(self.status_counts.items()):
+                lines.append(
+                    f'{name}{{method="{method}",route="{route}",status="{status}"}} {n}'
+                )
+
+            for metric, help_text, values in (
+                ("retries_total", "Retried ledger API requests.", self.retries),
+                ("request_bytes_total", "Request body bytes sent.", self.bytes_sent),
+                ("response_bytes_total", "Response body bytes received.", self.bytes_received),
+            ):
+                name = f"{prefix}_{metric}"
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+                for (method, route), n in sorted(values.items()):
+                    lines.append(f'{name}{{method="{method}",route="{route}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _run_hooks(self, hooks: list[RequestHook], event: RequestEvent) -> None:
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
@@ -0,0 +1,26 @@
+"""A local stand-in for the Soz Ledger API.
+
+:class:`LocalLedger` implements the HTTP API in-process for load tests,
+benchmarks and offline runs::
+
+    from soz_ledger.local import LocalLedger, SQLiteStore
+
+    ledger = LocalLedger(store=SQLiteStore("ledger.sqlite3"))
+    client = ledger.client()
+
+It can also be served over HTTP with :func:`serve` or
+``python -m soz_ledger.local``.
+"""
+
+from soz_ledger.local.ledger import LocalLedger, LocalLimits
+from soz_ledger.local.server import make_server, serve
+from soz_ledger.local.store import MemoryStore, SQLiteStore
+
+__all__ = [
+    "LocalLedger",
+    "LocalLimits",
+    "MemoryStore",
+    "SQLiteStore",
+    "make_server",
+    "serve",
+]
@@ -0,0 +1,36 @@
+"""Run a local ledger server: ``python -m soz_ledger.local --port 8000``."""
+
+from __future__ import annotations
+
+import argparse
+
+from soz_ledger.local import LocalLedger, LocalLimits, MemoryStore, SQLiteStore, serve
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a local Soz Ledger API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--db", help="SQLite file to persist to (default: in memory)")
+    parser.add_argument("--requests-per-minute", type=int, help="per-key request limit")
+    parser.add_argument("--daily-promises", type=int, help="per-promisor daily limit")
+    parser.add_argument("--pair-promises", type=int, help="per-pair hourly limit")
+    args = parser.parse_args(argv)
+
+    ledger = LocalLedger(
+        store=SQLiteStore(args.db) if args.db else MemoryStore(),
+        limits=LocalLimits(
+            requests_per_window=args.requests_per_minute,
+            daily_promises=args.daily_promises,
+            pair_promises=args.pair_promises,
+        ),
+    )
+    print(f"Soz Ledger (local) listening on http://{args.host}:{args.port}")
+    try:
+        serve(ledger, args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,887 @@
+"""In-process implementation of the ledger API.
+
+:class:`LocalLedger` answers ``httpx`` requests directly, so an SDK client
+pointed at it through :meth:`LocalLedger.transport` runs without a network.
+It follows ``protocol/openapi.yaml`` and the promise state machine from
+``docs/protocol-spec.md``; the trust score is a plain fulfillment ratio
+rather than the production scoring model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import secrets
+import threading
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+
+from soz_ledger.local.store import MemoryStore, Store
+from soz_ledger.pagination import NEXT_CURSOR_HEADER
+from soz_ledger.scoring import MIN_RATED_PROMISES, OUTCOMES, trust_level
+from soz_ledger.signing import SIGNATURE_HEADER, sign
+
+ENTITY_TYPES = frozenset({"agent", "human", "org"})
+CATEGORIES = frozenset({"delivery", "payment", "response", "uptime", "custom"})
+EVIDENCE_TYPES = frozenset({"api_callback", "webhook", "manual", "file", "link"})
+EVENT_TYPES = frozenset(
+    {
+        "promise.created",
+        "promise.fulfilled",
+        "promise.broken",
+        "promise.expired",
+        "score.updated",
+        "evidence.submitted",
+    }
+)
+
+# Valid transitions from docs/protocol-spec.md. ``expired`` is only ever
+# set by the ledger itself once a deadline passes.
+TRANSITIONS = {
+    "active": frozenset({"fulfilled", "broken", "disputed"}),
+    "disputed": frozenset({"fulfilled", "broken"}),
+}
+
+MAX_BATCH = 100
+MAX_PAGE = 200
+
+Deliver = Callable[[str, bytes, dict[str, str]], int]
+
+
+@dataclass
+class LocalLimits:
+    """Rate limits enforced by :class:`LocalLedger`; ``None`` disables one.
+
+    Attributes:
+        requests_per_window: Requests allowed per API key per ``window``.
+            When set, every authenticated response carries the
+            ``X-RateLimit-*`` headers from ``docs/rate-limits.md``.
+        window: Length of the per-key window in seconds.
+        daily_promises: Promises a promisor may create per UTC day.
+        pair_promises: Promises allowed between one promisor/promisee pair
+            per ``pair_window`` seconds.
+        pair_window: Length of the per-pair window in seconds.
+        min_deadline: Minimum seconds between creation and deadline.
+    """
+
+    requests_per_window: int | None = None
+    window: float = 60.0
+    daily_promises: int | None = None
+    pair_promises: int | None = None
+    pair_window: float = 3600.0
+    min_deadline: float = 0.0
+
+
+class _ApiError(Exception):
+    def __init__(
+        self,
+        status: int,
+        code: str,
+        message: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.body = {"error": code, "message": message}
+        self.headers = headers or {}
+
+
+def _bad_request(message: str) -> _ApiError:
+    return _ApiError(400, "bad_request", message)
+
+
+def _invalid(message: str) -> _ApiError:
+    return _ApiError(422, "validation_error", message)
+
+
+def _not_found(what: str) -> _ApiError:
+    return _ApiError(404, "not_found", f"{what} not found")
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def _parse_time(value: Any, field: str) -> datetime:
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise _invalid(f"{field} must be an ISO 8601 timestamp") from None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def _key_id(api_key: str) -> str:
+    """Stable identifier for an API key, so raw keys are never stored."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:32]
+
+
+@dataclass
+class _Call:
+    method: str
+    key: str | None
+    params: httpx.QueryParams
+    content: bytes
+    now: datetime
+    headers: dict[str, str]
+
+    def json(self) -> Any:
+        try:
+            return json.loads(self.content or b"null")
+        except ValueError:
+            raise _bad_request("Request body is not valid JSON") from None
+
+    def body(self) -> dict:
+        body = self.json()
+        if not isinstance(body, dict):
+            raise _bad_request("Request body must be a JSON object")
+        return body
+
+
+class LocalLedger:
+    """A ledger server that lives in the calling process.
+
+    Usage::
+
+        ledger = LocalLedger()
+        client = ledger.client()
+        agent = client.entities.create(name="bot", type="agent")
+
+    Any bearer token is accepted. Keys returned by entity creation identify
+    their entity, so webhooks registered with them are scoped to it;
+    webhooks registered with other keys receive every event.
+
+    Args:
+        store: Where records live; a :class:`MemoryStore` by default, or a
+            :class:`~soz_ledger.local.store.SQLiteStore` to persist them.
+        limits: Rate limits to enforce; none by default.
+        deliver: Called as ``deliver(url, body, headers)`` for each webhook
+            delivery and returns the receiver's status code. Without it no
+            deliveries are attempted.
+        clock: Returns the current UTC time, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        store: Store | None = None,
+        limits: LocalLimits | None = None,
+        deliver: Deliver | None = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        self.store = store if store is not None else MemoryStore()
+        self.limits = limits or LocalLimits()
+        self._deliver = deliver
+        self._clock = clock
+        self._lock = threading.RLock()
+        # Webhook deliveries queued under the lock and sent once it is released.
+        self._outbox: list[tuple[dict, bytes, dict, dict]] = []
+        self._key_windows: dict[str, tuple[float, int]] = {}
+        self._daily: dict[tuple[str, str], int] = defaultdict(int)
+        self._pairs: dict[tuple[str, str], deque[float]] = defaultdict(deque)
+        self._routes = [
+            (re.compile(pattern), method, getattr(self, handler))
+            for pattern, method, handler in _ROUTES
+        ]
+
+    # ── Wiring ───────────────────────────────────────────────────────────
+
+    def transport(self) -> httpx.MockTransport:
+        """An ``httpx`` transport serving requests from this ledger.
+
+        Works for both ``httpx.Client`` and ``httpx.AsyncClient``.
+        """
+        return httpx.MockTransport(self.handle)
+
+    def client(self, api_key: str = "local", **kwargs: Any):
+        """A :class:`~soz_ledger.SozLedgerClient` wired to this ledger."""
+        from soz_ledger.client import SozLedgerClient
+
+        return SozLedgerClient(api_key, transport=self.transport(), **kwargs)
+
+    def async_client(self, api_key: str = "local", **kwargs: Any):
+        """An :class:`~soz_ledger.AsyncSozLedgerClient` wired to this ledger."""
+        from soz_ledger.async_client import AsyncSozLedgerClient
+
+        return AsyncSozLedgerClient(api_key, transport=self.transport(), **kwargs)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Serve one request."""
+        auth = request.headers.get("Authorization", "")
+        call = _Call(
+            method=request.method,
+            key=auth[7:] if auth.startswith("Bearer ") and auth[7:] else None,
+            params=request.url.params,
+            content=request.read(),
+            now=self._clock(),
+            headers={},
+        )
+        with self._lock:
+            try:
+                status, body = self._dispatch(request.url.path, call)
+            except _ApiError as exc:
+                status, body = exc.status, exc.body
+                call.headers.update(exc.headers)
+            finally:
+                outbox, self._outbox = self._outbox, []
+        # Outside the lock, so a slow or re-entrant receiver cannot stall
+        # or deadlock other requests.
+        self._send(outbox)
+        if status == 204:
+            return httpx.Response(204, headers=call.headers)
+        return httpx.Response(status, json=body, headers=call.headers)
+
+    def _dispatch(self, path: str, call: _Call) -> tuple[int, Any]:
+        path_matched = False
+        for pattern, method, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            path_matched = True
+            if method != call.method:
+                continue
+            if path.startswith("/v1/"):
+                self._check_key_limit(call)
+            return handler(call, **match.groupdict())
+        if path_matched:
+            raise _ApiError(405, "method_not_allowed", f"{call.method} not allowed")
+        raise _not_found("Route")
+
+    # ── Rate limits ──────────────────────────────────────────────────────
+
+    def _check_key_limit(self, call: _Call) -> None:
+        limit = self.limits.requests_per_window
+        if limit is None or call.key is None:
+            return
+        now = call.now.timestamp()
+        start = math.floor(now / self.limits.window) * self.limits.window
+        window_start, used = self._key_windows.get(call.key, (start, 0))
+        if window_start != start:
+            used = 0
+        reset = start + self.limits.window
+        if used >= limit:
+            call.headers.update(self._limit_headers(limit, 0, reset))
+            raise self._rate_limited(reset - now, "Request rate limit exceeded.")
+        self._key_windows[call.key] = (start, used + 1)
+        call.headers.update(self._limit_headers(limit, limit - used - 1, reset))
+
+    @staticmethod
+    def _limit_headers(limit: int, remaining: int, reset: float) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(math.ceil(reset)),
+        }
+
+    @staticmethod
+    def _rate_limited(retry_after: float, message: str) -> _ApiError:
+        return _ApiError(
+            429,
+            "rate_limited",
+            message,
+            {"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    def _check_promise_limits(self, promisor_id: str, promisee_id: str, now: datetime) -> None:
+        limits = self.limits
+        day = (promisor_id, now.date().isoformat())
+        if limits.daily_promises is not None and self._daily[day] >= limits.daily_promises:
+            midnight = datetime.combine(
+                now.date() + timedelta(days=1), datetime.min.time(), timezone.utc
+            )
+            raise self._rate_limited(
+                (midnight - now).total_seconds(),
+                "Promise creation rate limit exceeded. Please try again later.",
+            )
+        if limits.pair_promises is not None:
+            pair = self._pairs[(promisor_id, promisee_id)]
+            cutoff = now.timestamp() - limits.pair_window
+            while pair and pair[0] <= cutoff:
+                pair.popleft()
+            if len(pair) >= limits.pair_promises:
+                raise self._rate_limited(
+                    pair[0] - cutoff,
+                    "Promise creation rate limit exceeded for this entity pair.",
+                )
+            pair.append(now.timestamp())
+        self._daily[day] += 1
+
+    # ── Health ───────────────────────────────────────────────────────────
+
+    def _root(self, call: _Call) -> tuple[int, Any]:
+        return 200, {"name": "Soz Ledger (local)", "version": "v1"}
+
+    def _health(self, call: _Call) -> tuple[int, Any]:
+        return 200, {"status": "ok"}
+
+    # ── Entities ─────────────────────────────────────────────────────────
+
+    def _create_entity(self, call: _Call) -> tuple[int, Any]:
+        body = call.body()
+        name, entity_type = body.get("name"), body.get("type")
+        if not isinstance(name, str) or not 1 <= len(name) <= 256:
+            raise _invalid("name must be 1-256 characters")
+        if entity_type not in ENTITY_TYPES:
+            raise _invalid(f"type must be one of: {', '.join(sorted(ENTITY_TYPES))}")
+        entity = {
+            "id": str(uuid.uuid4()),
+            "name": name,
+            "type": entity_type,
+            "public_key": body.get("public_key"),
+            "metadata": body.get("metadata"),
+            "created_at": _iso(call.now),
+        }
+        self.store.put("entities", entity)
+        api_key = f"sozl_{secrets.token_hex(16)}"
+        self.store.put("keys", {"id": _key_id(api_key), "entity_id": entity["id"]})
+        return 201, {**entity, "api_key": api_key}
+
+    def _entity(self, entity_id: str) -> dict:
+        entity = self.store.get("entities", entity_id)
+        if entity is None:
+            raise _not_found("Entity")
+        return entity
+
+    def _get_entity(self, call: _Call, entity_id: str) -> tuple[int, Any]:
+        return 200, self._entity(entity_id)
+
+    # ── Promises ─────────────────────────────────────────────────────────
+
+    def _require_key(self, call: _Call) -> str:
+        if call.key is None:
+            raise _ApiError(401, "unauthorized", "Missing or invalid API key")
+        return call.key
+
+    def _create_promise(self, call: _Call) -> tuple[int, Any]:
+        self._require_key(call)
+        return 201, self._new_promise(call.body(), call.now)
+
+    def _new_promise(self, body: Any, now: datetime) -> dict:
+        if not isinstance(body, dict):
+            raise _bad_request("Promise must be a JSON object")
+        promisor_id, promisee_id = body.get("promisor_id"), body.get("promisee_id")
+        description = body.get("description")
+        category = body.get("category", "custom")
+        if not promisor_id or not promisee_id or description is None:
+            raise _bad_request("promisor_id, promisee_id and description are required")
+        if not isinstance(description, str) or not 1 <= len(description) <= 1024:
+            raise _invalid("description must be 1-1024 characters")
+        if category not in CATEGORIES:
+            raise _invalid(f"category must be one of: {', '.join(sorted(CATEGORIES))}")
+        if promisor_id == promisee_id:
+            raise _invalid("An entity cannot make a promise to itself")
+        for field, entity_id in (("promisor_id", promisor_id), ("promisee_id", promisee_id)):
+            if self.store.get("entities", entity_id) is None:
+                raise _invalid(f"{field} does not refer to an existing entity")
+        deadline = body.get("deadline")
+        if deadline is not None:
+            due = _parse_time(deadline, "deadline")
+            if (due - now).total_seconds() < max(self.limits.min_deadline, 1):
+                raise _invalid("Deadline must be sufficiently in the future")
+            deadline = _iso(due)
+        self._check_promise_limits(promisor_id, promisee_id, now)
+
+        promise = {
+            "id": str(uuid.uuid4()),
+            "promisor_id": promisor_id,
+            "promisee_id": promisee_id,
+            "description": description,
+            "category": category,
+            "status": "active",
+            "deadline": deadline,
+            "created_at": _iso(now),
+            "fulfilled_at": None,
+            "broken_at": None,
+            "updated_at": _iso(now),
+        }
+        self.store.put("promises", promise)
+        self._emit("promise.created", {"promise": promise}, promise, now)
+        return promise
+
+    def _promise(self, promise_id: str, now: datetime) -> dict:
+        promise = self.store.get("promises", promise_id)
+        if promise is None:
+            raise _not_found("Promise")
+        if self._expire(promise, now):
+            self._record_score(promise["promisor_id"], now)
+        return promise
+
+    def _get_promise(self, call: _Call, promise_id: str) -> tuple[int, Any]:
+        return 200, self._promise(promise_id, call.now)
+
+    def _update_status(self, call: _Call, promise_id: str) -> tuple[int, Any]:
+        self._require_key(call)
+        return 200, self._transition(promise_id, call.body().get("status"), call.now)
+
+    def _transition(self, promise_id: Any, status: Any, now: datetime) -> dict:
+        if status not in TRANSITIONS["active"]:
+            raise _bad_request("status must be one of: broken, disputed, fulfilled")
+        promise = self._promise(promise_id, now)
+        current = promise["status"]
+        if status not in TRANSITIONS.get(current, ()):
+            raise _ApiError(
+                409, "conflict", f"Cannot transition a {current} promise to {status}"
+            )
+        promise["status"] = status
+        promise["updated_at"] = _iso(now)
+        if status == "fulfilled":
+            promise["fulfilled_at"] = _iso(now)
+        elif status == "broken":
+            promise["broken_at"] = _iso(now)
+        self.store.put("promises", promise)
+        if status in OUTCOMES:
+            self._emit(f"promise.{status}", {"promise": promise}, promise, now)
+            self._record_score(promise["promisor_id"], now)
+        return promise
+
+    def _expire(self, promise: dict, now: datetime) -> bool:
+        """Expire an active promise whose deadline has passed."""
+        deadline = promise["deadline"]
+        if promise["status"] != "active" or deadline is None:
+            return False
+        if _parse_time(deadline, "deadline") > now:
+            return False
+        promise["status"] = "expired"
+        promise["updated_at"] = deadline
+        self.store.put("promises", promise)
+        self._emit("promise.expired", {"promise": promise}, promise, now)
+        return True
+
+    def _batch_items(self, call: _Call) -> list:
+        self._require_key(call)
+        items = call.body().get("items")
+        if not isinstance(items, list) or not 1 <= len(items) <= MAX_BATCH:
+            raise _bad_request(f"items must hold 1-{MAX_BATCH} entries")
+        return items
+
+    @staticmethod
+    def _batch(items: list, apply: Callable[[Any], dict], ok: int) -> tuple[int, Any]:
+        results = []
+        for index, item in enumerate(items):
+            try:
+                data = apply(item)
+            except _ApiError as exc:
+                results.append(
+                    {"index": index, "status": exc.status, "data": None, "error": exc.body}
+                )
+            else:
+                results.append({"index": index, "status": ok, "data": data, "error": None})
+        return 200, {"results": results}
+
+    def _batch_create(self, call: _Call) -> tuple[int, Any]:
+        items = self._batch_items(call)
+        return self._batch(items, lambda item: self._new_promise(item, call.now), 201)
+
+    def _batch_update_status(self, call: _Call) -> tuple[int, Any]:
+        items = self._batch_items(call)
+
+        def apply(item: Any) -> dict:
+            if not isinstance(item, dict):
+                raise _bad_request("Each item must be a JSON object")
+            return self._transition(item.get("promise_id"), item.get("status"), call.now)
+
+        return self._batch(items, apply, 200)
+
+    def _record_promise(self, call: _Call) -> tuple[int, Any]:
+        self._require_key(call)
+        return 201, self._new_record(call.body(), call.now)
+
+    def _batch_record(self, call: _Call) -> tuple[int, Any]:
+        items = self._batch_items(call)
+        return self._batch(items, lambda item: self._new_record(item, call.now), 201)
+
+    def _new_record(self, body: Any, now: datetime) -> dict:
+        if not isinstance(body, dict):
+            raise _bad_request("Promise must be a JSON object")
+        status = body.get("status")
+        if status not in ("fulfilled", "broken"):
+            raise _bad_request("status must be one of: broken, fulfilled")
+        items = body.get("evidence", [])
+        if not isinstance(items, list) or len(items) > MAX_BATCH:
+            raise _bad_request(f"evidence must hold at most {MAX_BATCH} entries")
+        # Everything is validated before the first write so a rejected
+        # request leaves nothing behind.
+        for item in items:
+            self._check_evidence(item)
+        promise = self._new_promise(body, now)
+        evidence = [self._new_evidence(promise, item, now) for item in items]
+        promise = self._transition(promise["id"], status, now)
+        return {"promise": promise, "evidence": evidence}
+
+    # ── Evidence ─────────────────────────────────────────────────────────
+
+    def _submit_evidence(self, call: _Call, promise_id: str) -> tuple[int, Any]:
+        self._require_key(call)
+        body = call.body()
+        promise = self._promise(promise_id, call.now)
+        self._check_evidence(body)
+        return 201, self._new_evidence(promise, body, call.now)
+
+    @staticmethod
+    def _check_evidence(body: Any) -> None:
+        if not isinstance(body, dict):
+            raise _bad_request("Evidence must be a JSON object")
+        if body.get("type") not in EVIDENCE_TYPES:
+            raise _invalid(f"type must be one of: {', '.join(sorted(EVIDENCE_TYPES))}")
+        if not body.get("submitted_by"):
+            raise _bad_request("submitted_by is required")
+
+    def _new_evidence(self, promise: dict, body: dict, now: datetime) -> dict:
+        payload = body.get("payload")
+        evidence = {
+            "id": str(uuid.uuid4()),
+            "promise_id": promise["id"],
+            "type": body["type"],
+            "submitted_by": body["submitted_by"],
+            "verified": False,
+            "payload": payload,
+            "created_at": _iso(now),
+            "hash": hashlib.sha256(
+                json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+            ).hexdigest(),
+        }
+        self.store.put("evidence", evidence)
+        self._emit(
+            "evidence.submitted",
+            {"evidence": evidence, "promise_id": promise["id"]},
+            promise,
+            now,
+        )
+        return evidence
+
+    def _list_evidence(self, call: _Call, promise_id: str) -> tuple[int, Any]:
+        self._promise(promise_id, call.now)
+        return 200, self._page(call, self.store.list("evidence", promise_id))
+
+    # ── Scores ───────────────────────────────────────────────────────────
+
+    def _score(self, entity_id: str, now: datetime) -> dict:
+        entity = self._entity(entity_id)
+        promises = self.store.list("promises", entity_id)
+        if any([self._expire(p, now) for p in promises]):
+            self._record_score(entity_id, now)
+        return self._compute_score(entity, promises)
+
+    @staticmethod
+    def _compute_score(entity: dict, promises: list[dict]) -> dict:
+        resolved = sorted(
+            (p for p in promises if p["status"] in OUTCOMES),
+            key=lambda p: p["updated_at"],
+        )
+        fulfilled = [p for p in resolved if p["status"] == "fulfilled"]
+        rated = len(resolved) >= MIN_RATED_PROMISES
+        score = round(len(fulfilled) / len(resolved), 4) if rated else None
+
+        by_category: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        for p in resolved:
+            counts = by_category[p["category"]]
+            counts[0] += p["status"] == "fulfilled"
+            counts[1] += 1
+        delays = [
+            max(
+                0.0,
+                (
+                    _parse_time(p["fulfilled_at"], "fulfilled_at")
+                    - _parse_time(p["deadline"], "deadline")
+                ).total_seconds()
+                / 3600,
+            )
+            for p in fulfilled
+            if p["deadline"]
+        ]
+        streak = 0
+        for p in reversed(resolved):
+            if p["status"] != "fulfilled":
+                break
+            streak += 1
+
+        return {
+            "entity_id": entity["id"],
+            "entity_name": entity["name"],
+            "overall_score": score,
+            "level": trust_level(score),
+            "rated": rated,
+            "total_promises": len(promises),
+            "fulfilled_count": len(fulfilled),
+            "broken_count": sum(p["status"] == "broken" for p in resolved),
+            "avg_delay_hours": round(sum(delays) / len(delays), 2) if delays else 0.0,
+            "category_scores": {
+                category: round(kept / total, 4)
+                for category, (kept, total) in sorted(by_category.items())
+            }
+            or None,
+            "streak": streak,
+            "score_version": "v1",
+            "last_updated": resolved[-1]["updated_at"] if resolved else None,
+        }
+
+    def _record_score(self, entity_id: str, now: datetime) -> None:
+        """Append a history snapshot and emit ``score.updated``."""
+        entity = self._entity(entity_id)
+        score = self._compute_score(entity, self.store.list("promises", entity_id))
+        history = self.store.list("score_history", entity_id)
+        previous = history[-1] if history else None
+        self.store.put(
+            "score_history",
+            {
+                "id": str(uuid.uuid4()),
+                "entity_id": entity_id,
+                "score": score["overall_score"],
+                "level": score["level"],
+                "total_promises": score["total_promises"],
+                "fulfilled_count": score["fulfilled_count"],
+                "broken_count": score["broken_count"],
+                "streak": score["streak"],
+                "avg_delay_hours": score["avg_delay_hours"],
+                "category_scores": score["category_scores"],
+                "score_version": score["score_version"],
+                "timestamp": _iso(now),
+            },
+        )
+        self._emit(
+            "score.updated",
+            {
+                "entity_id": entity_id,
+                "previous_score": previous["score"] if previous else None,
+                "new_score": score["overall_score"],
+                "previous_level": previous["level"] if previous else "Unrated",
+                "new_level": score["level"],
+                "is_rated": score["rated"],
+                "total_promises": score["total_promises"],
+                "fulfilled_count": score["fulfilled_count"],
+                "broken_count": score["broken_count"],
+            },
+            None,
+            now,
+            entity_id=entity_id,
+        )
+
+    def _get_score(self, call: _Call, entity_id: str) -> tuple[int, Any]:
+        return 200, self._score(entity_id, call.now)
+
+    def _batch_scores(self, call: _Call) -> tuple[int, Any]:
+        entity_ids = call.body().get("entity_ids")
+        if not isinstance(entity_ids, list) or not 1 <= len(entity_ids) <= MAX_BATCH:
+            raise _bad_request(f"entity_ids must hold 1-{MAX_BATCH} entries")
+        return self._batch(entity_ids, lambda eid: self._score(eid, call.now), 200)
+
+    def _score_history(self, call: _Call, entity_id: str) -> tuple[int, Any]:
+        self._score(entity_id, call.now)
+        history = self.store.list("score_history", entity_id)[::-1]
+        offset = call.params.get("offset")
+        if offset is not None and "cursor" not in call.params:
+            if not offset.isdigit():
+                raise _bad_request("offset must be a non-negative integer")
+            history = history[int(offset):]
+        page = self._page(call, history, default_limit=50, time_field="timestamp")
+        return 200, {"entity_id": entity_id, "history": page, "total": len(history)}
+
+    # ── Webhooks ─────────────────────────────────────────────────────────
+
+    def _webhook_view(self, webhook: dict) -> dict:
+        return {k: v for k, v in webhook.items() if k not in ("owner", "secret", "deleted")}
+
+    def _key_entity(self, key: str) -> str | None:
+        record = self.store.get("keys", _key_id(key))
+        return record["entity_id"] if record else None
+
+    def _owned_webhook(self, call: _Call, webhook_id: str) -> dict:
+        key = self._require_key(call)
+        webhook = self.store.get("webhooks", webhook_id)
+        if webhook is None or webhook.get("deleted") or webhook["owner"] != _key_id(key):
+            raise _not_found("Webhook")
+        return webhook
+
+    def _validate_event_types(self, event_types: Any) -> None:
+        if (
+            not isinstance(event_types, list)
+            or not event_types
+            or not EVENT_TYPES.issuperset(event_types)
+        ):
+            raise _invalid(
+                f"event_types must list one or more of: {', '.join(sorted(EVENT_TYPES))}"
+            )
+
+    def _create_webhook(self, call: _Call) -> tuple[int, Any]:
+        key = self._require_key(call)
+        body = call.body()
+        if not isinstance(body.get("url"), str) or not body["url"]:
+            raise _bad_request("url is required")
+        self._validate_event_types(body.get("event_types"))
+        webhook = {
+            "id": str(uuid.uuid4()),
+            "entity_id": self._key_entity(key),
+            "owner": _key_id(key),
+            "url": body["url"],
+            "event_types": body["event_types"],
+            "is_active": True,
+            "secret": f"whsec_{secrets.token_hex(24)}",
+            "created_at": _iso(call.now),
+            "updated_at": _iso(call.now),
+        }
+        self.store.put("webhooks", webhook)
+        return 201, {**self._webhook_view(webhook), "secret": webhook["secret"]}
+
+    def _list_webhooks(self, call: _Call) -> tuple[int, Any]:
+        key = self._require_key(call)
+        owner = _key_id(key)
+        webhooks = [
+            self._webhook_view(w)
+            for w in self.store.list("webhooks", self._key_entity(key))
+            if w["owner"] == owner and not w.get("deleted")
+        ]
+        return 200, self._page(call, webhooks)
+
+    def _get_webhook(self, call: _Call, webhook_id: str) -> tuple[int, Any]:
+        webhook = self._owned_webhook(call, webhook_id)
+        return 200, self._webhook_view(webhook)
+
+    def _update_webhook(self, call: _Call, webhook_id: str) -> tuple[int, Any]:
+        webhook = self._owned_webhook(call, webhook_id)
+        body = call.body()
+        if body.get("event_types") is not None:
+            self._validate_event_types(body["event_types"])
+        for field in ("url", "event_types", "is_active"):
+            if body.get(field) is not None:
+                webhook[field] = body[field]
+        webhook["updated_at"] = _iso(call.now)
+        self.store.put("webhooks", webhook)
+        return 200, self._webhook_view(webhook)
+
+    def _delete_webhook(self, call: _Call, webhook_id: str) -> tuple[int, Any]:
+        webhook = self._owned_webhook(call, webhook_id)
+        # Stores are append-only; deleted webhooks are tombstoned.
+        webhook.update(deleted=True, is_active=False, updated_at=_iso(call.now))
+        self.store.put("webhooks", webhook)
+        return 204, None
+
+    def _webhook_logs(self, call: _Call, webhook_id: str) -> tuple[int, Any]:
+        self._owned_webhook(call, webhook_id)
+        return 200, self._page(call, self.store.list("deliveries", webhook_id))
+
+    def _emit(
+        self,
+        event_type: str,
+        data: dict,
+        promise: dict | None,
+        now: datetime,
+        entity_id: str | None = None,
+    ) -> None:
+        if self._deliver is None:
+            return
+        parties = [entity_id] if promise is None else [
+            promise["promisor_id"],
+            promise["promisee_id"],
+        ]
+        # Webhooks registered with keys this ledger did not issue have no
+        # entity and receive every event.
+        webhooks = [
+            w
+            for parent in (None, *parties)
+            for w in self.store.list("webhooks", parent)
+            if w["is_active"] and not w.get("deleted") and event_type in w["event_types"]
+        ]
+        if not webhooks:
+            return
+        event_id = str(uuid.uuid4())
+        timestamp = _iso(now)
+        body = json.dumps(
+            {"event_type": event_type, "event_id": event_id, "timestamp": timestamp, "data": data}
+        ).encode()
+        for webhook in webhooks:
+            headers = {
+                "Content-Type": "application/json",
+                "X-SozLedger-Event": event_type,
+                "X-SozLedger-Delivery-Id": event_id,
+                "X-SozLedger-Timestamp": timestamp,
+                SIGNATURE_HEADER: sign(body, webhook["secret"]),
+            }
+            delivery = {
+                "id": str(uuid.uuid4()),
+                "webhook_id": webhook["id"],
+                "event_id": event_id,
+                "event_type": event_type,
+                "attempt_number": 1,
+                "status_code": None,
+                "response_body": None,
+                "success": False,
+                "error_message": None,
+                "next_retry_at": None,
+                "created_at": timestamp,
+            }
+            self._outbox.append((webhook, body, headers, delivery))
+
+    def _send(self, outbox: list[tuple[dict, bytes, dict, dict]]) -> None:
+        for webhook, body, headers, delivery in outbox:
+            try:
+                status_code = self._deliver(webhook["url"], body, headers)
+            except Exception as exc:
+                delivery["error_message"] = str(exc)
+            else:
+                delivery["status_code"] = status_code
+                delivery["success"] = status_code is not None and 200 <= status_code < 300
+            with self._lock:
+                self.store.put("deliveries", delivery)
+
+    # ── Pagination ───────────────────────────────────────────────────────
+
+    def _page(
+        self,
+        call: _Call,
+        items: list[dict],
+        default_limit: int = 100,
+        time_field: str = "created_at",
+    ) -> list[dict]:
+        params = call.params
+        try:
+            limit = int(params.get("limit", default_limit))
+            offset = int(params.get("cursor", 0))
+        except ValueError:
+            raise _bad_request("limit and cursor must be integers") from None
+        if not 1 <= limit <= MAX_PAGE:
+            raise _bad_request(f"limit must be between 1 and {MAX_PAGE}")
+        since = params.get("since")
+        if since is not None:
+            cutoff = _parse_time(since, "since")
+            items = [i for i in items if _parse_time(i[time_field], time_field) >= cutoff]
+        page = items[offset:offset + limit]
+        if offset + limit < len(items):
+            call.headers[NEXT_CURSOR_HEADER] = str(offset + limit)
+        return page
+
+
+_ID = r"(?P<{}>[^/]+)"
+
+_ROUTES = [
+    (r"/", "GET", "_root"),
+    (r"/health", "GET", "_health"),
+    (r"/v1/entities", "POST", "_create_entity"),
+    (r"/v1/entities/" + _ID.format("entity_id"), "GET", "_get_entity"),
+    (r"/v1/entities/" + _ID.format("entity_id") + "/score", "GET", "_get_score"),
+    (r"/v1/promises", "POST", "_create_promise"),
+    (r"/v1/promises:batchCreate", "POST", "_batch_create"),
+    (r"/v1/promises:batchUpdateStatus", "POST", "_batch_update_status"),
+    (r"/v1/promises:record", "POST", "_record_promise"),
+    (r"/v1/promises:batchRecord", "POST", "_batch_record"),
+    (r"/v1/promises/" + _ID.format("promise_id"), "GET", "_get_promise"),
+    (r"/v1/promises/" + _ID.format("promise_id") + "/status", "PATCH", "_update_status"),
+    (r"/v1/promises/" + _ID.format("promise_id") + "/evidence", "POST", "_submit_evidence"),
+    (r"/v1/promises/" + _ID.format("promise_id") + "/evidence", "GET", "_list_evidence"),
+    (r"/v1/scores:batchGet", "POST", "_batch_scores"),
+    (r"/v1/scores/" + _ID.format("entity_id"), "GET", "_get_score"),
+    (r"/v1/scores/" + _ID.format("entity_id") + "/history", "GET", "_score_history"),
+    (r"/v1/webhooks", "POST", "_create_webhook"),
+    (r"/v1/webhooks", "GET", "_list_webhooks"),
+    (r"/v1/webhooks/" + _ID.format("webhook_id"), "GET", "_get_webhook"),
+    (r"/v1/webhooks/" + _ID.format("webhook_id"), "PATCH", "_update_webhook"),
+    (r"/v1/webhooks/" + _ID.format("webhook_id"), "DELETE", "_delete_webhook"),
+    (r"/v1/webhooks/" + _ID.format("webhook_id") + "/logs", "GET", "_webhook_logs"),
+]
@@ -0,0 +1,51 @@
+"""Expose a :class:`LocalLedger` over real HTTP.
+
+Useful when the code under test is not Python, or runs in another process::
+
+    python -m soz_ledger.local --port 8000 --db ledger.sqlite3
+"""
+
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from soz_ledger.local.ledger import LocalLedger
+
+
+def make_server(
+    ledger: LocalLedger, host: str = "127.0.0.1", port: int = 8000
+) -> ThreadingHTTPServer:
+    """Build (but do not start) an HTTP server backed by ``ledger``."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _serve(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = httpx.Request(
+                self.command,
+                f"http://{host}:{port}{self.path}",
+                headers=dict(self.headers),
+                content=self.rfile.read(length),
+            )
+            response = ledger.handle(request)
+            self.send_response(response.status_code)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(response.content)
+
+        do_GET = do_POST = do_PATCH = do_DELETE = _serve
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def serve(ledger: LocalLedger, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """Serve ``ledger`` over HTTP until interrupted."""
+    with make_server(ledger, host, port) as server:
+        server.serve_forever()
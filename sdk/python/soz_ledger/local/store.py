@@ -0,0 +1,112 @@
+"""Record storage for the local ledger.
+
+Records are plain JSON-compatible dicts grouped by kind (``"entities"``,
+``"promises"``, ...). Every kind except entities is listed by a single
+parent field, e.g. evidence by ``promise_id``; lists come back in insertion
+order.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import Protocol
+
+# kind -> field that records of that kind are listed by
+PARENT_FIELDS: dict[str, str | None] = {
+    "entities": None,
+    "keys": None,
+    "promises": "promisor_id",
+    "evidence": "promise_id",
+    "score_history": "entity_id",
+    "webhooks": "entity_id",
+    "deliveries": "webhook_id",
+}
+
+
+class Store(Protocol):
+    def put(self, kind: str, record: dict) -> None: ...
+
+    def get(self, kind: str, record_id: str) -> dict | None: ...
+
+    def list(self, kind: str, parent: str | None) -> list[dict]: ...
+
+
+class MemoryStore:
+    """Keeps records in dicts; the fastest option for load tests."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, dict[str, dict]] = defaultdict(dict)
+        self._children: dict[tuple[str, str | None], list[str]] = defaultdict(list)
+
+    def put(self, kind: str, record: dict) -> None:
+        records = self._records[kind]
+        if record["id"] not in records:
+            field = PARENT_FIELDS[kind]
+            parent = record.get(field) if field else None
+            self._children[(kind, parent)].append(record["id"])
+        records[record["id"]] = record
+
+    def get(self, kind: str, record_id: str) -> dict | None:
+        return self._records[kind].get(record_id)
+
+    def list(self, kind: str, parent: str | None) -> list[dict]:
+        records = self._records[kind]
+        return [records[i] for i in self._children.get((kind, parent), ())]
+
+
+class SQLiteStore:
+    """Persists records to a SQLite database, one JSON document per row.
+
+    ``path`` defaults to an in-memory database; pass a file path to keep
+    the ledger between runs.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " kind TEXT NOT NULL,"
+                " id TEXT NOT NULL,"
+                " parent TEXT,"
+                " data TEXT NOT NULL,"
+                " UNIQUE (kind, id))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS records_parent"
+                " ON records (kind, parent, seq)"
+            )
+
+    def put(self, kind: str, record: dict) -> None:
+        field = PARENT_FIELDS[kind]
+        parent = record.get(field) if field else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO records (kind, id, parent, data) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (kind, id) DO UPDATE SET data = excluded.data",
+                (kind, record["id"], parent, json.dumps(record)),
+            )
+
+    def get(self, kind: str, record_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM records WHERE kind = ? AND id = ?",
+                (kind, record_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list(self, kind: str, parent: str | None) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM records WHERE kind = ? AND parent IS ? ORDER BY seq",
+                (kind, parent),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,428 @@
+"""Local SQLite mirror of ledger data.
+
+:class:`LedgerMirror` keeps entities, promises, evidence and score history
+in a SQLite database indexed for analytical queries (by promisor, promisee,
+status, category and deadline), so heavy jobs read local indexes instead
+of the API::
+
+    mirror = LedgerMirror("ledger.sqlite3", client)
+    receiver.on("*")(mirror.handle_event)  # live updates
+    mirror.track(agent.id)
+    mirror.sync()                            # periodic catch-up
+
+    overdue = mirror.promises(status="active", due_before="2026-03-01T00:00:00Z")
+
+The API has no endpoint listing promises, so promises enter the mirror
+through webhook events, :meth:`LedgerMirror.add_promises` (e.g. with what
+the application created) or ``sync(promise_ids=...)``. :meth:`~LedgerMirror.sync`
+then refreshes tracked entities, open promises and anything newer than each
+stored high-water mark.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.models import Entity, Evidence, Promise, ScoreHistoryEntry, _from_dict
+
+if TYPE_CHECKING:
+    from soz_ledger.client import SozLedgerClient
+
+# Promise statuses that can still change.
+_OPEN_STATUSES = ("active", "disputed")
+_FINAL = "IN ('fulfilled', 'broken', 'expired')"
+# How far a ``score.updated`` event time may drift from the recompute time
+# the history endpoint reports for the same entry, in seconds.
+_EVENT_SKEW = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    type TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS promises (
+    id TEXT PRIMARY KEY,
+    promisor_id TEXT NOT NULL,
+    promisee_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    category TEXT NOT NULL,
+    deadline TEXT,
+    created_at TEXT,
+    fulfilled_at TEXT,
+    seen_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS promises_promisor ON promises (promisor_id, status);
+CREATE INDEX IF NOT EXISTS promises_promisee ON promises (promisee_id, status);
+CREATE INDEX IF NOT EXISTS promises_status ON promises (status, deadline);
+CREATE INDEX IF NOT EXISTS promises_category ON promises (category, status);
+CREATE INDEX IF NOT EXISTS promises_deadline ON promises (deadline);
+CREATE TABLE IF NOT EXISTS evidence (
+    id TEXT PRIMARY KEY,
+    promise_id TEXT NOT NULL,
+    type TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evidence_promise ON evidence (promise_id, created_at);
+CREATE TABLE IF NOT EXISTS score_history (
+    entity_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    score REAL,
+    level TEXT NOT NULL,
+    version TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS score_history_entry
+    ON score_history (entity_id, timestamp, IFNULL(score, -1), level);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _promise_time(promise: dict) -> float:
+    """The latest ledger timestamp a promise carries, in seconds."""
+    stamps = (
+        _seconds(promise.get(field))
+        for field in ("updated_at", "fulfilled_at", "broken_at", "created_at")
+    )
+    return max((t for t in stamps if t is not None), default=0.0)
+
+
+@dataclass
+class SyncResult:
+    """What one :meth:`LedgerMirror.sync` call fetched."""
+
+    entities: int = 0
+    promises: int = 0
+    evidence: int = 0
+    score_history: int = 0
+    errors: int = 0
+
+
+class LedgerMirror:
+    """Mirrors ledger data into SQLite and answers queries from it.
+
+    Promise rows are ordered by ledger time only -- the event timestamp, or
+    the promise's own timestamps for :meth:`sync` and :meth:`add_promises`
+    -- so the local clock never decides which version wins. A final status
+    (fulfilled, broken, expired) always replaces an open one, since the
+    promise's timestamps do not record every transition.
+
+    Args:
+        path: Database file, or ``":memory:"``.
+        client: The :class:`SozLedgerClient` used by :meth:`sync`; not needed
+            for a mirror fed only by webhook events.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        client: SozLedgerClient | None = None,
+    ) -> None:
+        self._client = client
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    # ── Feeding the mirror ───────────────────────────────────────────────
+
+    def track(self, *entity_ids: str) -> None:
+        """Include entities (and their score history) in :meth:`sync`."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sync_state (key, value) VALUES (?, '')",
+                [(f"track:{entity_id}",) for entity_id in entity_ids],
+            )
+
+    def add_promises(self, promises: Iterable[Promise | dict]) -> None:
+        """Store promises known to the application, e.g. ones it created."""
+        with self._lock, self._conn:
+            for promise in promises:
+                promise = _as_dict(promise)
+                self._put_promise(promise, _promise_time(promise))
+
+    def handle_event(self, event: dict[str, Any]) -> None:
+        """Apply a webhook event; suitable as a ``WebhookReceiver`` handler.
+
+        Events older than what is stored for a promise are ignored, so
+        redelivered or reordered events cannot roll a promise back.
+        """
+        event_type = event.get("event_type") or event.get("type") or ""
+        data = event.get("data") or {}
+        with self._lock, self._conn:
+            if event_type.startswith("promise.") and data.get("promise"):
+                promise = data["promise"]
+                seen_at = _seconds(event.get("timestamp")) or _promise_time(promise)
+                self._put_promise(promise, seen_at)
+            elif event_type == "evidence.submitted" and data.get("evidence"):
+                evidence = dict(data["evidence"])
+                evidence.setdefault("promise_id", data.get("promise_id"))
+                self._put_evidence(evidence)
+            elif event_type == "score.updated" and data.get("entity_id"):
+                self._put_history(
+                    data["entity_id"],
+                    [
+                        ScoreHistoryEntry(
+                            score=data.get("new_score"),
+                            level=data.get("new_level", "Unrated"),
+                            timestamp=event.get("timestamp"),
+                            # Filled in by the next sync.
+                            version="",
+                        )
+                    ],
+                )
+
+    def sync(
+        self,
+        entity_ids: Iterable[str] | None = None,
+        promise_ids: Iterable[str] = (),
+    ) -> SyncResult:
+        """Catch up with the API from the stored high-water marks.
+
+        Refreshes the given (or all tracked) entities and their score
+        history since the last entry stored, every open promise plus
+        ``promise_ids``, and the evidence of those promises since the last
+        evidence stored for each. Errors for individual records are counted
+        in the result and retried on the next sync.
+        """
+        if self._client is None:
+            raise ValueError("sync() needs a client")
+        result = SyncResult()
+        entity_ids = list(entity_ids) if entity_ids is not None else self.tracked()
+
+        for entity_id in entity_ids:
+            try:
+                entity = self._client.entities.get(entity_id)
+                with self._lock:
+                    since = self._state(f"history:{entity_id}")
+                history = [
+                    h
+                    for h in self._client.scores.iter_history(entity_id, since=since)
+                    if h.timestamp
+                ]
+            except SozLedgerError:
+                result.errors += 1
+                continue
+            with self._lock, self._conn:
+                self._put_entity(dataclasses.asdict(entity))
+                result.entities += 1
+                result.score_history += self._put_history(entity_id, history)
+                if history:
+                    newest = max(history, key=lambda h: _seconds(h.timestamp))
+                    self._set_state(f"history:{entity_id}", newest.timestamp)
+
+        with self._lock:
+            open_ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT id FROM promises WHERE status IN (?, ?)", _OPEN_STATUSES
+                )
+            ]
+        for promise_id in dict.fromkeys([*open_ids, *promise_ids]):
+            try:
+                promise = self._client.promises.get(promise_id)
+                with self._lock:
+                    since = self._state(f"evidence:{promise_id}")
+                evidence = list(self._client.evidence.iter(promise_id, since=since))
+            except SozLedgerError:
+                result.errors += 1
+                continue
+            with self._lock, self._conn:
+                promise = dataclasses.asdict(promise)
+                self._put_promise(promise, _promise_time(promise))
+                result.promises += 1
+                for item in evidence:
+                    result.evidence += self._put_evidence(dataclasses.asdict(item))
+                stamps = [e.created_at for e in evidence if e.created_at]
+                if stamps:
+                    self._set_state(f"evidence:{promise_id}", max(stamps, key=_seconds))
+        return result
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    def promises(
+        self,
+        promisor_id: str | None = None,
+        promisee_id: str | None = None,
+        status: str | None = None,
+        category: str | None = None,
+        due_before: str | None = None,
+    ) -> list[Promise]:
+        """Mirrored promises matching every given filter, by deadline."""
+        clauses, params = [], []
+        for column, value in (
+            ("promisor_id", promisor_id),
+            ("promisee_id", promisee_id),
+            ("status", status),
+            ("category", category),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if due_before is not None:
+            clauses.append("deadline IS NOT NULL AND deadline < ?")
+            params.append(due_before)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.execute(
+            f"SELECT data FROM promises{where} ORDER BY deadline IS NULL, deadline, created_at",
+            params,
+        )
+        return [_from_dict(Promise, json.loads(data)) for (data,) in rows]
+
+    def evidence(self, promise_id: str) -> list[Evidence]:
+        rows = self.execute(
+            "SELECT data FROM evidence WHERE promise_id = ? ORDER BY created_at", [promise_id]
+        )
+        return [_from_dict(Evidence, json.loads(data)) for (data,) in rows]
+
+    def entity(self, entity_id: str) -> Entity | None:
+        rows = self.execute("SELECT data FROM entities WHERE id = ?", [entity_id])
+        return _from_dict(Entity, json.loads(rows[0][0])) if rows else None
+
+    def score_history(self, entity_id: str) -> list[ScoreHistoryEntry]:
+        """An entity's mirrored score history, newest first."""
+        rows = self.execute(
+            "SELECT score, level, timestamp, version FROM score_history"
+            " WHERE entity_id = ? ORDER BY timestamp DESC",
+            [entity_id],
+        )
+        return [ScoreHistoryEntry(*row) for row in rows]
+
+    def tracked(self) -> list[str]:
+        rows = self.execute("SELECT key FROM sync_state WHERE key LIKE 'track:%' ORDER BY key")
+        return [key.removeprefix("track:") for (key,) in rows]
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> list[tuple]:
+        """Run a read query against the mirror, e.g. an aggregate report."""
+        with self._lock:
+            return self._conn.execute(sql, list(params)).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── Internals (caller holds the lock) ────────────────────────────────
+
+    def _put_promise(self, promise: dict, seen_at: float) -> None:
+        self._conn.execute(
+            "INSERT INTO promises (id, promisor_id, promisee_id, status, category,"
+            " deadline, created_at, fulfilled_at, seen_at, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (id) DO UPDATE SET"
+            " status = excluded.status, deadline = excluded.deadline,"
+            " fulfilled_at = excluded.fulfilled_at, seen_at = excluded.seen_at,"
+            " data = excluded.data"
+            f" WHERE (excluded.status {_FINAL}) > (promises.status {_FINAL})"
+            f" OR ((excluded.status {_FINAL}) = (promises.status {_FINAL})"
+            " AND excluded.seen_at >= promises.seen_at)",
+            (
+                promise["id"],
+                promise["promisor_id"],
+                promise["promisee_id"],
+                promise.get("status", "active"),
+                promise.get("category", "custom"),
+                promise.get("deadline"),
+                promise.get("created_at"),
+                promise.get("fulfilled_at"),
+                seen_at,
+                json.dumps(promise),
+            ),
+        )
+
+    def _put_evidence(self, evidence: dict) -> int:
+        return self._conn.execute(
+            "INSERT OR IGNORE INTO evidence (id, promise_id, type, created_at, data)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                evidence["id"],
+                evidence["promise_id"],
+                evidence.get("type") or evidence.get("evidence_type"),
+                evidence.get("created_at"),
+                json.dumps(evidence),
+            ),
+        ).rowcount
+
+    def _put_entity(self, entity: dict) -> None:
+        entity.pop("api_key", None)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entities (id, name, type, created_at, data)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (entity["id"], entity["name"], entity["type"], entity["created_at"], json.dumps(entity)),
+        )
+
+    def _put_history(self, entity_id: str, history: list[ScoreHistoryEntry]) -> int:
+        """Store history entries; returns how many rows were added or completed.
+
+        Event-sourced entries (``version == ""``) carry the event time rather
+        than the recompute time, so each entry is first matched against a row
+        from the other source with the same score and level within
+        ``_EVENT_SKEW`` seconds: a synced entry completes that row in place,
+        an event entry is dropped.
+        """
+        before = self._conn.total_changes
+        for h in history:
+            near = self._conn.execute(
+                "SELECT rowid FROM score_history"
+                " WHERE entity_id = ? AND level = ? AND IFNULL(score, -1) = IFNULL(?, -1)"
+                " AND (version = '') != (? = '')"
+                " AND ABS(julianday(timestamp) - julianday(?)) * 86400 <= ?"
+                " ORDER BY ABS(julianday(timestamp) - julianday(?)) LIMIT 1",
+                (entity_id, h.level, h.score, h.version, h.timestamp, _EVENT_SKEW, h.timestamp),
+            ).fetchone()
+            if near and not h.version:
+                continue
+            if near:
+                self._conn.execute(
+                    "UPDATE OR REPLACE score_history SET timestamp = ?, version = ?"
+                    " WHERE rowid = ?",
+                    (h.timestamp, h.version, near[0]),
+                )
+                continue
+            self._conn.execute(
+                "INSERT INTO score_history (entity_id, timestamp, score, level, version)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT DO UPDATE SET version = excluded.version"
+                " WHERE score_history.version = ''",
+                (entity_id, h.timestamp, h.score, h.level, h.version),
+            )
+        return self._conn.total_changes - before
+
+    def _state(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT value FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value)
+        )
+
+
+def _as_dict(promise: Promise | dict) -> dict:
+    return dict(promise) if isinstance(promise, dict) else dataclasses.asdict(promise)
@@ -1,17 +1,38 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import json
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def _decode(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@functools.cache
+def _field_names(cls: type) -> frozenset[str]:
+    return frozenset(f.name for f in dataclasses.fields(cls))
+
 
 def _from_dict(cls: type, data: dict[str, Any]):
     """Construct a dataclass instance, silently ignoring unknown fields."""
-    known = {f.name for f in dataclasses.fields(cls)}
+    known = _field_names(cls)
+    if known.issuperset(data):
+        return cls(**data)
     return cls(**{k: v for k, v in data.items() if k in known})
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     id: str
     name: str
@@ -22,7 +43,7 @@ class Entity:
     metadata: dict | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Promise:
     id: str
     promisor_id: str
@@ -35,7 +56,7 @@ class Promise:
     fulfilled_at: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     id: str
     promise_id: str
@@ -47,7 +68,13 @@ class Evidence:
     hash: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
+class RecordedPromise:
+    promise: Promise
+    evidence: list[Evidence] = field(default_factory=list)
+
+
+@dataclass(slots=True)
 class TrustScore:
     entity_id: str
     entity_name: str | None = None
@@ -64,7 +91,7 @@ class TrustScore:
     last_updated: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreHistoryEntry:
     score: float | None
     level: str
@@ -72,13 +99,13 @@ class ScoreHistoryEntry:
     version: str = "v1"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreHistoryResponse:
     entity_id: str
     history: list[ScoreHistoryEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Webhook:
     id: str
     entity_id: str
@@ -89,12 +116,12 @@ class Webhook:
     updated_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookWithSecret(Webhook):
     secret: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryLog:
     id: str
     webhook_id: str
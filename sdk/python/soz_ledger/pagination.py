@@ -0,0 +1,106 @@
+"""Lazy iteration over cursor-paginated list endpoints.
+
+List endpoints that support pagination accept ``limit`` (page size),
+``cursor`` and ``since`` query parameters and return the cursor of the next
+page in the ``X-Next-Cursor`` response header; the header is absent on the
+last page.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# A page fetcher takes a cursor (None for the first page) and returns the
+# decoded items plus the cursor of the following page.
+Page = tuple[list[T], str | None]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _page_params(page_size: int, cursor: str | None, since: str | None) -> dict:
+    params: dict = {"limit": page_size}
+    if cursor is not None:
+        params["cursor"] = cursor
+    if since is not None:
+        params["since"] = since
+    return params
+
+
+def _wants_more(limit: int | None, yielded: int, page_len: int) -> bool:
+    return limit is None or yielded + page_len < limit
+
+
+def paginate(
+    fetch: Callable[[str | None], Page[T]],
+    limit: int | None = None,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """Yield items page by page, stopping after ``limit`` items.
+
+    With ``prefetch`` the next page is requested on a background thread
+    while the caller works through the current one.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending: Future | None = None
+    yielded = 0
+    try:
+        page, cursor = fetch(None)
+        while True:
+            if executor is not None and cursor is not None and _wants_more(
+                limit, yielded, len(page)
+            ):
+                pending = executor.submit(fetch, cursor)
+            for item in page:
+                if limit is not None and yielded >= limit:
+                    return
+                yield item
+                yielded += 1
+            if cursor is None or (limit is not None and yielded >= limit):
+                return
+            if pending is not None:
+                page, cursor = pending.result()
+                pending = None
+            else:
+                page, cursor = fetch(cursor)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def apaginate(
+    fetch: Callable[[str | None], Awaitable[Page[T]]],
+    limit: int | None = None,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """Async counterpart of :func:`paginate`; prefetches with a task."""
+    pending: asyncio.Task | None = None
+    yielded = 0
+    try:
+        page, cursor = await fetch(None)
+        while True:
+            if prefetch and cursor is not None and _wants_more(
+                limit, yielded, len(page)
+            ):
+                pending = asyncio.ensure_future(fetch(cursor))
+            for item in page:
+                if limit is not None and yielded >= limit:
+                    return
+                yield item
+                yielded += 1
+            if cursor is None or (limit is not None and yielded >= limit):
+                return
+            if pending is not None:
+                page, cursor = await pending
+                pending = None
+            else:
+                page, cursor = await fetch(cursor)
+    finally:
+        if pending is not None:
+            pending.cancel()
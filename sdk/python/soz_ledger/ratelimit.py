@@ -0,0 +1,260 @@
+"""Client-side rate-limit pacing and 429 retry policy.
+
+A :class:`RateLimiter` keeps a token bucket per API key and, for promise
+creation, per ``(promisor_id, promisee_id)`` pair. Buckets are kept in step
+with the ``X-RateLimit-*`` headers documented in ``docs/rate-limits.md`` so
+requests are paced before the server starts rejecting them, and ``429``
+responses are retried after ``Retry-After`` with exponential backoff::
+
+    client = SozLedgerClient("your_api_key", rate_limiter=RateLimiter())
+
+The limiter never sleeps itself; it returns how long the caller should wait,
+so the same instance works for the sync and the async client.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+# Cap on any single wait, as recommended in docs/rate-limits.md.
+MAX_BACKOFF = 300.0
+
+
+class TokenBucket:
+    """Token bucket that reports waits instead of blocking.
+
+    ``rate`` is in tokens per second; ``None`` means unlimited, in which case
+    the bucket only delays requests while it is blocked by :meth:`block_until`.
+    Reservations may drive the balance negative so that concurrent callers
+    queue up behind each other rather than all waking at the same moment.
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None and now > self._updated:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self._updated) * self.rate
+            )
+        self._updated = max(self._updated, now)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` and return the seconds to wait before using them."""
+        now = self._clock()
+        wait = max(0.0, self._blocked_until - now)
+        if self.rate is None:
+            return wait
+
+        self._refill(now)
+        self.tokens -= tokens
+        if self.tokens < 0:
+            wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+    def block_until(self, when: float) -> None:
+        """Hold every reservation until the clock reaches ``when``."""
+        self._blocked_until = max(self._blocked_until, when)
+        if self.rate is not None:
+            self._refill(self._clock())
+            self.tokens = min(self.tokens, 0.0)
+            self._updated = max(self._updated, when)
+
+    def sync(self, remaining: int, reset_after: float) -> None:
+        """Align the bucket with the server's view of the current window.
+
+        The balance never exceeds what the server says is left, and the
+        refill rate is lowered (never above ``max_rate``) so the remaining
+        budget is spread over the time until the window resets.
+        """
+        now = self._clock()
+        if remaining <= 0:
+            self.block_until(now + max(reset_after, 0.0))
+            return
+        self._refill(now)
+        self.tokens = min(self.tokens, float(remaining))
+        if self.max_rate is not None and reset_after > 0:
+            self.rate = min(self.max_rate, remaining / reset_after)
+
+
+class RateLimiter:
+    """Paces requests per API key and per promise pair and schedules retries.
+
+    Args:
+        rate: Requests per second allowed per API key. ``None`` derives the
+            pace from ``X-RateLimit-Remaining`` / ``X-RateLimit-Reset``.
+        burst: Bucket capacity per API key.
+        pair_rate: Promise creations per second allowed per
+            ``(promisor_id, promisee_id)`` pair; ``None`` only pauses a pair
+            after the server rejects it.
+        pair_burst: Bucket capacity per pair.
+        max_retries: How many times a ``429`` response is retried.
+        max_backoff: Upper bound in seconds for a single retry wait.
+        max_pairs: Number of pair buckets kept before the least recently
+            used ones are discarded.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: float = 10.0,
+        pair_rate: float | None = None,
+        pair_burst: float = 1.0,
+        max_retries: int = 3,
+        max_backoff: float = MAX_BACKOFF,
+        max_pairs: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.pair_rate = pair_rate
+        self.pair_burst = pair_burst
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.max_pairs = max_pairs
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._keys: dict[str, TokenBucket] = {}
+        self._pairs: OrderedDict[tuple[str, str, str], TokenBucket] = OrderedDict()
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    def acquire(
+        self, api_key: str, method: str, path: str, json: Any = None
+    ) -> float:
+        """Reserve capacity for a request and return the seconds to wait."""
+        with self._lock:
+            wait = self._key_bucket(api_key).reserve()
+            for pair in _promise_pairs(method, path, json):
+                wait = max(wait, self._pair_bucket(api_key, pair).reserve())
+        return wait
+
+    def observe(
+        self,
+        api_key: str,
+        method: str,
+        path: str,
+        json: Any,
+        status_code: int,
+        headers: Any,
+        attempt: int = 0,
+    ) -> float | None:
+        """Feed a response back into the limiter.
+
+        Returns the seconds to wait before retrying when the response is a
+        retryable ``429``, otherwise ``None``.
+        """
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset = _float_header(headers, "X-RateLimit-Reset")
+        reset_after = reset - time.time() if reset is not None else 0.0
+
+        with self._lock:
+            key_bucket = self._key_bucket(api_key)
+            if remaining is not None:
+                key_bucket.sync(remaining, reset_after)
+
+            if status_code != 429:
+                return None
+            if attempt >= self.max_retries:
+                return None
+
+            delay = self.backoff(attempt, _retry_after(headers))
+            until = self._clock() + delay
+            pairs = list(_promise_pairs(method, path, json))
+            # With budget left on the key, a rejected creation is a pair limit.
+            if pairs and remaining != 0:
+                for pair in pairs:
+                    self._pair_bucket(api_key, pair).block_until(until)
+            else:
+                key_bucket.block_until(until)
+        return delay
+
+    def backoff(self, attempt: int, retry_after: float | None) -> float:
+        """``Retry-After`` doubled per attempt, capped at ``max_backoff``."""
+        base = retry_after if retry_after is not None else 1.0
+        return min(base * (2**attempt), self.max_backoff)
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _key_bucket(self, api_key: str) -> TokenBucket:
+        bucket = self._keys.get(api_key)
+        if bucket is None:
+            rate = self.rate if self.rate is not None else float("inf")
+            bucket = TokenBucket(rate, self.burst, self._clock)
+            self._keys[api_key] = bucket
+        return bucket
+
+    def _pair_bucket(self, api_key: str, pair: tuple[str, str]) -> TokenBucket:
+        key = (api_key, *pair)
+        bucket = self._pairs.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.pair_rate, self.pair_burst, self._clock)
+            self._pairs[key] = bucket
+            if len(self._pairs) > self.max_pairs:
+                self._pairs.popitem(last=False)
+        else:
+            self._pairs.move_to_end(key)
+        return bucket
+
+
+def _promise_pairs(method: str, path: str, json: Any) -> Iterator[tuple[str, str]]:
+    """Yield the distinct promisor/promisee pairs a request creates promises for."""
+    if method != "POST" or not isinstance(json, dict):
+        return
+    if path == "/v1/promises":
+        items = [json]
+    elif path == "/v1/promises:batchCreate":
+        items = json.get("items", [])
+    else:
+        return
+    seen = set()
+    for item in items:
+        pair = (item.get("promisor_id"), item.get("promisee_id"))
+        if pair not in seen:
+            seen.add(pair)
+            yield pair
+
+
+def _int_header(headers: Any, name: str) -> int | None:
+    value = _float_header(headers, name)
+    return int(value) if value is not None else None
+
+
+def _float_header(headers: Any, name: str) -> float | None:
+    value = headers.get(name) if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_after(headers: Any) -> float | None:
+    """Parse ``Retry-After`` given either as seconds or as an HTTP date."""
+    seconds = _float_header(headers, "Retry-After")
+    if seconds is not None:
+        return max(seconds, 0.0)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
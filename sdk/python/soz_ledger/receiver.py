@@ -0,0 +1,292 @@
+"""ASGI webhook receiver.
+
+:class:`WebhookReceiver` is an ASGI application that verifies each delivery's
+signature, acknowledges it with ``202 Accepted`` straight away and hands the
+event to a pool of worker tasks, so slow handlers never hold up the response
+and bursts never trip the ledger's retry schedule::
+
+    receiver = WebhookReceiver(secret="whsec_...")
+
+    @receiver.on("promise.fulfilled")
+    async def fulfilled(event: dict) -> None:
+        ...
+
+    receiver.on("score.updated")(cache.handle_event)
+
+Serve it with any ASGI server, for example ``uvicorn app:receiver``. Pass a
+:mod:`~soz_ledger.dedupe` store as ``dedupe`` to acknowledge retried
+deliveries without dispatching them again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from soz_ledger.dedupe import DELIVERY_ID_HEADER, DedupeStore, MemoryDedupeStore
+from soz_ledger.models import _decode
+from soz_ledger.signing import SIGNATURE_HEADER, TIMESTAMP_HEADER, SignatureVerifier
+
+logger = logging.getLogger(__name__)
+
+# Event types the ledger delivers; see docs/webhooks.md.
+EVENT_TYPES = frozenset(
+    {
+        "promise.created",
+        "promise.fulfilled",
+        "promise.broken",
+        "promise.disputed",
+        "promise.expired",
+        "evidence.submitted",
+        "score.updated",
+    }
+)
+
+# Registering a handler for this key receives every event.
+ALL_EVENTS = "*"
+
+Handler = Callable[[dict[str, Any]], Any]
+
+_SIGNATURE_HEADER = SIGNATURE_HEADER.lower().encode()
+_DELIVERY_ID_HEADER = DELIVERY_ID_HEADER.lower().encode()
+_TIMESTAMP_HEADER = TIMESTAMP_HEADER.lower().encode()
+
+
+@dataclass
+class ReceiverStats:
+    """Counters describing what a :class:`WebhookReceiver` has done.
+
+    ``accepted`` counts verified deliveries that were queued, ``rejected``
+    counts deliveries refused for a bad signature or body, ``overflowed``
+    counts deliveries refused with ``503`` because the queue was full (the
+    ledger retries those), ``duplicates`` counts retried deliveries that
+    were acknowledged without being queued again, ``dispatched`` and
+    ``failed`` count handler calls, and ``unhandled`` counts events no
+    handler was registered for.
+    """
+
+    accepted: int = 0
+    rejected: int = 0
+    overflowed: int = 0
+    duplicates: int = 0
+    dispatched: int = 0
+    failed: int = 0
+    unhandled: int = 0
+
+
+class WebhookReceiver:
+    """ASGI application that receives, verifies and dispatches webhook events.
+
+    Handlers take the decoded event (``event_type``, ``event_id``,
+    ``timestamp`` and ``data``) and may be plain functions, which run in a
+    thread, or coroutine functions, which run on the event loop. Several
+    handlers can be registered per event type; a failing handler is logged
+    and does not affect the others.
+
+    Args:
+        secret: The webhook signing secret, several secrets while rotating,
+            or a :class:`~soz_ledger.signing.SignatureVerifier`, e.g. one
+            configured to reject stale timestamps.
+        handlers: Initial handlers keyed by event type, or by ``"*"`` for
+            every event.
+        workers: Number of worker tasks dispatching queued events.
+        max_queue: Maximum number of accepted events waiting for a worker.
+            Deliveries beyond it are answered with ``503`` so the ledger
+            retries them later instead of the receiver running out of memory.
+        max_body: Largest request body accepted, in bytes.
+        dedupe: Store of delivery IDs already accepted. Deliveries whose
+            ``X-SozLedger-Delivery-Id`` (or ``event_id``) it has seen are
+            answered with ``200`` and not dispatched again. Stores other
+            than :class:`~soz_ledger.dedupe.MemoryDedupeStore` are called
+            from a worker thread so disk I/O never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        secret: str | list[str] | SignatureVerifier,
+        handlers: dict[str, Handler | list[Handler]] | None = None,
+        workers: int = 16,
+        max_queue: int = 10_000,
+        max_body: int = 1_048_576,
+        dedupe: DedupeStore | None = None,
+    ) -> None:
+        self._verifier = (
+            secret if isinstance(secret, SignatureVerifier) else SignatureVerifier(secret)
+        )
+        self._handlers: dict[str, list[Handler]] = {}
+        for event_type, registered in (handlers or {}).items():
+            for handler in registered if isinstance(registered, list) else [registered]:
+                self.on(event_type)(handler)
+        self._worker_count = workers
+        self._max_queue = max_queue
+        self._max_body = max_body
+        self._dedupe = dedupe
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._workers: list[asyncio.Task] = []
+        self.stats = ReceiverStats()
+
+    def on(self, event_type: str) -> Callable[[Handler], Handler]:
+        """Register a handler for ``event_type``; usable as a decorator."""
+        if event_type != ALL_EVENTS and event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+
+        def register(handler: Handler) -> Handler:
+            self._handlers.setdefault(event_type, []).append(handler)
+            return handler
+
+        return register
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Start the worker pool. Called on ASGI startup or the first request."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_queue)
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"soz-ledger-receiver-{i}")
+            for i in range(self._worker_count)
+        ]
+
+    async def drain(self) -> None:
+        """Wait until every accepted event has been dispatched."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Dispatch everything still queued, then stop the worker pool."""
+        await self.drain()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    # ── ASGI ─────────────────────────────────────────────────────────────
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self.start()
+            status = await self._accept(scope, receive)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": status,
+                    "headers": [(b"content-length", b"0")],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _accept(self, scope: dict, receive: Callable) -> int:
+        """Verify and queue one delivery, returning the response status."""
+        if scope["method"] != "POST":
+            return 405
+
+        body = bytearray()
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+            if len(body) > self._max_body:
+                self.stats.rejected += 1
+                return 413
+
+        signature = delivery_id = timestamp = None
+        for name, value in scope["headers"]:
+            name = name.lower()
+            if name == _SIGNATURE_HEADER:
+                signature = value.decode("latin-1")
+            elif name == _DELIVERY_ID_HEADER:
+                delivery_id = value.decode("latin-1")
+            elif name == _TIMESTAMP_HEADER:
+                timestamp = value.decode("latin-1")
+        if not self._verifier.verify(bytes(body), signature, timestamp):
+            logger.warning("Rejected webhook delivery with an invalid signature")
+            self.stats.rejected += 1
+            return 401
+
+        try:
+            event = _decode(bytes(body))
+        except ValueError:
+            self.stats.rejected += 1
+            return 400
+        if not isinstance(event, dict):
+            self.stats.rejected += 1
+            return 400
+        if self._verifier.checks_timestamps and event.get("timestamp") != timestamp:
+            # The header is not signed; the body's copy of the timestamp is.
+            self.stats.rejected += 1
+            return 401
+
+        delivery_id = delivery_id or event.get("event_id")
+        dedupe = self._dedupe is not None and delivery_id
+        if dedupe and not await self._dedupe_call(self._dedupe.add, delivery_id):
+            self.stats.duplicates += 1
+            return 200
+
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            if dedupe:
+                # Not queued, so the ledger's retry must not count as a duplicate.
+                await self._dedupe_call(self._dedupe.discard, delivery_id)
+            self.stats.overflowed += 1
+            return 503
+        self.stats.accepted += 1
+        return 202
+
+    async def _dedupe_call(self, method: Callable[[str], Any], delivery_id: str) -> Any:
+        if isinstance(self._dedupe, MemoryDedupeStore):
+            return method(delivery_id)
+        return await asyncio.to_thread(method, delivery_id)
+
+    # ── Dispatch ─────────────────────────────────────────────────────────
+
+    async def _work(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                await self._dispatch(event)
+            finally:
+                self._queue.task_done()
+
+    async def _dispatch(self, event: dict[str, Any]) -> None:
+        event_type = event.get("event_type") or event.get("type")
+        handlers = self._handlers.get(event_type, []) + self._handlers.get(ALL_EVENTS, [])
+        if not handlers:
+            self.stats.unhandled += 1
+            return
+        for handler in handlers:
+            try:
+                result = await self._call(handler, event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Webhook handler %r failed for %s", handler, event_type)
+                self.stats.failed += 1
+            else:
+                self.stats.dispatched += 1
+
+    @staticmethod
+    def _call(handler: Handler, event: dict[str, Any]) -> Awaitable[Any]:
+        if inspect.iscoroutinefunction(handler):
+            return handler(event)
+        return asyncio.to_thread(handler, event)
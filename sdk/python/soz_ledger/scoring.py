@@ -0,0 +1,426 @@
+"""Local trust-score computation.
+
+:class:`ScoringEngine` computes :class:`~soz_ledger.models.TrustScore`
+values from a promise history held by the caller, for what-if analysis
+("how would these pending outcomes move the score?") and offline scoring
+without a request per entity::
+
+    engine = ScoringEngine(half_life_days=30)
+    history = [Outcome.from_promise(p) for p in promises]
+    current, if_broken = engine.what_if("agent_1", history, [[Outcome("broken")]])
+
+    scores = engine.score_many({agent_id: history, ...})
+
+The production scoring model is not published (see
+``docs/trust-levels.md``). Without ``half_life_days`` the engine reproduces
+the plain fulfillment ratio served by :mod:`soz_ledger.local`; with it,
+outcomes are weighted by recency.
+
+With NumPy installed (the ``numpy`` extra), :meth:`ScoringEngine.score_many`
+is vectorized. Simulations that score the same histories many times should
+build an :class:`OutcomeTable` once and pass it to
+:meth:`ScoringEngine.score_table`, adding each scenario with
+:meth:`OutcomeTable.extend`, so the per-outcome conversion from Python
+objects is paid only once.
+"""
+
+from __future__ import annotations
+
+import itertools
+import operator
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
+
+from soz_ledger.models import Promise, TrustScore
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+# Statuses that resolve a promise and count towards the score.
+OUTCOMES = frozenset({"fulfilled", "broken", "expired"})
+
+# Resolved promises needed before an entity is rated.
+MIN_RATED_PROMISES = 5
+
+SCORE_VERSION = "local"
+
+# Lower bound of each level, highest first; see docs/trust-levels.md.
+LEVELS = (
+    (0.96, "Exceptional"),
+    (0.81, "Highly Trusted"),
+    (0.61, "Reliable"),
+    (0.31, "Developing"),
+    (0.0, "Low Trust"),
+)
+
+_DAY = 86_400.0
+
+# Integer status codes for the vectorized path.
+_ACTIVE, _FULFILLED, _BROKEN, _EXPIRED = range(4)
+_STATUS_CODES = {"fulfilled": _FULFILLED, "broken": _BROKEN, "expired": _EXPIRED}
+_STATUS, _CATEGORY, _RESOLVED_AT, _DELAY = map(operator.itemgetter, range(4))
+
+
+def trust_level(score: float | None) -> str:
+    """Return the trust level name for ``score``."""
+    if score is None:
+        return "Unrated"
+    rounded = round(score, 2)
+    return next(name for bound, name in LEVELS if rounded >= bound)
+
+
+def _timestamp(value: str | None) -> float | None:
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+class Outcome(NamedTuple):
+    """One promise in an entity's history, reduced to what scoring needs.
+
+    ``resolved_at`` is the resolution time in Unix seconds, or ``None`` for
+    "now", which suits hypothetical outcomes. ``delay_hours`` is how late a
+    fulfilled promise was, if it had a deadline.
+    """
+
+    status: str
+    category: str = "custom"
+    resolved_at: float | None = None
+    delay_hours: float | None = None
+
+    @classmethod
+    def from_promise(cls, promise: Promise | Mapping[str, Any]) -> Outcome:
+        """Build an outcome from a :class:`Promise` or a promise dict.
+
+        The resolution time is ``updated_at`` when present (promise dicts
+        from the API), then ``fulfilled_at``, then the deadline for broken
+        or expired promises.
+        """
+        get = promise.get if isinstance(promise, Mapping) else (
+            lambda name, default=None: getattr(promise, name, default)
+        )
+        fulfilled_at = _timestamp(get("fulfilled_at"))
+        deadline = _timestamp(get("deadline"))
+        delay = None
+        if fulfilled_at is not None and deadline is not None:
+            delay = max(0.0, (fulfilled_at - deadline) / 3600)
+        resolved_at = _timestamp(get("updated_at")) or fulfilled_at or deadline
+        return cls(
+            status=get("status", "active"),
+            category=get("category", "custom"),
+            resolved_at=resolved_at,
+            delay_hours=delay,
+        )
+
+
+class OutcomeTable:
+    """Many entities' outcomes held as NumPy columns, ready for scoring.
+
+    Build one with :meth:`from_histories`; rows keep the order of each
+    history, which breaks ties between outcomes resolved at the same time.
+    Requires NumPy.
+    """
+
+    def __init__(
+        self,
+        entity_ids: list[str],
+        entity: Any,
+        status: Any,
+        category: Any,
+        category_names: list[str],
+        resolved_at: Any,
+        delay: Any,
+    ) -> None:
+        self.entity_ids = entity_ids
+        self.entity = entity
+        self.status = status
+        self.category = category
+        self.category_names = category_names
+        self.resolved_at = resolved_at
+        self.delay = delay
+
+    @classmethod
+    def from_histories(cls, histories: Mapping[str, Iterable[Outcome]]) -> OutcomeTable:
+        """Build a table from outcome lists keyed by entity ID."""
+        if np is None:
+            raise ImportError("OutcomeTable requires NumPy; install soz-ledger[numpy]")
+        histories = {eid: list(outcomes) for eid, outcomes in histories.items()}
+        return cls._build(list(histories), histories.values(), [])
+
+    def extend(self, extra: Mapping[str, Iterable[Outcome]]) -> OutcomeTable:
+        """Return a new table with ``extra`` outcomes appended.
+
+        Entities not in the table yet are added after the existing ones.
+        """
+        known = set(self.entity_ids)
+        entity_ids = self.entity_ids + [eid for eid in extra if eid not in known]
+        index = {eid: i for i, eid in enumerate(entity_ids)}
+        extra = {eid: list(outcomes) for eid, outcomes in extra.items()}
+        added = self._build(
+            entity_ids, extra.values(), self.category_names, [index[eid] for eid in extra]
+        )
+        return OutcomeTable(
+            entity_ids,
+            np.concatenate((self.entity, added.entity)),
+            np.concatenate((self.status, added.status)),
+            np.concatenate((self.category, added.category)),
+            added.category_names,
+            np.concatenate((self.resolved_at, added.resolved_at)),
+            np.concatenate((self.delay, added.delay)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.entity)
+
+    @staticmethod
+    def _build(
+        entity_ids: list[str],
+        histories: Iterable[list[Outcome]],
+        category_names: list[str],
+        rows_for: list[int] | None = None,
+    ) -> OutcomeTable:
+        # Columns are read with C-level ``map`` calls rather than a Python
+        # loop per row; ``None`` times and delays become NaN.
+        histories = list(histories)
+        counts = np.fromiter(map(len, histories), dtype=np.int64, count=len(histories))
+        owners = np.arange(len(histories)) if rows_for is None else np.array(rows_for)
+        flat = list(itertools.chain.from_iterable(histories))
+        n = len(flat)
+        status = np.fromiter(
+            map(_STATUS_CODES.get, map(_STATUS, flat), itertools.repeat(_ACTIVE)),
+            dtype=np.int8,
+            count=n,
+        )
+        categories = list(map(_CATEGORY, flat))
+        category_names = list(dict.fromkeys(itertools.chain(category_names, categories)))
+        codes = {name: code for code, name in enumerate(category_names)}
+        return OutcomeTable(
+            entity_ids,
+            np.repeat(owners, counts),
+            status,
+            np.fromiter(map(codes.__getitem__, categories), dtype=np.int64, count=n),
+            category_names,
+            np.array(list(map(_RESOLVED_AT, flat)), dtype=np.float64),
+            np.array(list(map(_DELAY, flat)), dtype=np.float64),
+        )
+
+
+class ScoringEngine:
+    """Computes trust scores from local promise histories.
+
+    Args:
+        half_life_days: Age in days at which an outcome counts half as much
+            as one resolved now, or ``None`` to weight every outcome
+            equally.
+        min_rated: Resolved promises needed before a score is given.
+        clock: Wall-clock time source, in seconds; ages are measured from
+            it and outcomes without ``resolved_at`` are placed at it.
+    """
+
+    def __init__(
+        self,
+        half_life_days: float | None = None,
+        min_rated: int = MIN_RATED_PROMISES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if half_life_days is not None and half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        self._half_life = half_life_days
+        self._min_rated = min_rated
+        self._clock = clock
+
+    def score(self, entity_id: str, outcomes: Iterable[Outcome]) -> TrustScore:
+        """Score one entity's history."""
+        now = self._clock()
+        outcomes = list(outcomes)
+        resolved = sorted(
+            (o for o in outcomes if o.status in OUTCOMES),
+            key=lambda o: now if o.resolved_at is None else o.resolved_at,
+        )
+        weighted = weight_sum = 0.0
+        by_category: dict[str, list[float]] = {}
+        delays: list[float] = []
+        for outcome in resolved:
+            weight = self._weight(outcome.resolved_at, now)
+            kept = outcome.status == "fulfilled"
+            weighted += weight * kept
+            weight_sum += weight
+            counts = by_category.setdefault(outcome.category, [0.0, 0.0])
+            counts[0] += weight * kept
+            counts[1] += weight
+            if kept and outcome.delay_hours is not None:
+                delays.append(outcome.delay_hours)
+        streak = 0
+        for outcome in reversed(resolved):
+            if outcome.status != "fulfilled":
+                break
+            streak += 1
+
+        return self._trust_score(
+            entity_id,
+            total=len(outcomes),
+            resolved=len(resolved),
+            fulfilled=sum(o.status == "fulfilled" for o in resolved),
+            broken=sum(o.status == "broken" for o in resolved),
+            ratio=weighted / weight_sum if weight_sum else 0.0,
+            categories={c: kept / n for c, (kept, n) in by_category.items() if n},
+            delay=sum(delays) / len(delays) if delays else 0.0,
+            streak=streak,
+        )
+
+    def what_if(
+        self,
+        entity_id: str,
+        history: Sequence[Outcome],
+        scenarios: Iterable[Iterable[Outcome]],
+    ) -> list[TrustScore]:
+        """Score ``history`` as is and with each scenario's outcomes added.
+
+        Returns the current score followed by one score per scenario.
+        """
+        history = list(history)
+        return [self.score(entity_id, history)] + [
+            self.score(entity_id, history + list(extra)) for extra in scenarios
+        ]
+
+    def score_many(
+        self, histories: Mapping[str, Iterable[Outcome]]
+    ) -> dict[str, TrustScore]:
+        """Score many entities at once, vectorized when NumPy is installed."""
+        if np is None:
+            return {eid: self.score(eid, outcomes) for eid, outcomes in histories.items()}
+        return self.score_table(OutcomeTable.from_histories(histories))
+
+    def score_table(self, table: OutcomeTable) -> dict[str, TrustScore]:
+        """Score every entity in ``table``."""
+        n_entities = len(table.entity_ids)
+        n_categories = len(table.category_names)
+        now = self._clock()
+        totals = np.bincount(table.entity, minlength=n_entities)
+
+        # Keep resolved outcomes only, in table order.
+        mask = table.status != _ACTIVE
+        entity, status, category = table.entity[mask], table.status[mask], table.category[mask]
+        resolved_at, delay = table.resolved_at[mask], table.delay[mask]
+        resolved_at = np.where(np.isnan(resolved_at), now, resolved_at)
+
+        kept = status == _FULFILLED
+        if self._half_life is None:
+            weight = np.ones(len(entity))
+        else:
+            age_days = np.maximum(now - resolved_at, 0.0) / _DAY
+            weight = 0.5 ** (age_days / self._half_life)
+
+        resolved = np.bincount(entity, minlength=n_entities)
+        fulfilled = np.bincount(entity[kept], minlength=n_entities)
+        broken = np.bincount(entity[status == _BROKEN], minlength=n_entities)
+        weight_sum = np.bincount(entity, weights=weight, minlength=n_entities)
+        weight_kept = np.bincount(entity[kept], weights=weight[kept], minlength=n_entities)
+
+        cells = n_entities * n_categories
+        cell = entity * n_categories + category
+        cell_sum = np.bincount(cell, weights=weight, minlength=cells)
+        cell_kept = np.bincount(cell[kept], weights=weight[kept], minlength=cells)
+        cell_seen = np.bincount(cell, minlength=cells).reshape(n_entities, n_categories)
+
+        timed = kept & ~np.isnan(delay)
+        delay_sum = np.bincount(entity[timed], weights=delay[timed], minlength=n_entities)
+        delay_count = np.bincount(entity[timed], minlength=n_entities)
+
+        # Streak: fulfilled outcomes resolved after the entity's last other
+        # outcome, breaking time ties by row like the stable sort in :meth:`score`.
+        row = np.arange(len(entity))
+        miss = ~kept
+        last_time = np.full(n_entities, -np.inf)
+        np.maximum.at(last_time, entity[miss], resolved_at[miss])
+        at_last = miss & (resolved_at == last_time[entity])
+        last_row = np.full(n_entities, -1)
+        np.maximum.at(last_row, entity[at_last], row[at_last])
+        after = kept & (
+            (resolved_at > last_time[entity])
+            | ((resolved_at == last_time[entity]) & (row > last_row[entity]))
+        )
+        streak = np.bincount(entity[after], minlength=n_entities)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(weight_sum > 0, weight_kept / weight_sum, 0.0)
+            category_ratio = (cell_kept / cell_sum).reshape(n_entities, n_categories)
+            mean_delay = np.where(delay_count > 0, delay_sum / delay_count, 0.0)
+
+        columns = zip(
+            table.entity_ids,
+            totals.tolist(),
+            resolved.tolist(),
+            fulfilled.tolist(),
+            broken.tolist(),
+            ratio.tolist(),
+            mean_delay.tolist(),
+            streak.tolist(),
+            (cell_seen > 0).tolist(),
+            category_ratio.tolist(),
+        )
+        return {
+            entity_id: self._trust_score(
+                entity_id,
+                total=total,
+                resolved=n_resolved,
+                fulfilled=n_fulfilled,
+                broken=n_broken,
+                ratio=entity_ratio,
+                categories={
+                    name: value
+                    for name, present, value in zip(table.category_names, seen, by_category)
+                    if present and value == value
+                },
+                delay=entity_delay,
+                streak=entity_streak,
+            )
+            for (
+                entity_id, total, n_resolved, n_fulfilled, n_broken,
+                entity_ratio, entity_delay, entity_streak, seen, by_category,
+            ) in columns
+        }
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _weight(self, resolved_at: float | None, now: float) -> float:
+        if self._half_life is None or resolved_at is None:
+            return 1.0
+        age_days = max(0.0, now - resolved_at) / _DAY
+        return 0.5 ** (age_days / self._half_life)
+
+    def _trust_score(
+        self,
+        entity_id: str,
+        *,
+        total: int,
+        resolved: int,
+        fulfilled: int,
+        broken: int,
+        ratio: float,
+        categories: dict[str, float],
+        delay: float,
+        streak: int,
+    ) -> TrustScore:
+        rated = resolved >= self._min_rated
+        score = round(ratio, 4) if rated else None
+        return TrustScore(
+            entity_id=entity_id,
+            overall_score=score,
+            level=trust_level(score),
+            rated=rated,
+            total_promises=total,
+            fulfilled_count=fulfilled,
+            broken_count=broken,
+            avg_delay_hours=round(delay, 2),
+            category_scores={c: round(categories[c], 4) for c in sorted(categories)} or None,
+            streak=streak,
+            score_version=SCORE_VERSION,
+        )
@@ -0,0 +1,147 @@
+"""Webhook signatures.
+
+Every webhook delivery carries an HMAC-SHA256 hex digest of the raw request
+body, keyed with the webhook's secret, in the ``X-SozLedger-Signature``
+header, and the event timestamp in ``X-SozLedger-Timestamp`` (see
+``docs/webhooks.md``).
+
+:func:`verify_signature` checks a single delivery. Receivers handling bursts
+should keep a :class:`SignatureVerifier`, which prepares the HMAC key state
+once per secret, accepts several secrets during a rotation, can reject stale
+timestamps and verifies batches of bodies, optionally on a thread pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+SIGNATURE_HEADER = "X-SozLedger-Signature"
+TIMESTAMP_HEADER = "X-SozLedger-Timestamp"
+
+# (body, signature, timestamp) as received.
+Delivery = tuple[bytes, str | None, str | None]
+
+
+def sign(body: bytes, secret: str) -> str:
+    """Return the signature the ledger sends for ``body``."""
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: str | None, secret: str) -> bool:
+    """Check ``signature`` against ``body`` in constant time."""
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(body, secret), signature)
+
+
+class SignatureVerifier:
+    """Verifies deliveries against one or more active secrets.
+
+    Args:
+        secrets: The webhook signing secret, or several while rotating; a
+            delivery signed with any of them is accepted.
+        max_age: Reject deliveries whose ``X-SozLedger-Timestamp`` is more
+            than this many seconds old, or ``None`` to skip the check.
+            Retries keep the event's original timestamp, so use at least
+            ``54_000`` (15 hours) to accept the whole retry schedule.
+        max_skew: Seconds a timestamp may lie in the future when ``max_age``
+            is set, to allow for clock drift.
+        threads: Size of the thread pool :meth:`verify_many` uses for large
+            bodies; ``0`` verifies everything on the calling thread.
+        parallel_threshold: Bodies at least this many bytes long are
+            verified on the pool. ``hashlib`` releases the GIL while hashing
+            large inputs, so only those gain from threads.
+        clock: Wall-clock time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        secrets: str | Sequence[str],
+        max_age: float | None = None,
+        max_skew: float = 300.0,
+        threads: int = 0,
+        parallel_threshold: int = 65_536,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._keys: dict[str, hmac.HMAC] = {}
+        for secret in [secrets] if isinstance(secrets, str) else secrets:
+            self.add_secret(secret)
+        if not self._keys:
+            raise ValueError("at least one secret is required")
+        self._max_age = max_age
+        self._max_skew = max_skew
+        self._parallel_threshold = parallel_threshold
+        self._clock = clock
+        self._pool = ThreadPoolExecutor(threads, "soz-ledger-verify") if threads else None
+
+    @property
+    def checks_timestamps(self) -> bool:
+        return self._max_age is not None
+
+    def add_secret(self, secret: str) -> None:
+        """Start accepting deliveries signed with ``secret``."""
+        self._keys[secret] = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+    def remove_secret(self, secret: str) -> None:
+        """Stop accepting ``secret``, e.g. once a rotation has finished."""
+        if len(self._keys) == 1 and secret in self._keys:
+            raise ValueError("cannot remove the last secret")
+        self._keys.pop(secret, None)
+
+    def verify(
+        self, body: bytes, signature: str | None, timestamp: str | None = None
+    ) -> bool:
+        """Check one delivery's signature and, if enabled, its timestamp."""
+        if not signature or not self._fresh(timestamp):
+            return False
+        try:
+            expected = bytes.fromhex(signature)
+        except ValueError:
+            return False
+        valid = False
+        for key in list(self._keys.values()):
+            mac = key.copy()
+            mac.update(body)
+            # Check every secret so timing does not reveal which one matched.
+            valid |= hmac.compare_digest(mac.digest(), expected)
+        return valid
+
+    def verify_many(self, deliveries: Iterable[Delivery]) -> list[bool]:
+        """Verify ``(body, signature, timestamp)`` triples, in order."""
+        deliveries = list(deliveries)
+        if self._pool is None:
+            return [self.verify(*delivery) for delivery in deliveries]
+        results: list[bool | None] = [None] * len(deliveries)
+        futures = {}
+        for i, delivery in enumerate(deliveries):
+            if len(delivery[0]) >= self._parallel_threshold:
+                futures[i] = self._pool.submit(self.verify, *delivery)
+            else:
+                results[i] = self.verify(*delivery)
+        for i, future in futures.items():
+            results[i] = future.result()
+        return results
+
+    def close(self) -> None:
+        """Shut down the thread pool, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def _fresh(self, timestamp: str | None) -> bool:
+        if self._max_age is None:
+            return True
+        if not timestamp:
+            return False
+        try:
+            sent = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return False
+        if sent.tzinfo is None:
+            return False
+        age = self._clock() - sent.timestamp()
+        return -self._max_skew <= age <= self._max_age
@@ -0,0 +1,423 @@
+"""Write-behind queue for fire-and-forget ledger recording.
+
+Operations are accepted into a bounded in-memory queue and sent by a
+background thread, so callers on a latency-sensitive path (an agent's tool
+call, for example) never wait on the ledger::
+
+    writer = WriteBehindQueue(client)
+    writer.submit_evidence(promise.id, type="api_callback", submitted_by=agent_id)
+    writer.fulfill(promise.id)
+    ...
+    writer.close()  # flushes everything still queued
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from soz_ledger.client import _promise_payload
+from soz_ledger.errors import SozLedgerError
+
+if TYPE_CHECKING:
+    from soz_ledger.client import SozLedgerClient
+
+logger = logging.getLogger(__name__)
+
+_OVERFLOW_POLICIES = ("block", "drop", "spill")
+
+
+@dataclass
+class WriterStats:
+    """Counters describing what a :class:`WriteBehindQueue` has done.
+
+    ``queued`` counts operations accepted (into memory or the spill file),
+    ``sent`` and ``failed`` count operations the API accepted or rejected,
+    ``coalesced`` counts status updates superseded by a later update for the
+    same promise, and ``dropped`` / ``spilled`` count overflow outcomes.
+    """
+
+    queued: int = 0
+    sent: int = 0
+    failed: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    spilled: int = 0
+
+
+class WriteBehindQueue:
+    """Bounded queue of ledger writes drained by a background worker.
+
+    Each drain takes up to ``batch_size`` queued operations and sends them
+    with as few requests as possible: promise creations go through
+    ``promises.create_many``, status updates are coalesced per promise and
+    sent through ``promises.update_status_many``, and evidence is submitted
+    before any status change in the same drain. Completed promises queued
+    with :meth:`record` go through ``promises.record_many``.
+
+    Args:
+        client: The :class:`SozLedgerClient` used to send operations.
+        max_size: Maximum number of operations held in memory.
+        batch_size: Maximum number of operations sent per drain.
+        flush_interval: Seconds the worker waits for new work before
+            checking for spilled operations or shutdown.
+        overflow: What to do when the queue is full -- ``"block"`` the
+            caller, ``"drop"`` the operation, or ``"spill"`` it to
+            ``spill_path`` to be replayed once the queue is idle.
+        spill_path: JSON-lines file used by the ``"spill"`` policy.
+            Replayed operations that fail with a retryable error (network,
+            ``429`` or ``5xx``) are written back to it.
+        block_timeout: Maximum seconds to block under the ``"block"``
+            policy before dropping the operation (``None`` waits forever).
+        spill_retry_interval: Seconds to wait before replaying again after
+            a replay wrote operations back to ``spill_path``.
+    """
+
+    def __init__(
+        self,
+        client: SozLedgerClient,
+        max_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        overflow: str = "block",
+        spill_path: str | None = None,
+        block_timeout: float | None = None,
+        spill_retry_interval: float = 5.0,
+    ) -> None:
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {', '.join(_OVERFLOW_POLICIES)}"
+            )
+        if overflow == "spill" and spill_path is None:
+            raise ValueError("spill_path is required for the 'spill' policy")
+
+        self._client = client
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow = overflow
+        self._spill_path = spill_path
+        self._block_timeout = block_timeout
+        self._spill_retry_interval = spill_retry_interval
+        self._replay_after = 0.0
+
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._closed = False
+        self._stop = threading.Event()
+        self.stats = WriterStats()
+
+        self._thread = threading.Thread(
+            target=self._run, name="soz-ledger-writer", daemon=True
+        )
+        self._thread.start()
+
+    # ── Enqueue API ──────────────────────────────────────────────────────
+
+    def create_promise(
+        self,
+        promisor_id: str,
+        promisee_id: str,
+        description: str,
+        deadline: str | None = None,
+        category: str = "custom",
+    ) -> None:
+        data = _promise_payload(
+            promisor_id, promisee_id, description, deadline, category
+        )
+        self._put({"op": "create", "data": data})
+
+    def record(
+        self,
+        promisor_id: str,
+        promisee_id: str,
+        description: str,
+        status: str = "fulfilled",
+        evidence: Iterable[dict] | None = None,
+        deadline: str | None = None,
+        category: str = "custom",
+    ) -> None:
+        data: dict = {
+            "promisor_id": promisor_id,
+            "promisee_id": promisee_id,
+            "description": description,
+            "status": status,
+            "deadline": deadline,
+            "category": category,
+        }
+        if evidence is not None:
+            data["evidence"] = list(evidence)
+        self._put({"op": "record", "data": data})
+
+    def submit_evidence(
+        self,
+        promise_id: str,
+        type: str,
+        submitted_by: str,
+        payload: dict | None = None,
+    ) -> None:
+        data: dict = {"type": type, "submitted_by": submitted_by}
+        if payload is not None:
+            data["payload"] = payload
+        self._put({"op": "evidence", "promise_id": promise_id, "data": data})
+
+    def update_status(self, promise_id: str, status: str) -> None:
+        self._put({"op": "status", "promise_id": promise_id, "status": status})
+
+    def fulfill(self, promise_id: str) -> None:
+        self.update_status(promise_id, "fulfilled")
+
+    def break_promise(self, promise_id: str) -> None:
+        self.update_status(promise_id, "broken")
+
+    def dispute(self, promise_id: str) -> None:
+        self.update_status(promise_id, "disputed")
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every in-memory operation has been sent.
+
+        Returns ``False`` if ``timeout`` elapsed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop accepting operations, send everything queued, stop the worker."""
+        with self._lock:
+            self._closed = True
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def __enter__(self) -> WriteBehindQueue:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _put(self, op: dict) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WriteBehindQueue is closed")
+            self._pending += 1
+
+        try:
+            if self._overflow == "block":
+                self._queue.put(op, timeout=self._block_timeout)
+            else:
+                self._queue.put_nowait(op)
+        except queue.Full:
+            self._done(1)
+            if self._overflow == "spill":
+                self._spill(op)
+            else:
+                self._count(dropped=1)
+            return
+
+        self._count(queued=1)
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+    def _done(self, n: int) -> None:
+        with self._idle:
+            self._pending -= n
+            if not self._pending:
+                self._idle.notify_all()
+
+    def _spill(self, op: dict) -> None:
+        with self._lock:
+            with open(self._spill_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(op) + "\n")
+            self.stats.spilled += 1
+            self.stats.queued += 1
+
+    def _respill(self, ops: list[dict]) -> None:
+        with self._lock:
+            with open(self._spill_path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(op) + "\n" for op in ops)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain()
+            if batch:
+                try:
+                    self._send_batch(batch)
+                finally:
+                    self._done(len(batch))
+                continue
+
+            try:
+                self._replay_spill()
+            except Exception:
+                # The replay file stays on disk and is retried when next idle.
+                logger.exception("Write-behind spill replay failed")
+            if self._stop.is_set() and self._queue.empty():
+                return
+
+    def _drain(self) -> list[dict]:
+        try:
+            batch = [self._queue.get(timeout=self._flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _replay_spill(self) -> None:
+        if self._spill_path is None:
+            return
+        if time.monotonic() < self._replay_after and not self._stop.is_set():
+            return
+        replay_path = self._spill_path + ".replay"
+        with self._lock:
+            if os.path.exists(self._spill_path):
+                if os.path.exists(replay_path):
+                    # Left behind by a replay that failed part way; keep it.
+                    with open(self._spill_path, encoding="utf-8") as src, open(
+                        replay_path, "a", encoding="utf-8"
+                    ) as dst:
+                        dst.writelines(src)
+                    os.remove(self._spill_path)
+                else:
+                    os.replace(self._spill_path, replay_path)
+            elif not os.path.exists(replay_path):
+                return
+
+        retry: list[dict] = []
+        with open(replay_path, encoding="utf-8") as f:
+            batch: list[dict] = []
+            for line in f:
+                try:
+                    batch.append(json.loads(line))
+                except ValueError:
+                    logger.warning("Skipping corrupt spill line: %r", line[:200])
+                    self._count(failed=1)
+                    continue
+                if len(batch) == self._batch_size:
+                    self._send_batch(batch, retry)
+                    batch = []
+            if batch:
+                self._send_batch(batch, retry)
+        if retry:
+            # Written back before the replay file goes, so a crash in
+            # between can repeat operations but never lose them.
+            logger.warning("Write-behind replay: %d operations kept for retry", len(retry))
+            self._respill(retry)
+            self._replay_after = time.monotonic() + self._spill_retry_interval
+        os.remove(replay_path)
+
+    def _send_batch(self, batch: list[dict], retry: list[dict] | None = None) -> None:
+        """Send ``batch``, counting it as failed if sending raises.
+
+        Keeps the worker alive whatever the client raises, so :meth:`flush`
+        and blocking :meth:`_put` calls always make progress. With ``retry``
+        given, operations that fail with a retryable error are appended to
+        it instead of being counted as failed.
+        """
+        try:
+            self._send(batch, retry)
+        except Exception:
+            logger.exception("Write-behind batch of %d failed", len(batch))
+            self._count(failed=len(batch))
+
+    def _send(self, batch: list[dict], retry: list[dict] | None = None) -> None:
+        creates = [op for op in batch if op["op"] == "create"]
+        records = [op for op in batch if op["op"] == "record"]
+        evidence = [op for op in batch if op["op"] == "evidence"]
+        statuses: dict[str, dict] = {}
+        for op in batch:
+            if op["op"] == "status":
+                if op["promise_id"] in statuses:
+                    self._count(coalesced=1)
+                statuses[op["promise_id"]] = op
+
+        if creates:
+            self._send_many(
+                self._client.promises.create_many,
+                creates,
+                [op["data"] for op in creates],
+                retry,
+            )
+
+        if records:
+            self._send_many(
+                self._client.promises.record_many,
+                records,
+                [op["data"] for op in records],
+                retry,
+            )
+
+        for op in evidence:
+            try:
+                self._client.evidence.submit(op["promise_id"], **op["data"])
+            except Exception as exc:
+                logger.warning("Write-behind evidence submit failed: %s", exc)
+                self._failed([op], exc, retry)
+            else:
+                self._count(sent=1)
+
+        if statuses:
+            ops = list(statuses.values())
+            self._send_many(
+                self._client.promises.update_status_many,
+                ops,
+                [(op["promise_id"], op["status"]) for op in ops],
+                retry,
+            )
+
+    def _send_many(
+        self, method, ops: list[dict], items: list, retry: list[dict] | None
+    ) -> None:
+        try:
+            results = method(items)
+        except Exception as exc:
+            logger.warning("Write-behind batch of %d failed: %s", len(items), exc)
+            self._failed(ops, exc, retry)
+            return
+
+        failed = [(op, r) for op, r in zip(ops, results) if isinstance(r, SozLedgerError)]
+        if failed:
+            logger.warning(
+                "Write-behind batch: %d of %d items failed", len(failed), len(items)
+            )
+        for op, error in failed:
+            self._failed([op], error, retry)
+        self._count(sent=len(results) - len(failed))
+
+    def _failed(
+        self, ops: list[dict], exc: Exception, retry: list[dict] | None
+    ) -> None:
+        if retry is not None and _retryable(exc):
+            retry.extend(ops)
+        else:
+            self._count(failed=len(ops))
+
+
+def _retryable(exc: Exception) -> bool:
+    """Whether a failed send may succeed later: network, ``429`` or ``5xx``."""
+    return isinstance(exc, SozLedgerError) and (
+        exc.status in (0, 429) or exc.status >= 500
+    )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from soz_ledger.async_client import AsyncSozLedgerClient
 from soz_ledger.client import SozLedgerClient
 
 
@@ -104,15 +106,18 @@ ERROR_BODY = {
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def make_response(status_code: int, json_data=None):
-    """Build a mock httpx.Response with .is_success, .status_code, .json()."""
+def make_response(status_code: int, json_data=None, headers=None):
+    """Build a mock httpx.Response with .is_success, .status_code, .json(), .content, .headers."""
     resp = MagicMock()
     resp.status_code = status_code
     resp.is_success = 200 <= status_code < 300
+    resp.headers = headers or {}
     if json_data is not None:
         resp.json.return_value = json_data
+        resp.content = json.dumps(json_data).encode()
     else:
         resp.json.side_effect = Exception("No JSON body")
+        resp.content = b""
     return resp
 
 
@@ -127,3 +132,15 @@ def mock_client():
         MockHttpClass.return_value = mock_http
         client = SozLedgerClient("test_api_key")
         yield client, mock_http
+
+
+@pytest.fixture()
+def mock_async_client():
+    """Return (client, mock_http) where mock_http is the patched httpx.AsyncClient."""
+    with patch("soz_ledger.async_client.httpx.AsyncClient") as MockHttpClass:
+        mock_http = MagicMock()
+        mock_http.request = AsyncMock()
+        mock_http.aclose = AsyncMock()
+        MockHttpClass.return_value = mock_http
+        client = AsyncSozLedgerClient("test_api_key")
+        yield client, mock_http
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from soz_ledger.aggregator import ScoreAggregator
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.local import LocalLedger
+from soz_ledger.models import TrustScore
+
+
+def promise_event(event_type: str, promise_id: str, timestamp: str, **promise) -> dict:
+    promise = {
+        "id": promise_id,
+        "promisor_id": "agent_1",
+        "promisee_id": "user_1",
+        "category": "delivery",
+        "created_at": timestamp,
+        **promise,
+    }
+    return {
+        "event_type": event_type,
+        "event_id": f"{event_type}:{promise_id}",
+        "timestamp": timestamp,
+        "data": {"promise": promise},
+    }
+
+
+@pytest.fixture()
+def client():
+    client = MagicMock()
+    client.scores.get.return_value = TrustScore(
+        entity_id="agent_1",
+        total_promises=10,
+        fulfilled_count=8,
+        broken_count=1,
+        streak=3,
+        last_updated="2026-02-14T09:00:00Z",
+    )
+    return client
+
+
+@pytest.fixture()
+def aggregator(client):
+    aggregator = ScoreAggregator(client)
+    # First sighting: reconciled, and the event is part of the snapshot.
+    aggregator.handle_event(promise_event("promise.created", "p0", "2026-02-14T09:00:00Z"))
+    return aggregator
+
+
+class TestScoreAggregator:
+    def test_follows_local_ledger_without_polling(self):
+        clock = [datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)]
+        events = []
+        ledger = LocalLedger(
+            deliver=lambda url, body, headers: events.append(json.loads(body)) or 200,
+            clock=lambda: clock[0],
+        )
+        client = ledger.client()
+        a = client.entities.create(name="a", type="agent")
+        b = client.entities.create(name="b", type="agent")
+        client.webhooks.create(
+            url="https://example.com/hook",
+            event_types=[
+                "promise.created", "promise.fulfilled", "promise.broken", "score.updated"
+            ],
+        )
+        aggregator = ScoreAggregator(client, entity_ids=[a.id])
+        for status in ["fulfilled", "broken", "fulfilled", "fulfilled", "fulfilled", "fulfilled"]:
+            clock[0] += timedelta(seconds=1)
+            promise = client.promises.create(
+                promisor_id=a.id, promisee_id=b.id, description="d", category="payment"
+            )
+            clock[0] += timedelta(seconds=1)
+            client.promises.update_status_many([(promise.id, status)])
+            for event in events:
+                aggregator.handle_event(event)
+            events.clear()
+
+        served = client.scores.get(a.id)
+        live = aggregator.get(a.id)
+
+        assert (live.total_promises, live.fulfilled_count, live.broken_count, live.streak) == (
+            served.total_promises, served.fulfilled_count, served.broken_count, served.streak
+        )
+        assert live.overall_score == served.overall_score
+        assert aggregator.stats.reconciliations == 1
+        assert aggregator.stats.gaps == 0
+        assert aggregator.counts(a.id).categories["payment"].broken == 1
+
+    def test_events_update_counters(self, aggregator, client):
+        aggregator.handle_event(promise_event("promise.created", "p1", "2026-02-14T09:01:00Z"))
+        aggregator.handle_event(promise_event("promise.fulfilled", "p1", "2026-02-14T09:02:00Z"))
+        aggregator.handle_event(promise_event("promise.expired", "p0", "2026-02-14T09:03:00Z"))
+
+        score = aggregator.get("agent_1")
+        assert (score.total_promises, score.fulfilled_count, score.broken_count) == (11, 9, 1)
+        assert score.streak == 0
+        assert aggregator.counts("agent_1").categories["delivery"].expired == 1
+        client.scores.get.assert_called_once()
+
+    def test_duplicates_and_old_events_are_ignored(self, aggregator):
+        created = promise_event("promise.created", "p1", "2026-02-14T09:01:00Z")
+        aggregator.handle_event(created)
+        aggregator.handle_event(created)
+        aggregator.handle_event(
+            promise_event("promise.fulfilled", "p9", "2026-02-14T08:00:00Z",
+                          created_at="2026-02-14T07:00:00Z")
+        )
+
+        assert aggregator.get("agent_1").total_promises == 11
+        assert aggregator.stats.duplicates == 1
+        assert aggregator.stats.ignored == 1
+
+    def test_outcome_for_promise_created_before_snapshot_is_applied(self, aggregator, client):
+        aggregator.handle_event(
+            promise_event("promise.broken", "p9", "2026-02-14T09:05:00Z",
+                          created_at="2026-02-13T00:00:00Z")
+        )
+
+        assert aggregator.get("agent_1").broken_count == 2
+        assert aggregator.stats.gaps == 0
+
+    def test_missed_creation_triggers_reconciliation(self, aggregator, client):
+        aggregator.handle_event(promise_event("promise.fulfilled", "p5", "2026-02-14T09:05:00Z"))
+
+        assert aggregator.stats.gaps == 1
+        assert client.scores.get.call_count == 2
+
+    def test_mismatched_score_update_triggers_reconciliation(self, aggregator, client):
+        aggregator.handle_event(
+            {
+                "event_type": "score.updated",
+                "event_id": "s1",
+                "timestamp": "2026-02-14T09:05:00Z",
+                "data": {"entity_id": "agent_1", "new_score": 0.9, "new_level": "Highly Trusted",
+                         "total_promises": 12, "fulfilled_count": 9, "broken_count": 1},
+            }
+        )
+
+        assert aggregator.stats.gaps == 1
+        assert client.scores.get.call_count == 2
+
+    def test_matching_score_update_refreshes_score(self, aggregator, client):
+        aggregator.handle_event(
+            {
+                "event_type": "score.updated",
+                "event_id": "s1",
+                "timestamp": "2026-02-14T09:05:00Z",
+                "data": {"entity_id": "agent_1", "new_score": 0.8, "new_level": "Reliable",
+                         "is_rated": True, "total_promises": 10, "fulfilled_count": 8,
+                         "broken_count": 1},
+            }
+        )
+
+        score = aggregator.get("agent_1")
+        assert (score.overall_score, score.level, score.rated) == (0.8, "Reliable", True)
+        client.scores.get.assert_called_once()
+
+    def test_failed_reconciliation_is_retried(self, aggregator, client):
+        client.scores.get.side_effect = SozLedgerError(503, {"error": "unavailable"})
+        aggregator.handle_event(promise_event("promise.fulfilled", "p5", "2026-02-14T09:05:00Z"))
+        assert aggregator.counts("agent_1").stale
+
+        client.scores.get.side_effect = None
+        aggregator.handle_event(promise_event("promise.created", "p6", "2026-02-14T09:06:00Z"))
+
+        assert not aggregator.counts("agent_1").stale
+        assert aggregator.stats.reconcile_errors == 1
+        assert aggregator.stats.reconciliations == 2
+
+    def test_reconciliation_does_not_block_other_events(self, aggregator, client):
+        started, release = threading.Event(), threading.Event()
+        snapshot = client.scores.get.return_value
+
+        def slow_get(entity_id):
+            started.set()
+            release.wait(5)
+            return snapshot
+
+        client.scores.get.side_effect = slow_get
+        gap = threading.Thread(
+            target=aggregator.handle_event,
+            args=(promise_event("promise.fulfilled", "p5", "2026-02-14T09:05:00Z"),),
+        )
+        gap.start()
+        assert started.wait(5)
+
+        # Handled without waiting on the in-flight scores.get.
+        aggregator.handle_event(promise_event("promise.created", "p6", "2026-02-14T09:06:00Z"))
+        assert aggregator.get("agent_1").total_promises == 10
+        release.set()
+        gap.join(5)
+
+        assert aggregator.get("agent_1").total_promises == 11
+        assert client.scores.get.call_count == 2
+
+    def test_untracked_entities_are_ignored(self, client):
+        aggregator = ScoreAggregator(client, entity_ids=["agent_2"])
+        aggregator.handle_event(promise_event("promise.created", "p1", "2026-02-14T09:01:00Z"))
+
+        assert "agent_1" not in aggregator
+        client.scores.get.assert_not_called()
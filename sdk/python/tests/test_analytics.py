@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from soz_ledger.analytics import DeliveryAnalytics
+from soz_ledger.models import DeliveryLog, Webhook
+
+
+def log(
+    log_id: str,
+    event_id: str,
+    created_at: str,
+    attempt: int = 1,
+    success: bool = True,
+    next_retry_at: str | None = None,
+) -> DeliveryLog:
+    return DeliveryLog(
+        id=log_id,
+        webhook_id="wh_1",
+        event_id=event_id,
+        event_type="promise.fulfilled",
+        attempt_number=attempt,
+        status_code=200 if success else 500,
+        success=success,
+        next_retry_at=next_retry_at,
+        created_at=created_at,
+    )
+
+
+class FakeLogs:
+    """Serves ``iter_logs`` from a growing list, honouring inclusive ``since``."""
+
+    def __init__(self) -> None:
+        self.logs: list[DeliveryLog] = []
+        self.calls: list[str | None] = []
+
+    def __call__(self, webhook_id, page_size=100, since=None, limit=None):
+        self.calls.append(since)
+        return iter([entry for entry in self.logs if since is None or entry.created_at >= since])
+
+
+@pytest.fixture()
+def logs():
+    return FakeLogs()
+
+
+@pytest.fixture()
+def client(logs):
+    client = MagicMock()
+    client.webhooks.iter.return_value = iter([Webhook(id="wh_1", entity_id="ent_1", url="https://x")])
+    client.webhooks.iter_logs.side_effect = logs
+    return client
+
+
+class TestDeliveryAnalytics:
+    def test_success_rate_backlog_and_time_to_success(self, client, logs):
+        logs.logs = [
+            log("l1", "evt_1", "2026-02-14T09:00:00Z"),
+            log("l2", "evt_2", "2026-02-14T09:00:00Z", success=False,
+                next_retry_at="2026-02-14T09:01:00Z"),
+            log("l3", "evt_3", "2026-02-14T09:00:30Z", success=False,
+                next_retry_at="2026-02-14T09:01:30Z"),
+            log("l4", "evt_2", "2026-02-14T09:01:00Z", attempt=2),
+        ]
+
+        stats = DeliveryAnalytics(client).refresh()["wh_1"]
+
+        assert stats.attempts == 4
+        assert stats.success_rate == 0.5
+        assert stats.attempt_distribution == {1: 3, 2: 1}
+        assert stats.pending_retries == 1
+        assert stats.delivered_events == 2
+        assert stats.mean_time_to_success == 30.0
+        assert stats.max_time_to_success == 60.0
+
+    def test_refresh_reads_only_new_logs(self, client, logs):
+        analytics = DeliveryAnalytics(client)
+        logs.logs = [log("l1", "evt_1", "2026-02-14T09:00:00Z")]
+        analytics.refresh(["wh_1"])
+
+        logs.logs.append(log("l2", "evt_2", "2026-02-14T09:00:00Z"))
+        logs.logs.append(log("l3", "evt_3", "2026-02-14T09:05:00Z"))
+        stats = analytics.refresh(["wh_1"])["wh_1"]
+
+        assert logs.calls == [None, "2026-02-14T09:00:00Z"]
+        assert stats.attempts == 3
+
+    def test_newest_first_logs_are_not_counted_twice(self, client, logs):
+        analytics = DeliveryAnalytics(client)
+        logs.logs = [
+            log("l3", "evt_3", "2026-02-14T09:05:00Z"),
+            log("l2", "evt_2", "2026-02-14T09:05:00Z"),
+            log("l1", "evt_1", "2026-02-14T09:00:00Z"),
+        ]
+        analytics.refresh(["wh_1"])
+
+        logs.logs.insert(0, log("l4", "evt_4", "2026-02-14T09:10:00Z"))
+        stats = analytics.refresh(["wh_1"])["wh_1"]
+
+        assert logs.calls == [None, "2026-02-14T09:05:00Z"]
+        assert stats.attempts == 4
+        assert stats.attempt_distribution == {1: 4}
+        assert analytics.refresh(["wh_1"])["wh_1"].attempts == 4
+
+    def test_exhausted_retries_leave_the_backlog(self, client, logs):
+        logs.logs = [
+            log("l1", "evt_1", "2026-02-14T09:00:00Z", success=False,
+                next_retry_at="2026-02-14T09:01:00Z"),
+            log("l2", "evt_1", "2026-02-14T21:00:00Z", attempt=6, success=False),
+        ]
+
+        stats = DeliveryAnalytics(client).refresh(["wh_1"])["wh_1"]
+
+        assert stats.pending_retries == 0
+        assert stats.exhausted_events == 1
+
+    def test_resumes_from_checkpoint(self, client, logs):
+        logs.logs = [
+            log("l1", "evt_1", "2026-02-14T09:00:00Z", success=False,
+                next_retry_at="2026-02-14T09:01:00Z"),
+        ]
+        first = DeliveryAnalytics(client)
+        first.refresh(["wh_1"])
+        checkpoint = json.loads(json.dumps(first.checkpoint()))
+
+        logs.logs.append(log("l2", "evt_1", "2026-02-14T09:01:00Z", attempt=2))
+        stats = DeliveryAnalytics(client, checkpoint=checkpoint).refresh(["wh_1"])["wh_1"]
+
+        assert stats.attempts == 2
+        assert stats.attempt_distribution == {1: 1, 2: 1}
+        assert stats.pending_retries == 0
+        assert stats.mean_time_to_success == 60.0
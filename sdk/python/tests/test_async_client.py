@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from soz_ledger.async_client import AsyncSozLedgerClient
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.models import (
+    DeliveryLog,
+    Entity,
+    Evidence,
+    Promise,
+    RecordedPromise,
+    ScoreHistoryResponse,
+    TrustScore,
+    WebhookWithSecret,
+)
+from tests.conftest import (
+    DELIVERY_LOG_DATA,
+    ENTITY_DATA,
+    ERROR_BODY,
+    EVIDENCE_DATA,
+    PROMISE_DATA,
+    SCORE_DATA,
+    SCORE_HISTORY_DATA,
+    WEBHOOK_WITH_SECRET_DATA,
+    make_response,
+)
+
+
+class TestAsyncConstructor:
+    def test_httpx_async_client_init_args(self):
+        with patch("soz_ledger.async_client.httpx.AsyncClient") as MockHttp:
+            MockHttp.return_value = MagicMock()
+            client = AsyncSozLedgerClient(
+                "my_key", base_url="https://api.test.com/", timeout=10.0
+            )
+
+        assert client._base_url == "https://api.test.com"
+        MockHttp.assert_called_once_with(
+            base_url="https://api.test.com",
+            headers={"Authorization": "Bearer my_key"},
+            timeout=10.0,
+        )
+
+    def test_fan_out_follows_pool_limit(self):
+        limited = AsyncSozLedgerClient("key", limits=httpx.Limits(max_connections=7))
+        unbounded = AsyncSozLedgerClient("key", limits=httpx.Limits(max_connections=None))
+
+        assert limited._max_connections == 7
+        assert unbounded._max_connections == 100
+
+    def test_shared_transport_outlives_client(self):
+        transport = MagicMock(spec=httpx.AsyncBaseTransport)
+        transport.aclose = AsyncMock()
+
+        async def run():
+            async with AsyncSozLedgerClient("key", transport=transport):
+                pass
+
+        asyncio.run(run())
+
+        transport.aclose.assert_not_awaited()
+
+
+class TestAsyncSubAPIs:
+    def test_entities_create(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.return_value = make_response(201, ENTITY_DATA)
+
+        entity = asyncio.run(client.entities.create(name="test-agent", type="agent"))
+
+        mock_http.request.assert_awaited_once_with(
+            "POST", "/v1/entities", json={"name": "test-agent", "type": "agent"}
+        )
+        assert isinstance(entity, Entity)
+
+    def test_promises_create_and_fulfill(self, mock_async_client):
+        client, mock_http = mock_async_client
+        fulfilled = {**PROMISE_DATA, "status": "fulfilled"}
+        mock_http.request.side_effect = [
+            make_response(201, PROMISE_DATA),
+            make_response(200, fulfilled),
+        ]
+
+        async def run():
+            p = await client.promises.create(
+                promisor_id="a", promisee_id="b", description="d"
+            )
+            return await client.promises.fulfill(p.id)
+
+        p = asyncio.run(run())
+
+        mock_http.request.assert_awaited_with(
+            "PATCH", "/v1/promises/prm_abc123/status", json={"status": "fulfilled"}
+        )
+        assert isinstance(p, Promise)
+        assert p.status == "fulfilled"
+
+    def test_evidence_list(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.return_value = make_response(200, [EVIDENCE_DATA])
+
+        items = asyncio.run(client.evidence.list("prm_abc123"))
+
+        assert len(items) == 1
+        assert isinstance(items[0], Evidence)
+
+    def test_scores_get_and_history(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.side_effect = [
+            make_response(200, SCORE_DATA),
+            make_response(200, SCORE_HISTORY_DATA),
+        ]
+
+        async def run():
+            return (
+                await client.scores.get("ent_abc123"),
+                await client.scores.history("ent_abc123"),
+            )
+
+        score, history = asyncio.run(run())
+
+        assert isinstance(score, TrustScore)
+        assert isinstance(history, ScoreHistoryResponse)
+        assert len(history.history) == 2
+
+    def test_webhooks_create_logs_delete(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.side_effect = [
+            make_response(201, WEBHOOK_WITH_SECRET_DATA),
+            make_response(200, [DELIVERY_LOG_DATA]),
+            make_response(204, None),
+        ]
+
+        async def run():
+            wh = await client.webhooks.create(
+                url="https://example.com/webhook", event_types=["promise.created"]
+            )
+            logs = await client.webhooks.logs(wh.id)
+            deleted = await client.webhooks.delete(wh.id)
+            return wh, logs, deleted
+
+        wh, logs, deleted = asyncio.run(run())
+
+        assert isinstance(wh, WebhookWithSecret)
+        assert isinstance(logs[0], DeliveryLog)
+        assert deleted is None
+
+    def test_concurrent_requests_share_one_client(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.return_value = make_response(200, PROMISE_DATA)
+
+        async def run():
+            return await asyncio.gather(
+                *(client.promises.get(f"prm_{i}") for i in range(20))
+            )
+
+        results = asyncio.run(run())
+
+        assert len(results) == 20
+        assert mock_http.request.await_count == 20
+
+
+class TestAsyncErrorHandling:
+    def test_http_error_raises_soz_ledger_error(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.return_value = make_response(404, ERROR_BODY)
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            asyncio.run(client.entities.get("missing"))
+
+        assert exc_info.value.status == 404
+        assert exc_info.value.code == "not_found"
+
+    def test_timeout_raises_soz_ledger_error(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.side_effect = httpx.TimeoutException("timed out")
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            asyncio.run(client.entities.get("slow"))
+
+        assert exc_info.value.status == 0
+        assert exc_info.value.code == "timeout"
+
+    def test_network_error_raises_soz_ledger_error(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.side_effect = httpx.ConnectError("connection refused")
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            asyncio.run(client.entities.get("down"))
+
+        assert exc_info.value.code == "network_error"
+
+
+class TestAsyncContextManager:
+    def test_context_manager_closes(self):
+        with patch("soz_ledger.async_client.httpx.AsyncClient") as MockHttp:
+            mock_http = MagicMock()
+            mock_http.aclose = AsyncMock()
+            MockHttp.return_value = mock_http
+
+            async def run():
+                async with AsyncSozLedgerClient("key") as client:
+                    assert client is not None
+
+            asyncio.run(run())
+            mock_http.aclose.assert_awaited_once()
+
+
+class TestAsyncBatch:
+    def test_create_many_returns_per_item_results(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.return_value = make_response(
+            200,
+            {
+                "results": [
+                    {"index": 0, "status": 201, "data": PROMISE_DATA},
+                    {"index": 1, "status": 422, "error": ERROR_BODY},
+                ]
+            },
+        )
+
+        results = asyncio.run(
+            client.promises.create_many(
+                [
+                    {"promisor_id": "a", "promisee_id": "b", "description": "d"},
+                    {"promisor_id": "a", "promisee_id": "a", "description": "d"},
+                ]
+            )
+        )
+
+        assert isinstance(results[0], Promise)
+        assert isinstance(results[1], SozLedgerError)
+        assert mock_http.request.await_args.args == ("POST", "/v1/promises:batchCreate")
+
+    def test_record_sends_one_request(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.return_value = make_response(
+            201, {"promise": PROMISE_DATA, "evidence": [EVIDENCE_DATA]}
+        )
+
+        recorded = asyncio.run(
+            client.promises.record(
+                "a", "b", "d", evidence=[{"type": "manual", "submitted_by": "a"}]
+            )
+        )
+
+        assert isinstance(recorded, RecordedPromise)
+        assert isinstance(recorded.evidence[0], Evidence)
+        assert mock_http.request.await_args.args == ("POST", "/v1/promises:record")
+        assert mock_http.request.await_args.kwargs["json"]["status"] == "fulfilled"
+
+    def test_scores_get_many_fans_out_chunks(self, mock_async_client):
+        client, mock_http = mock_async_client
+        in_flight = 0
+        peak = 0
+
+        async def respond(method, path, json):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return make_response(
+                200,
+                {
+                    "results": [
+                        {"index": i, "status": 200, "data": {"entity_id": eid}}
+                        for i, eid in enumerate(json["entity_ids"])
+                    ]
+                },
+            )
+
+        mock_http.request.side_effect = respond
+
+        scores = asyncio.run(
+            client.scores.get_many([f"e{i}" for i in range(6)], chunk_size=2)
+        )
+
+        assert list(scores) == [f"e{i}" for i in range(6)]
+        assert mock_http.request.await_count == 3
+        assert peak == 3
+
+    def test_scores_get_many_covers_ids_missing_from_response(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.return_value = make_response(
+            200, {"results": [{"index": 0, "status": 200, "data": {"entity_id": "e0"}}]}
+        )
+
+        scores = asyncio.run(client.scores.get_many(["e0", "e1"]))
+
+        assert list(scores) == ["e0", "e1"]
+        assert isinstance(scores["e1"], SozLedgerError)
+
+    def test_scores_get_many_is_bounded_by_the_pool(self, mock_async_client):
+        client, mock_http = mock_async_client
+        client._max_connections = 2
+        in_flight = 0
+        peak = 0
+
+        async def respond(method, path, json):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return make_response(200, {"results": []})
+
+        mock_http.request.side_effect = respond
+
+        asyncio.run(client.scores.get_many([f"e{i}" for i in range(10)], chunk_size=1))
+
+        assert mock_http.request.await_count == 10
+        assert peak == 2
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+RUNNER = Path(__file__).resolve().parent.parent / "benchmarks" / "run.py"
+
+
+def load_runner():
+    spec = importlib.util.spec_from_file_location("benchmark_runner", RUNNER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBenchmarkRunner:
+    def test_writes_results_json(self, tmp_path):
+        runner = load_runner()
+        output = tmp_path / "results.json"
+
+        assert runner.main(
+            ["--lifecycles", "10", "--concurrency", "2", "--objects", "100",
+             "--output", str(output)]
+        ) == 0
+
+        results = json.loads(output.read_text())["results"]
+        assert results["sync"]["lifecycles_per_sec"] > 0
+        assert set(results["sync"]["create"]) == {"p50_ms", "p99_ms"}
+        assert results["memory"]["objects"] == 100
+
+    def test_compare_flags_regressions_in_both_directions(self):
+        runner = load_runner()
+        baseline = {"results": {"sync": {"lifecycles_per_sec": 100.0, "create": {"p99_ms": 1.0}}}}
+        current = {"results": {"sync": {"lifecycles_per_sec": 50.0, "create": {"p99_ms": 2.0}}}}
+
+        regressions = runner.compare(current, baseline, tolerance=0.2)
+
+        assert len(regressions) == 2
+        assert runner.compare(baseline, baseline, tolerance=0.2) == []
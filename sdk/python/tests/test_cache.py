@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from soz_ledger.cache import TrustScoreCache
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.models import TrustScore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def client():
+    client = MagicMock()
+    client.scores.get.side_effect = lambda eid: TrustScore(entity_id=eid)
+    return client
+
+
+class TestTrustScoreCache:
+    def test_hit_within_ttl(self, client):
+        clock = FakeClock()
+        cache = TrustScoreCache(client, ttl=10, clock=clock)
+
+        first = cache.get("e1")
+        clock.now = 9
+        second = cache.get("e1")
+
+        assert first is second
+        client.scores.get.assert_called_once_with("e1")
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_refetches_after_ttl(self, client):
+        clock = FakeClock()
+        cache = TrustScoreCache(client, ttl=10, clock=clock)
+
+        cache.get("e1")
+        clock.now = 10
+        cache.get("e1")
+
+        assert client.scores.get.call_count == 2
+        assert cache.stats.misses == 2
+
+    def test_stale_while_revalidate(self, client):
+        clock = FakeClock()
+        cache = TrustScoreCache(client, ttl=10, stale_ttl=20, clock=clock)
+        stale = cache.get("e1")
+
+        refreshed = threading.Event()
+        fresh = TrustScore(entity_id="e1", overall_score=0.9)
+
+        def slow_get(eid):
+            refreshed.set()
+            return fresh
+
+        client.scores.get.side_effect = slow_get
+        clock.now = 15
+
+        assert cache.get("e1") is stale
+        assert refreshed.wait(5)
+        for _ in range(100):
+            if cache.stats.refreshes:
+                break
+            time.sleep(0.01)
+        assert cache.get("e1") is fresh
+        assert cache.stats.stale_hits == 1
+
+    def test_failed_refresh_is_retried(self, client):
+        clock = FakeClock()
+        cache = TrustScoreCache(client, ttl=10, stale_ttl=20, clock=clock)
+        cache.get("e1")
+        client.scores.get.side_effect = ValueError("corrupt body")
+        clock.now = 15
+
+        cache.get("e1")
+        for _ in range(100):
+            if cache.stats.refresh_errors:
+                break
+            time.sleep(0.01)
+
+        assert cache.stats.refresh_errors == 1
+        assert "e1" not in cache._inflight
+
+    def test_evicts_least_recently_used(self, client):
+        cache = TrustScoreCache(client, max_size=2)
+
+        cache.get("e1")
+        cache.get("e2")
+        cache.get("e1")
+        cache.get("e3")
+
+        assert "e1" in cache
+        assert "e2" not in cache
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+
+    def test_errors_propagate_and_are_not_cached(self, client):
+        client.scores.get.side_effect = SozLedgerError(404, {"error": "not_found"})
+        cache = TrustScoreCache(client)
+
+        with pytest.raises(SozLedgerError):
+            cache.get("missing")
+
+        assert "missing" not in cache
+
+
+class TestEventInvalidation:
+    def test_score_updated_invalidates_entity(self, client):
+        cache = TrustScoreCache(client)
+        cache.get("e1")
+
+        invalidated = cache.handle_event(
+            {"event_type": "score.updated", "data": {"entity_id": "e1"}}
+        )
+
+        assert invalidated == ["e1"]
+        assert "e1" not in cache
+        assert cache.stats.invalidations == 1
+
+    @pytest.mark.parametrize(
+        "event_type", ["promise.fulfilled", "promise.broken", "promise.expired"]
+    )
+    def test_promise_outcome_invalidates_promisor(self, client, event_type):
+        cache = TrustScoreCache(client)
+        cache.get("e1")
+        cache.get("e2")
+
+        cache.handle_event(
+            {
+                "event_type": event_type,
+                "data": {"promise": {"promisor_id": "e1", "promisee_id": "e2"}},
+            }
+        )
+
+        assert "e1" not in cache
+        assert "e2" in cache
+
+    def test_unrelated_events_are_ignored(self, client):
+        cache = TrustScoreCache(client)
+        cache.get("e1")
+
+        assert cache.handle_event({"event_type": "evidence.submitted", "data": {}}) == []
+        assert "e1" in cache
+
+    def test_invalidation_during_fetch_discards_result(self, client):
+        cache = TrustScoreCache(client)
+
+        def racing_get(eid):
+            cache.invalidate(eid)
+            return TrustScore(entity_id=eid)
+
+        client.scores.get.side_effect = racing_get
+
+        cache.get("e1")
+
+        assert "e1" not in cache
+
+
+class TestGetMany:
+    def test_fetches_only_misses_in_one_batch(self, client):
+        client.scores.get_many.side_effect = lambda ids: {
+            eid: TrustScore(entity_id=eid) for eid in ids
+        }
+        cache = TrustScoreCache(client)
+        cache.get("e1")
+
+        scores = cache.get_many(["e1", "e2", "e3"])
+
+        client.scores.get_many.assert_called_once_with(["e2", "e3"])
+        assert list(scores) == ["e1", "e2", "e3"]
+        assert "e3" in cache
+        assert cache.stats.hits == 1
+
+    def test_errors_are_returned_but_not_cached(self, client):
+        error = SozLedgerError(404, {"error": "not_found"})
+        client.scores.get_many.return_value = {"e1": error}
+        cache = TrustScoreCache(client)
+
+        scores = cache.get_many(["e1"])
+
+        assert scores["e1"] is error
+        assert "e1" not in cache
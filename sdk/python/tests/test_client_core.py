@@ -39,6 +39,52 @@ class TestConstructor:
             timeout=10.0,
         )
 
+    def test_connection_options_are_passed_through(self):
+        limits = httpx.Limits(max_connections=200, keepalive_expiry=30.0)
+        timeout = httpx.Timeout(10.0, connect=2.0)
+        with patch("soz_ledger.client.httpx.Client") as MockHttp:
+            MockHttp.return_value = MagicMock()
+            SozLedgerClient("key", timeout=timeout, limits=limits, http2=True)
+
+        kwargs = MockHttp.call_args.kwargs
+        assert kwargs["timeout"] is timeout
+        assert kwargs["limits"] is limits
+        assert kwargs["http2"] is True
+
+
+class TestSharedTransport:
+    def test_clients_share_one_transport(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"id": "1"})
+
+        transport = httpx.MockTransport(handler)
+        first = SozLedgerClient("key_a", transport=transport)
+        second = SozLedgerClient("key_b", transport=transport)
+
+        first._get("/v1/test")
+        second._get("/v1/test")
+
+        assert seen == ["Bearer key_a", "Bearer key_b"]
+
+    def test_close_leaves_shared_transport_open(self):
+        transport = MagicMock(spec=httpx.BaseTransport)
+        client = SozLedgerClient("key", transport=transport)
+
+        client.close()
+
+        transport.close.assert_not_called()
+
+    def test_close_closes_owned_pool(self):
+        with patch("soz_ledger.client.httpx.Client") as MockHttp:
+            mock_http = MagicMock()
+            MockHttp.return_value = mock_http
+            SozLedgerClient("key").close()
+
+        mock_http.close.assert_called_once()
+
 
 class TestRequestDelegation:
     def test_get_delegates_to_request(self, mock_client):
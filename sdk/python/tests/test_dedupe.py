@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from soz_ledger.dedupe import MemoryDedupeStore, SQLiteDedupeStore
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestMemoryDedupeStore:
+    def test_duplicates_are_reported(self):
+        store = MemoryDedupeStore()
+
+        assert store.add("evt_1")
+        assert not store.add("evt_1")
+        assert store.add("evt_2")
+
+    def test_ids_age_out_of_the_window(self):
+        clock = FakeClock()
+        store = MemoryDedupeStore(window=60, clock=clock)
+        store.add("evt_1")
+
+        clock.now += 59
+        assert not store.add("evt_1")
+        clock.now += 1
+        assert store.add("evt_1")
+
+    def test_oldest_id_is_forgotten_beyond_max_entries(self):
+        store = MemoryDedupeStore(max_entries=2)
+        for delivery_id in ("evt_1", "evt_2", "evt_3"):
+            store.add(delivery_id)
+
+        assert len(store) == 2
+        assert "evt_1" not in store
+        assert store.add("evt_1")
+
+    def test_discard(self):
+        store = MemoryDedupeStore()
+        store.add("evt_1")
+        store.discard("evt_1")
+
+        assert store.add("evt_1")
+
+
+class TestSQLiteDedupeStore:
+    def test_duplicates_are_shared_between_connections(self, tmp_path):
+        path = str(tmp_path / "deliveries.sqlite3")
+        first, second = SQLiteDedupeStore(path), SQLiteDedupeStore(path)
+
+        assert first.add("evt_1")
+        assert not second.add("evt_1")
+        second.discard("evt_1")
+        assert first.add("evt_1")
+
+        first.close()
+        second.close()
+
+    def test_expired_ids_are_accepted_and_purged(self):
+        clock = FakeClock()
+        store = SQLiteDedupeStore(window=60, purge_every=2, clock=clock)
+        store.add("evt_1")
+
+        clock.now += 60
+        assert store.add("evt_1")
+        store.add("evt_2")  # second addition triggers a purge
+
+        clock.now += 60
+        store.add("evt_3")
+        store.add("evt_4")
+        assert len(store) == 2
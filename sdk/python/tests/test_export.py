@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from soz_ledger import export  # noqa: E402
+from soz_ledger.local import LocalLedger  # noqa: E402
+from soz_ledger.models import Evidence, Promise, ScoreHistoryEntry  # noqa: E402
+
+
+def promises(n: int):
+    for i in range(n):
+        yield Promise(
+            id=f"p{i}",
+            promisor_id="agent_1",
+            promisee_id="user_1",
+            description="d",
+            category=["delivery", "payment"][i % 2],
+            status=["active", "fulfilled", "broken"][i % 3],
+            deadline=None if i % 2 else "2026-03-05T00:00:00Z",
+            created_at=f"2026-03-01T12:00:{i % 60:02d}Z",
+        )
+
+
+class TestRecordBatches:
+    def test_typed_columns(self):
+        batch = next(export.record_batches(Promise, promises(3)))
+
+        assert batch.schema == export.schema(Promise)
+        assert batch.schema.field("status").type == pa.dictionary(pa.int32(), pa.string())
+        assert batch.column("created_at")[1].as_py() == datetime(
+            2026, 3, 1, 12, 0, 1, tzinfo=timezone.utc
+        )
+        assert batch.column("deadline").null_count == 1
+        assert batch.column("status").to_pylist() == ["active", "fulfilled", "broken"]
+
+    def test_fixed_size_batches_are_lazy(self):
+        source = promises(10)
+        batches = export.record_batches(Promise, source, batch_size=4)
+
+        assert next(batches).num_rows == 4
+        assert next(source).id == "p4"  # nothing read ahead of the batch
+        assert [b.num_rows for b in batches] == [4, 1]
+
+    def test_dicts_and_entity_id(self):
+        rows = [{"entity_id": "e1", "timestamp": "2026-03-01T12:00:00Z", "score": None,
+                 "level": "Unrated", "version": "v1"}]
+        entries = [ScoreHistoryEntry(score=0.8, level="Trusted", timestamp="2026-03-01T12:00:00Z")]
+
+        from_dicts = next(export.record_batches(ScoreHistoryEntry, rows))
+        from_models = next(export.record_batches(ScoreHistoryEntry, entries, entity_id="e2"))
+
+        assert from_dicts.column("entity_id").to_pylist() == ["e1"]
+        assert from_dicts.column("score").to_pylist() == [None]
+        assert from_models.column("entity_id").to_pylist() == ["e2"]
+        assert from_models.column("score").to_pylist() == [0.8]
+
+    def test_naive_and_offset_timestamps_are_utc(self):
+        rows = [
+            {"timestamp": "2026-03-01T12:00:00", "level": "Unrated", "version": "v1"},
+            {"timestamp": "2026-03-01T14:00:00+02:00", "level": "Unrated", "version": "v1"},
+            {"timestamp": "2026-03-01T12:00:00Z", "level": "Unrated", "version": "v1"},
+        ]
+
+        batch = next(export.record_batches(ScoreHistoryEntry, rows))
+
+        noon = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+        assert batch.column("timestamp").to_pylist() == [noon] * 3
+
+    def test_mixed_dicts_and_models_in_one_batch(self):
+        entry = ScoreHistoryEntry(score=0.8, level="Trusted", timestamp="2026-03-01T12:00:00Z")
+        row = {"entity_id": "e1", "timestamp": "2026-03-01T12:00:00Z", "score": 0.5,
+               "level": "Reliable", "version": "v1"}
+
+        batch = next(export.record_batches(ScoreHistoryEntry, [entry, row]))
+
+        assert batch.column("entity_id").to_pylist() == [None, "e1"]
+        assert batch.column("score").to_pylist() == [0.8, 0.5]
+
+    def test_evidence_payload_is_json(self):
+        evidence = Evidence(id="ev1", promise_id="p1", type="manual", submitted_by="u",
+                            payload={"ok": True}, created_at="2026-03-01T12:00:00Z")
+
+        batch = next(export.record_batches(Evidence, [evidence]))
+
+        assert batch.column("payload").to_pylist() == ['{"ok": true}']
+
+    def test_rejects_other_models(self):
+        with pytest.raises(TypeError):
+            export.schema(dict)
+        with pytest.raises(ValueError):
+            next(export.record_batches(Promise, [], batch_size=0))
+
+
+class TestWriters:
+    def test_parquet_round_trip(self, tmp_path):
+        path = str(tmp_path / "promises.parquet")
+
+        rows = export.write_parquet(Promise, promises(1000), path, batch_size=256)
+
+        table = pq.read_table(path)
+        assert rows == table.num_rows == 1000
+        assert pq.ParquetFile(path).metadata.num_row_groups == 4
+        assert table.column("category").to_pylist()[:2] == ["delivery", "payment"]
+
+    def test_exporter_collects_many_sources(self, tmp_path):
+        ledger = LocalLedger()
+        client = ledger.client()
+        a = client.entities.create(name="a", type="agent")
+        b = client.entities.create(name="b", type="agent")
+        for promisor, promisee in [(a, b), (b, a), (a, b)]:
+            promise = client.promises.create(
+                promisor_id=promisor.id, promisee_id=promisee.id, description="d"
+            )
+            client.promises.update_status_many([(promise.id, "fulfilled")])
+        path = str(tmp_path / "history.parquet")
+
+        with export.ParquetExporter(path, ScoreHistoryEntry) as out:
+            for entity in (a, b):
+                out.write(client.scores.iter_history(entity.id), entity_id=entity.id)
+
+        table = pq.read_table(path)
+        assert out.rows == table.num_rows
+        assert set(table.column("entity_id").to_pylist()) == {a.id, b.id}
+
+    def test_arrow_stream(self, tmp_path):
+        path = str(tmp_path / "promises.arrows")
+
+        rows = export.write_arrow(Promise, promises(10), path, batch_size=3)
+
+        with pa.ipc.open_stream(path) as reader:
+            table = reader.read_all()
+        assert rows == table.num_rows == 10
+        assert table.schema == export.schema(Promise)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from soz_ledger.async_client import AsyncSozLedgerClient
+from soz_ledger.client import SozLedgerClient
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.instrumentation import Instrumentation, LatencyHistogram, _route
+from soz_ledger.ratelimit import RateLimiter
+from tests.conftest import ENTITY_DATA
+
+
+class FakeClock:
+    def __init__(self, step: float) -> None:
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def instrumented_client(handler, **kwargs) -> tuple[SozLedgerClient, Instrumentation]:
+    instrumentation = Instrumentation(**kwargs)
+    client = SozLedgerClient(
+        "key",
+        transport=httpx.MockTransport(handler),
+        instrumentation=instrumentation,
+    )
+    return client, instrumentation
+
+
+class TestRoute:
+    @pytest.mark.parametrize(
+        "path, route",
+        [
+            ("/v1/entities", "/v1/entities"),
+            ("/v1/entities/ent_1", "/v1/entities/{id}"),
+            ("/v1/promises/prm_1/evidence", "/v1/promises/{id}/evidence"),
+            ("/v1/promises:batchCreate", "/v1/promises:batchCreate"),
+        ],
+    )
+    def test_collapses_resource_id(self, path, route):
+        assert _route(path) == route
+
+
+class TestLatencyHistogram:
+    def test_buckets_are_inclusive_upper_bounds(self):
+        hist = LatencyHistogram(buckets=(0.1, 1.0))
+
+        for value in (0.1, 0.5, 5.0):
+            hist.observe(value)
+
+        assert hist.counts == [1, 1, 1]
+        assert hist.count == 3
+        assert hist.sum == pytest.approx(5.6)
+
+    def test_quantile_interpolates_within_bucket(self):
+        hist = LatencyHistogram(buckets=(1.0, 2.0))
+        for _ in range(4):
+            hist.observe(1.5)
+
+        assert hist.quantile(0.5) == pytest.approx(1.5)
+        assert LatencyHistogram().quantile(0.99) == 0.0
+
+
+class TestClientInstrumentation:
+    def test_records_latency_status_and_bytes_per_route(self):
+        client, instr = instrumented_client(
+            lambda request: httpx.Response(200, json=ENTITY_DATA),
+            clock=FakeClock(0.02),
+        )
+
+        client.entities.get("ent_1")
+        client.entities.get("ent_2")
+
+        key = ("GET", "/v1/entities/{id}")
+        assert instr.histograms[key].count == 2
+        assert instr.histograms[key].sum == pytest.approx(0.04)
+        assert instr.status_counts[("GET", "/v1/entities/{id}", "200")] == 2
+        assert instr.bytes_received[key] > 0
+
+    def test_counts_request_bytes(self):
+        client, instr = instrumented_client(
+            lambda request: httpx.Response(201, json=ENTITY_DATA)
+        )
+
+        client.entities.create(name="agent", type="agent")
+
+        assert instr.bytes_sent[("POST", "/v1/entities")] > 0
+
+    def test_counts_retries(self):
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json=ENTITY_DATA),
+            ]
+        )
+        instr = Instrumentation()
+        client = SozLedgerClient(
+            "key",
+            transport=httpx.MockTransport(lambda request: next(responses)),
+            rate_limiter=RateLimiter(),
+            instrumentation=instr,
+        )
+
+        with patch("soz_ledger.client.time.sleep"):
+            client.entities.get("ent_1")
+
+        key = ("GET", "/v1/entities/{id}")
+        assert instr.retries[key] == 1
+        assert instr.status_counts[(*key, "429")] == 1
+        assert instr.status_counts[(*key, "200")] == 1
+
+    def test_transport_errors_are_recorded(self):
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        client, instr = instrumented_client(handler)
+
+        with pytest.raises(SozLedgerError):
+            client.scores.get("ent_1")
+
+        assert instr.status_counts[("GET", "/v1/scores/{id}", "error")] == 1
+
+    def test_hooks_see_each_attempt(self):
+        client, instr = instrumented_client(
+            lambda request: httpx.Response(200, json=ENTITY_DATA)
+        )
+        before, after = [], []
+        instr.on_request(before.append)
+        instr.on_response(lambda event: after.append(event.status_code))
+
+        client.entities.get("ent_1")
+
+        assert [e.route for e in before] == ["/v1/entities/{id}"]
+        assert after == [200]
+
+    def test_failing_hook_does_not_break_requests(self):
+        client, instr = instrumented_client(
+            lambda request: httpx.Response(200, json=ENTITY_DATA)
+        )
+
+        @instr.on_response
+        def broken(event):
+            raise RuntimeError("boom")
+
+        assert client.entities.get("ent_1").id == "ent_abc123"
+
+    def test_async_client_is_instrumented(self):
+        instr = Instrumentation(clock=FakeClock(0.02))
+
+        async def run():
+            async with AsyncSozLedgerClient(
+                "key",
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(200, json=ENTITY_DATA)
+                ),
+                instrumentation=instr,
+            ) as client:
+                await client.entities.get("ent_1")
+
+        asyncio.run(run())
+
+        key = ("GET", "/v1/entities/{id}")
+        assert instr.histograms[key].count == 1
+        assert instr.status_counts[(*key, "200")] == 1
+        assert instr.bytes_received[key] > 0
+
+
+class TestExport:
+    def test_render_prometheus(self):
+        client, instr = instrumented_client(
+            lambda request: httpx.Response(200, json=ENTITY_DATA),
+            buckets=(0.5,),
+            clock=FakeClock(0.1),
+        )
+        client.entities.get("ent_1")
+
+        text = instr.render_prometheus()
+
+        labels = 'method="GET",route="/v1/entities/{id}"'
+        assert "# TYPE soz_ledger_request_duration_seconds histogram" in text
+        assert f'soz_ledger_request_duration_seconds_bucket{{{labels},le="0.5"}} 1' in text
+        assert f'soz_ledger_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f'soz_ledger_responses_total{{{labels},status="200"}} 1' in text
+
+    def test_exports_spans_to_tracer(self):
+        pytest.importorskip("opentelemetry")
+        tracer = MagicMock()
+        client, _ = instrumented_client(
+            lambda request: httpx.Response(200, json=ENTITY_DATA), tracer=tracer
+        )
+
+        client.entities.get("ent_1")
+
+        assert tracer.start_span.call_args.args == ("GET /v1/entities/{id}",)
+        span = tracer.start_span.return_value
+        span.set_attribute.assert_called_with("http.response.status_code", 200)
+        span.end.assert_called_once()
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from soz_ledger.client import SozLedgerClient
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.local import LocalLedger, LocalLimits, SQLiteStore, make_server
+from soz_ledger.models import Evidence, Promise
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture()
+def ledger(clock):
+    return LocalLedger(clock=clock)
+
+
+@pytest.fixture()
+def client(ledger):
+    return ledger.client()
+
+
+@pytest.fixture()
+def pair(client):
+    a = client.entities.create(name="a", type="agent")
+    b = client.entities.create(name="b", type="agent")
+    return a, b
+
+
+def make_promise(client, pair, **kwargs) -> Promise:
+    a, b = pair
+    return client.promises.create(
+        promisor_id=a.id, promisee_id=b.id, description="Deliver report", **kwargs
+    )
+
+
+class TestEntities:
+    def test_create_returns_api_key_once(self, client):
+        entity = client.entities.create(name="bot", type="agent")
+
+        assert entity.api_key.startswith("sozl_")
+        assert client.entities.get(entity.id).api_key is None
+
+    def test_invalid_type_is_rejected(self, client):
+        with pytest.raises(SozLedgerError) as exc_info:
+            client.entities.create(name="bot", type="robot")
+
+        assert exc_info.value.status == 422
+
+    def test_unknown_entity_is_404(self, client):
+        with pytest.raises(SozLedgerError) as exc_info:
+            client.entities.get("missing")
+
+        assert exc_info.value.status == 404
+
+
+class TestPromiseLifecycle:
+    def test_create_and_fulfill(self, client, pair):
+        promise = make_promise(client, pair)
+
+        fulfilled = client.promises.fulfill(promise.id)
+
+        assert promise.status == "active"
+        assert fulfilled.status == "fulfilled"
+        assert fulfilled.fulfilled_at is not None
+
+    def test_terminal_states_reject_transitions(self, client, pair):
+        promise = make_promise(client, pair)
+        client.promises.break_promise(promise.id)
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            client.promises.fulfill(promise.id)
+
+        assert exc_info.value.status == 409
+        assert exc_info.value.code == "conflict"
+
+    def test_dispute_resolves_to_outcome(self, client, pair):
+        promise = make_promise(client, pair)
+        client.promises.dispute(promise.id)
+
+        assert client.promises.fulfill(promise.id).status == "fulfilled"
+
+    def test_deadline_passing_expires_promise(self, client, pair, clock):
+        promise = make_promise(
+            client, pair, deadline=(clock.now + timedelta(hours=1)).isoformat()
+        )
+
+        clock.now += timedelta(hours=2)
+
+        assert client.promises.get(promise.id).status == "expired"
+        with pytest.raises(SozLedgerError):
+            client.promises.fulfill(promise.id)
+
+    def test_self_promise_and_past_deadline_are_invalid(self, client, pair, clock):
+        a, _ = pair
+        with pytest.raises(SozLedgerError) as exc_info:
+            client.promises.create(promisor_id=a.id, promisee_id=a.id, description="d")
+        assert exc_info.value.status == 422
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            make_promise(client, pair, deadline=clock.now.isoformat())
+        assert exc_info.value.status == 422
+
+    def test_requires_api_key(self, ledger, pair):
+        client = SozLedgerClient("", transport=ledger.transport())
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            make_promise(client, pair)
+
+        assert exc_info.value.status == 401
+
+    def test_batch_endpoints_report_per_item(self, client, pair):
+        a, b = pair
+        created = client.promises.create_many(
+            [
+                {"promisor_id": a.id, "promisee_id": b.id, "description": "ok"},
+                {"promisor_id": a.id, "promisee_id": a.id, "description": "self"},
+            ]
+        )
+        assert isinstance(created[0], Promise)
+        assert created[1].status == 422
+
+        updated = client.promises.update_status_many(
+            [(created[0].id, "fulfilled"), (created[0].id, "broken")]
+        )
+        assert updated[0].status == "fulfilled"
+        assert updated[1].status == 409
+
+
+    def test_record_creates_evidence_and_outcome_at_once(self, client, pair):
+        a, b = pair
+
+        recorded = client.promises.record(
+            a.id, b.id, "Tool call: search",
+            evidence=[{"type": "manual", "submitted_by": a.id, "payload": {"n": 3}}],
+        )
+
+        assert recorded.promise.status == "fulfilled"
+        assert [e.promise_id for e in recorded.evidence] == [recorded.promise.id]
+        assert client.evidence.list(recorded.promise.id)[0].payload == {"n": 3}
+
+    def test_rejected_record_stores_nothing(self, client, ledger, pair):
+        a, b = pair
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            client.promises.record(
+                a.id, b.id, "d", evidence=[{"type": "bogus", "submitted_by": a.id}]
+            )
+
+        assert exc_info.value.status == 422
+        assert ledger.store.list("promises", a.id) == []
+
+    def test_batch_record_is_atomic_per_item(self, client, ledger, pair):
+        a, b = pair
+
+        results = client.promises.record_many(
+            [
+                {"promisor_id": a.id, "promisee_id": b.id, "description": "ok",
+                 "status": "broken"},
+                {"promisor_id": a.id, "promisee_id": b.id, "description": "bad",
+                 "evidence": [{"type": "bogus", "submitted_by": a.id}]},
+            ]
+        )
+
+        assert results[0].promise.status == "broken"
+        assert results[1].status == 422
+        assert [p["description"] for p in ledger.store.list("promises", a.id)] == ["ok"]
+
+class TestScores:
+    def test_unrated_until_five_outcomes(self, client, pair):
+        a, _ = pair
+        for _ in range(4):
+            client.promises.fulfill(make_promise(client, pair).id)
+
+        assert client.scores.get(a.id).level == "Unrated"
+
+        client.promises.break_promise(make_promise(client, pair).id)
+        score = client.scores.get(a.id)
+
+        assert score.rated
+        assert score.overall_score == pytest.approx(0.8)
+        assert score.level == "Reliable"
+        assert score.streak == 0
+        assert len(client.scores.history(a.id).history) == 5
+
+    def test_batch_get_reports_missing_entities(self, client, pair):
+        a, _ = pair
+
+        scores = client.scores.get_many([a.id, "missing"])
+
+        assert scores[a.id].entity_id == a.id
+        assert scores["missing"].status == 404
+
+
+class TestEvidenceAndPagination:
+    def test_submit_and_page_through_evidence(self, client, pair):
+        a, _ = pair
+        promise = make_promise(client, pair)
+        for i in range(5):
+            client.evidence.submit(promise.id, type="manual", submitted_by=a.id, payload={"i": i})
+
+        items = list(client.evidence.iter(promise.id, page_size=2))
+
+        assert [e.payload["i"] for e in items] == [0, 1, 2, 3, 4]
+        assert all(isinstance(e, Evidence) for e in items)
+        assert len(items[0].hash) == 64
+
+
+class TestRateLimits:
+    def test_key_window_headers_and_429(self, clock):
+        ledger = LocalLedger(limits=LocalLimits(requests_per_window=2), clock=clock)
+        client = ledger.client()
+        entity = client.entities.create(name="a", type="agent")
+
+        client.entities.get(entity.id)
+        with pytest.raises(SozLedgerError) as exc_info:
+            client.entities.get(entity.id)
+
+        assert exc_info.value.status == 429
+
+    def test_headers_are_exposed(self, clock):
+        ledger = LocalLedger(limits=LocalLimits(requests_per_window=10), clock=clock)
+        http = ledger.client()._http
+
+        resp = http.get("/v1/scores/missing")
+
+        assert resp.headers["X-RateLimit-Limit"] == "10"
+        assert resp.headers["X-RateLimit-Remaining"] == "9"
+        assert int(resp.headers["X-RateLimit-Reset"]) > clock.now.timestamp()
+
+    def test_pair_limit(self, clock):
+        ledger = LocalLedger(limits=LocalLimits(pair_promises=1), clock=clock)
+        client = ledger.client()
+        pair = (
+            client.entities.create(name="a", type="agent"),
+            client.entities.create(name="b", type="agent"),
+        )
+        make_promise(client, pair)
+
+        with pytest.raises(SozLedgerError) as exc_info:
+            make_promise(client, pair)
+        assert exc_info.value.status == 429
+
+        clock.now += timedelta(hours=1, seconds=1)
+        make_promise(client, pair)
+
+
+class TestWebhooks:
+    def test_deliveries_are_signed_and_logged(self, clock):
+        received = []
+
+        def deliver(url, body, headers):
+            received.append((url, body, headers))
+            return 200
+
+        ledger = LocalLedger(deliver=deliver, clock=clock)
+        client = ledger.client()
+        pair = (
+            client.entities.create(name="a", type="agent"),
+            client.entities.create(name="b", type="agent"),
+        )
+        webhook = client.webhooks.create(
+            url="https://example.com/hook", event_types=["promise.fulfilled"]
+        )
+
+        client.promises.fulfill(make_promise(client, pair).id)
+
+        [(url, body, headers)] = received
+        expected = hmac.new(webhook.secret.encode(), body, hashlib.sha256).hexdigest()
+        assert headers["X-SozLedger-Signature"] == expected
+        assert json.loads(body)["event_type"] == "promise.fulfilled"
+        [log] = client.webhooks.logs(webhook.id)
+        assert log.success
+
+    def test_receiver_can_call_back_into_the_ledger(self, clock):
+        seen = []
+
+        def deliver(url, body, headers):
+            # A real receiver answers on another thread, e.g. over HTTP.
+            promise_id = json.loads(body)["data"]["promise"]["id"]
+            worker = threading.Thread(
+                target=lambda: seen.append(client.promises.get(promise_id).status)
+            )
+            worker.start()
+            worker.join(5)
+            return 200
+
+        ledger = LocalLedger(deliver=deliver, clock=clock)
+        client = ledger.client()
+        pair = (
+            client.entities.create(name="a", type="agent"),
+            client.entities.create(name="b", type="agent"),
+        )
+        client.webhooks.create(url="https://example.com/hook", event_types=["promise.created"])
+
+        make_promise(client, pair)
+
+        assert seen == ["active"]
+
+    def test_webhooks_are_scoped_to_key(self, ledger):
+        mine = ledger.client("key_a")
+        theirs = ledger.client("key_b")
+        webhook = mine.webhooks.create(url="https://a", event_types=["score.updated"])
+
+        assert [w.id for w in mine.webhooks.list()] == [webhook.id]
+        assert theirs.webhooks.list() == []
+        mine.webhooks.delete(webhook.id)
+        assert mine.webhooks.list() == []
+
+
+class TestStorage:
+    def test_sqlite_store_persists_between_ledgers(self, tmp_path, clock):
+        path = str(tmp_path / "ledger.sqlite3")
+        client = LocalLedger(store=SQLiteStore(path), clock=clock).client()
+        entity = client.entities.create(name="a", type="agent")
+
+        reopened = LocalLedger(store=SQLiteStore(path), clock=clock).client()
+
+        assert reopened.entities.get(entity.id).name == "a"
+
+
+class TestServing:
+    def test_async_client(self, ledger):
+        async def run():
+            async with ledger.async_client() as client:
+                return await client.entities.create(name="a", type="agent")
+
+        assert asyncio.run(run()).name == "a"
+
+    def test_http_server(self, ledger):
+        server = make_server(ledger, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host, port = server.server_address
+            with SozLedgerClient("key", base_url=f"http://{host}:{port}") as client:
+                entity = client.entities.create(name="a", type="agent")
+                assert client.entities.get(entity.id).id == entity.id
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.local import LocalLedger
+from soz_ledger.mirror import LedgerMirror
+
+
+@pytest.fixture()
+def world():
+    clock = [datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)]
+    events = []
+    ledger = LocalLedger(
+        deliver=lambda url, body, headers: events.append(json.loads(body)) or 200,
+        clock=lambda: clock[0],
+    )
+    client = ledger.client()
+    a = client.entities.create(name="a", type="agent")
+    b = client.entities.create(name="b", type="agent")
+    client.webhooks.create(
+        url="https://example.com/hook",
+        event_types=[
+            "promise.created", "promise.fulfilled", "promise.broken",
+            "evidence.submitted", "score.updated",
+        ],
+    )
+
+    def tick():
+        clock[0] += timedelta(seconds=1)
+
+    return client, a, b, events, tick
+
+
+class TestLedgerMirror:
+    def test_events_populate_indexed_tables(self, world):
+        client, a, b, events, tick = world
+        mirror = LedgerMirror(client=client)
+        first = client.promises.create(
+            promisor_id=a.id, promisee_id=b.id, description="ship", category="delivery",
+            deadline="2026-03-05T00:00:00Z",
+        )
+        tick()
+        second = client.promises.create(
+            promisor_id=b.id, promisee_id=a.id, description="pay", category="payment",
+            deadline="2026-03-02T00:00:00Z",
+        )
+        tick()
+        client.evidence.submit(first.id, type="manual", submitted_by=b.id)
+        client.promises.update_status_many([(first.id, "fulfilled")])
+        for event in events:
+            mirror.handle_event(event)
+
+        assert [p.id for p in mirror.promises()] == [second.id, first.id]
+        assert [p.id for p in mirror.promises(promisor_id=a.id)] == [first.id]
+        assert [p.id for p in mirror.promises(promisee_id=a.id)] == [second.id]
+        assert mirror.promises(promisor_id=a.id)[0].status == "fulfilled"
+        assert [p.id for p in mirror.promises(status="active")] == [second.id]
+        assert [p.id for p in mirror.promises(category="delivery")] == [first.id]
+        assert [p.id for p in mirror.promises(due_before="2026-03-03T00:00:00Z")] == [second.id]
+        assert [e.promise_id for e in mirror.evidence(first.id)] == [first.id]
+        assert [h.level for h in mirror.score_history(a.id)]
+
+    def test_replayed_events_do_not_roll_back(self, world):
+        client, a, b, events, tick = world
+        mirror = LedgerMirror(client=client)
+        promise = client.promises.create(promisor_id=a.id, promisee_id=b.id, description="d")
+        tick()
+        client.promises.update_status_many([(promise.id, "broken")])
+        for event in reversed(events):
+            mirror.handle_event(event)
+        for event in events:
+            mirror.handle_event(event)
+
+        assert mirror.promises()[0].status == "broken"
+        assert mirror.execute("SELECT COUNT(*) FROM score_history")[0][0] == 1
+
+    def test_local_clock_does_not_order_updates(self, world):
+        # The ledger's clock is behind this machine's, as after clock skew.
+        client, a, b, events, tick = world
+        mirror = LedgerMirror(client=client)
+        promise = client.promises.create(promisor_id=a.id, promisee_id=b.id, description="d")
+        mirror.add_promises([promise])
+        mirror.sync()
+        tick()
+        client.promises.update_status_many([(promise.id, "broken")])
+        for event in events:
+            mirror.handle_event(event)
+
+        assert mirror.promises()[0].status == "broken"
+
+    def test_synced_outcome_replaces_later_dispute(self, world):
+        client, a, b, events, tick = world
+        mirror = LedgerMirror(client=client)
+        promise = client.promises.create(promisor_id=a.id, promisee_id=b.id, description="d")
+        tick()
+        client.promises.dispute(promise.id)
+        tick()
+        client.promises.break_promise(promise.id)
+        mirror.handle_event(
+            {
+                "event_type": "promise.disputed",
+                "timestamp": "2026-03-01T12:00:01Z",
+                "data": {"promise": {**dataclasses.asdict(promise), "status": "disputed"}},
+            }
+        )
+
+        mirror.sync()
+
+        assert mirror.promises()[0].status == "broken"
+
+    def test_sync_refreshes_open_promises_and_fetches_new_data(self, world):
+        client, a, b, events, tick = world
+        mirror = LedgerMirror(client=client)
+        mirror.track(a.id)
+        promise = client.promises.create(promisor_id=a.id, promisee_id=b.id, description="d")
+        mirror.add_promises([promise])
+        tick()
+        client.evidence.submit(promise.id, type="manual", submitted_by=b.id)
+        client.promises.update_status_many([(promise.id, "fulfilled")])
+
+        result = mirror.sync()
+
+        assert (result.entities, result.promises, result.evidence) == (1, 1, 1)
+        assert result.score_history == 1
+        assert mirror.entity(a.id).name == "a"
+        assert mirror.entity(a.id).api_key is None
+        assert mirror.promises()[0].status == "fulfilled"
+        assert mirror.score_history(a.id)[0].version != ""
+
+        # Nothing new: high-water marks keep the second sync cheap.
+        again = mirror.sync()
+        assert (again.promises, again.evidence, again.score_history) == (0, 0, 0)
+
+    def test_sync_fills_in_event_history_version(self, world):
+        client, a, b, events, tick = world
+        mirror = LedgerMirror(client=client)
+        promise = client.promises.create(promisor_id=a.id, promisee_id=b.id, description="d")
+        tick()
+        client.promises.update_status_many([(promise.id, "fulfilled")])
+        for event in events:
+            mirror.handle_event(event)
+        assert mirror.score_history(a.id)[0].version == ""
+
+        mirror.sync(entity_ids=[a.id])
+
+        assert [h.version for h in mirror.score_history(a.id)] == [
+            h.version for h in client.scores.history(a.id).history
+        ]
+
+    def test_event_history_is_not_duplicated_by_sync(self, world):
+        client, a, b, events, tick = world
+        mirror = LedgerMirror(client=client)
+        promise = client.promises.create(promisor_id=a.id, promisee_id=b.id, description="d")
+        tick()
+        client.promises.update_status_many([(promise.id, "fulfilled")])
+        # Delivery stamps the event a few seconds after the recompute.
+        for event in events:
+            if event["event_type"] == "score.updated":
+                event["timestamp"] = "2026-03-01T12:00:04Z"
+            mirror.handle_event(event)
+
+        result = mirror.sync(entity_ids=[a.id])
+        for event in events:
+            mirror.handle_event(event)
+
+        expected = client.scores.history(a.id).history
+        assert result.score_history == len(expected)
+        assert [(h.timestamp, h.version) for h in mirror.score_history(a.id)] == [
+            (h.timestamp, h.version) for h in expected
+        ]
+
+    def test_sync_counts_errors_and_keeps_going(self):
+        client = MagicMock()
+        client.entities.get.side_effect = SozLedgerError(503, {"error": "unavailable"})
+        client.promises.get.side_effect = SozLedgerError(404, {"error": "not found"})
+        mirror = LedgerMirror(client=client)
+        mirror.track("e1", "e2")
+
+        result = mirror.sync(promise_ids=["p1"])
+
+        assert result.errors == 3
+        assert mirror.tracked() == ["e1", "e2"]
+
+    def test_sync_needs_client(self):
+        with pytest.raises(ValueError):
+            LedgerMirror().sync()
+
+    def test_persists_across_instances(self, world, tmp_path):
+        client, a, b, events, tick = world
+        path = str(tmp_path / "mirror.sqlite3")
+        mirror = LedgerMirror(path, client)
+        mirror.track(a.id)
+        mirror.add_promises([
+            client.promises.create(promisor_id=a.id, promisee_id=b.id, description="d")
+        ])
+        mirror.sync()
+        mirror.close()
+
+        reopened = LedgerMirror(path, client)
+        assert reopened.tracked() == [a.id]
+        assert len(reopened.promises(promisor_id=a.id)) == 1
+        assert reopened.sync().score_history == 0
+        reopened.close()
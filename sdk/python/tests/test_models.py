@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import pytest
+
+from soz_ledger import models
 from soz_ledger.models import (
     Entity,
     Evidence,
@@ -7,6 +10,8 @@ from soz_ledger.models import (
     ScoreHistoryEntry,
     ScoreHistoryResponse,
     TrustScore,
+    WebhookWithSecret,
+    _decode,
     _from_dict,
 )
 
@@ -41,6 +46,29 @@ class TestFromDict:
         assert e.created_at == ""
         assert e.metadata is None
 
+    def test_models_are_slotted(self):
+        e = Entity(id="1", name="a", type="agent")
+        assert not hasattr(e, "__dict__")
+        with pytest.raises(AttributeError):
+            e.extra = 1
+
+    def test_subclass_inherits_fields(self):
+        w = _from_dict(
+            WebhookWithSecret,
+            {"id": "wh_1", "entity_id": "e", "url": "u", "secret": "s", "x": 1},
+        )
+        assert w.secret == "s"
+        assert w.url == "u"
+
+
+class TestDecode:
+    def test_decodes_bytes(self):
+        assert _decode(b'{"a": [1, null]}') == {"a": [1, None]}
+
+    def test_falls_back_to_stdlib_json(self, monkeypatch):
+        monkeypatch.setattr(models, "orjson", None)
+        assert _decode(b'[{"id": "x"}]') == [{"id": "x"}]
+
 
 class TestEntity:
     def test_minimal_construction(self):
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from soz_ledger.models import DeliveryLog, Evidence, ScoreHistoryEntry, Webhook
+from soz_ledger.pagination import apaginate, paginate
+from tests.conftest import (
+    DELIVERY_LOG_DATA,
+    EVIDENCE_DATA,
+    WEBHOOK_DATA,
+    make_response,
+)
+
+
+def pages(*sizes):
+    """Fetcher over pages of consecutive integers; records requested cursors."""
+    data, start = [], 0
+    for size in sizes:
+        data.append(list(range(start, start + size)))
+        start += size
+    calls = []
+
+    def fetch(cursor):
+        calls.append(cursor)
+        index = 0 if cursor is None else int(cursor)
+        next_cursor = str(index + 1) if index + 1 < len(data) else None
+        return data[index], next_cursor
+
+    return fetch, calls
+
+
+class TestPaginate:
+    def test_walks_all_pages(self):
+        fetch, calls = pages(2, 2, 1)
+
+        assert list(paginate(fetch)) == [0, 1, 2, 3, 4]
+        assert calls == [None, "1", "2"]
+
+    def test_limit_stops_early_without_extra_requests(self):
+        fetch, calls = pages(2, 2, 2)
+
+        assert list(paginate(fetch, limit=4)) == [0, 1, 2, 3]
+        assert calls == [None, "1"]
+
+    def test_prefetches_next_page_while_consuming(self):
+        fetch, calls = pages(2, 2)
+        fetched_second = threading.Event()
+
+        def tracking_fetch(cursor):
+            result = fetch(cursor)
+            if cursor == "1":
+                fetched_second.set()
+            return result
+
+        it = paginate(tracking_fetch)
+        assert next(it) == 0
+        # The second page is requested before the first one is exhausted.
+        assert fetched_second.wait(5)
+        assert list(it) == [1, 2, 3]
+
+    def test_without_prefetch(self):
+        fetch, calls = pages(1, 1)
+
+        assert list(paginate(fetch, prefetch=False)) == [0, 1]
+
+    def test_is_lazy(self):
+        fetch, calls = pages(1)
+
+        paginate(fetch)
+
+        assert calls == []
+
+    def test_async_walks_pages_with_limit(self):
+        fetch, calls = pages(2, 2, 2)
+
+        async def afetch(cursor):
+            return fetch(cursor)
+
+        async def run():
+            return [item async for item in apaginate(afetch, limit=3)]
+
+        assert asyncio.run(run()) == [0, 1, 2]
+        assert calls == [None, "1"]
+
+
+class TestClientIterators:
+    def test_evidence_iter_follows_next_cursor(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.side_effect = [
+            make_response(200, [EVIDENCE_DATA], {"X-Next-Cursor": "c2"}),
+            make_response(200, [EVIDENCE_DATA]),
+        ]
+
+        items = list(
+            client.evidence.iter("prm_abc123", page_size=1, since="2025-01-01T00:00:00Z")
+        )
+
+        assert len(items) == 2
+        assert all(isinstance(e, Evidence) for e in items)
+        first, second = mock_http.request.call_args_list
+        assert first.args == ("GET", "/v1/promises/prm_abc123/evidence")
+        assert first.kwargs["params"] == {"limit": 1, "since": "2025-01-01T00:00:00Z"}
+        assert second.kwargs["params"]["cursor"] == "c2"
+
+    def test_webhooks_iter_and_iter_logs(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.side_effect = [
+            make_response(200, [WEBHOOK_DATA]),
+            make_response(200, [DELIVERY_LOG_DATA, DELIVERY_LOG_DATA]),
+        ]
+
+        webhooks = list(client.webhooks.iter())
+        logs = list(client.webhooks.iter_logs("wh_abc123", limit=1))
+
+        assert isinstance(webhooks[0], Webhook)
+        assert len(logs) == 1
+        assert isinstance(logs[0], DeliveryLog)
+        assert mock_http.request.call_args.args == ("GET", "/v1/webhooks/wh_abc123/logs")
+
+    def test_scores_iter_history(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            200,
+            {"entity_id": "e1", "history": [{"score": 0.9, "level": "Highly Trusted"}]},
+        )
+
+        entries = list(client.scores.iter_history("e1"))
+
+        assert isinstance(entries[0], ScoreHistoryEntry)
+        assert entries[0].score == 0.9
+
+    def test_async_iter_logs(self, mock_async_client):
+        client, mock_http = mock_async_client
+        mock_http.request.side_effect = [
+            make_response(200, [DELIVERY_LOG_DATA], {"X-Next-Cursor": "c2"}),
+            make_response(200, [DELIVERY_LOG_DATA]),
+        ]
+
+        async def run():
+            return [log async for log in client.webhooks.iter_logs("wh_abc123")]
+
+        logs = asyncio.run(run())
+
+        assert len(logs) == 2
+        assert mock_http.request.await_args.kwargs["params"]["cursor"] == "c2"
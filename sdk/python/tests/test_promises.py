@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from soz_ledger.models import Promise
-from tests.conftest import PROMISE_DATA, make_response
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.models import Evidence, Promise, RecordedPromise
+from tests.conftest import EVIDENCE_DATA, PROMISE_DATA, make_response
 
 
 class TestPromisesCreate:
@@ -110,3 +111,224 @@ class TestPromisesDispute:
             "PATCH", "/v1/promises/prm_abc123/status", json={"status": "disputed"}
         )
         assert p.status == "disputed"
+
+
+def _batch(*results):
+    return {"results": list(results)}
+
+
+class TestPromisesCreateMany:
+    def test_posts_items_to_batch_endpoint(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            200, _batch({"index": 0, "status": 201, "data": PROMISE_DATA})
+        )
+
+        client.promises.create_many(
+            [{"promisor_id": "a", "promisee_id": "b", "description": "d"}]
+        )
+
+        mock_http.request.assert_called_once_with(
+            "POST",
+            "/v1/promises:batchCreate",
+            json={
+                "items": [
+                    {
+                        "promisor_id": "a",
+                        "promisee_id": "b",
+                        "description": "d",
+                        "category": "custom",
+                    }
+                ]
+            },
+        )
+
+    def test_returns_per_item_results_and_errors(self, mock_client):
+        client, mock_http = mock_client
+        error = {"error": "rate_limited", "message": "slow down"}
+        mock_http.request.return_value = make_response(
+            200,
+            _batch(
+                {"index": 1, "status": 429, "data": None, "error": error},
+                {"index": 0, "status": 201, "data": PROMISE_DATA, "error": None},
+            ),
+        )
+
+        results = client.promises.create_many(
+            [
+                {"promisor_id": "a", "promisee_id": "b", "description": "d1"},
+                {"promisor_id": "a", "promisee_id": "b", "description": "d2"},
+            ]
+        )
+
+        assert isinstance(results[0], Promise)
+        assert isinstance(results[1], SozLedgerError)
+        assert results[1].status == 429
+        assert results[1].code == "rate_limited"
+
+    def test_items_left_out_of_the_response_get_errors(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            200, _batch({"index": 1, "status": 201, "data": PROMISE_DATA})
+        )
+
+        results = client.promises.create_many(
+            [
+                {"promisor_id": "a", "promisee_id": "b", "description": "d1"},
+                {"promisor_id": "a", "promisee_id": "b", "description": "d2"},
+            ]
+        )
+
+        assert isinstance(results[0], SozLedgerError)
+        assert results[0].code == "missing_result"
+        assert isinstance(results[1], Promise)
+
+    def test_chunks_large_inputs(self, mock_client):
+        client, mock_http = mock_client
+
+        def respond(method, path, json):
+            return make_response(
+                200,
+                _batch(
+                    *(
+                        {"index": i, "status": 201, "data": PROMISE_DATA}
+                        for i in range(len(json["items"]))
+                    )
+                ),
+            )
+
+        mock_http.request.side_effect = respond
+
+        results = client.promises.create_many(
+            {"promisor_id": "a", "promisee_id": "b", "description": str(i)}
+            for i in range(250)
+        )
+
+        sizes = [len(c.kwargs["json"]["items"]) for c in mock_http.request.call_args_list]
+        assert sizes == [100, 100, 50]
+        assert len(results) == 250
+
+
+class TestPromisesUpdateStatusMany:
+    def test_sends_status_items(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            200,
+            _batch(
+                {"index": 0, "status": 200, "data": {**PROMISE_DATA, "status": "fulfilled"}},
+                {"index": 1, "status": 200, "data": {**PROMISE_DATA, "status": "broken"}},
+            ),
+        )
+
+        results = client.promises.update_status_many(
+            [("prm_1", "fulfilled"), ("prm_2", "broken")]
+        )
+
+        mock_http.request.assert_called_once_with(
+            "POST",
+            "/v1/promises:batchUpdateStatus",
+            json={
+                "items": [
+                    {"promise_id": "prm_1", "status": "fulfilled"},
+                    {"promise_id": "prm_2", "status": "broken"},
+                ]
+            },
+        )
+        assert [r.status for r in results] == ["fulfilled", "broken"]
+
+    def test_fulfill_many_uses_fulfilled_status(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            200, _batch({"index": 0, "status": 200, "data": PROMISE_DATA})
+        )
+
+        client.promises.fulfill_many(["prm_1"])
+
+        items = mock_http.request.call_args.kwargs["json"]["items"]
+        assert items == [{"promise_id": "prm_1", "status": "fulfilled"}]
+
+    def test_empty_input_sends_nothing(self, mock_client):
+        client, mock_http = mock_client
+
+        assert client.promises.break_many([]) == []
+        mock_http.request.assert_not_called()
+
+
+class TestPromisesRecord:
+    def test_posts_promise_evidence_and_status_together(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            201,
+            {"promise": {**PROMISE_DATA, "status": "fulfilled"}, "evidence": [EVIDENCE_DATA]},
+        )
+
+        recorded = client.promises.record(
+            promisor_id="a",
+            promisee_id="b",
+            description="d",
+            evidence=[{"type": "manual", "submitted_by": "a", "payload": {"ok": True}}],
+        )
+
+        mock_http.request.assert_called_once_with(
+            "POST",
+            "/v1/promises:record",
+            json={
+                "promisor_id": "a",
+                "promisee_id": "b",
+                "description": "d",
+                "category": "custom",
+                "status": "fulfilled",
+                "evidence": [
+                    {"type": "manual", "submitted_by": "a", "payload": {"ok": True}}
+                ],
+            },
+        )
+        assert isinstance(recorded, RecordedPromise)
+        assert recorded.promise.status == "fulfilled"
+        assert isinstance(recorded.evidence[0], Evidence)
+
+    def test_omits_evidence_when_not_given(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            201, {"promise": {**PROMISE_DATA, "status": "broken"}}
+        )
+
+        recorded = client.promises.record("a", "b", "d", status="broken")
+
+        json_body = mock_http.request.call_args.kwargs["json"]
+        assert "evidence" not in json_body
+        assert json_body["status"] == "broken"
+        assert recorded.evidence == []
+
+
+class TestPromisesRecordMany:
+    def test_posts_records_to_batch_endpoint(self, mock_client):
+        client, mock_http = mock_client
+        error = {"error": "validation_error", "message": "bad evidence"}
+        mock_http.request.return_value = make_response(
+            200,
+            _batch(
+                {"index": 1, "status": 422, "data": None, "error": error},
+                {
+                    "index": 0,
+                    "status": 201,
+                    "data": {"promise": PROMISE_DATA, "evidence": [EVIDENCE_DATA]},
+                    "error": None,
+                },
+            ),
+        )
+
+        results = client.promises.record_many(
+            [
+                {"promisor_id": "a", "promisee_id": "b", "description": "d1"},
+                {"promisor_id": "a", "promisee_id": "b", "description": "d2",
+                 "status": "broken"},
+            ]
+        )
+
+        assert mock_http.request.call_args.args == ("POST", "/v1/promises:batchRecord")
+        items = mock_http.request.call_args.kwargs["json"]["items"]
+        assert [i["status"] for i in items] == ["fulfilled", "broken"]
+        assert isinstance(results[0], RecordedPromise)
+        assert isinstance(results[0].evidence[0], Evidence)
+        assert results[1].status == 422
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.ratelimit import RateLimiter, TokenBucket
+from tests.conftest import PROMISE_DATA, make_response
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_allows_burst_then_paces(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=1, clock=clock)
+        bucket.reserve()
+
+        clock.now += 1.0
+
+        assert bucket.reserve() == 0
+
+    def test_unlimited_bucket_only_waits_while_blocked(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=None, capacity=1, clock=clock)
+        assert bucket.reserve() == 0
+
+        bucket.block_until(clock.now + 5)
+
+        assert bucket.reserve() == pytest.approx(5)
+        clock.now += 5
+        assert bucket.reserve() == 0
+
+    def test_sync_spreads_remaining_budget_until_reset(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100.0, capacity=10, clock=clock)
+
+        bucket.sync(remaining=2, reset_after=10.0)
+
+        assert bucket.tokens == 2
+        assert bucket.rate == pytest.approx(0.2)
+
+    def test_sync_with_no_remaining_blocks_until_reset(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100.0, capacity=10, clock=clock)
+
+        bucket.sync(remaining=0, reset_after=30.0)
+
+        assert bucket.reserve() >= 30.0
+
+
+class TestRateLimiter:
+    def test_backoff_doubles_and_caps(self):
+        limiter = RateLimiter()
+
+        assert limiter.backoff(0, 10) == 10
+        assert limiter.backoff(2, 10) == 40
+        assert limiter.backoff(10, 10) == 300
+        assert limiter.backoff(0, None) == 1
+
+    def test_429_on_key_budget_blocks_all_requests(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+
+        delay = limiter.observe(
+            "key", "GET", "/v1/scores/e1", None, 429, {"Retry-After": "7"}
+        )
+
+        assert delay == 7
+        assert limiter.acquire("key", "GET", "/v1/scores/e2") == pytest.approx(7)
+        assert limiter.acquire("other_key", "GET", "/v1/scores/e2") == 0
+
+    def test_429_on_promise_creation_blocks_only_that_pair(self):
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        body = {"promisor_id": "a", "promisee_id": "b"}
+
+        limiter.observe(
+            "key", "POST", "/v1/promises", body, 429,
+            {"Retry-After": "4", "X-RateLimit-Remaining": "50"},
+        )
+
+        assert limiter.acquire("key", "POST", "/v1/promises", body) == pytest.approx(4)
+        other = {"promisor_id": "a", "promisee_id": "c"}
+        assert limiter.acquire("key", "POST", "/v1/promises", other) == 0
+
+    def test_pair_rate_paces_batch_creation(self):
+        clock = FakeClock()
+        limiter = RateLimiter(pair_rate=1.0, pair_burst=1, clock=clock)
+        item = {"promisor_id": "a", "promisee_id": "b"}
+
+        assert limiter.acquire("key", "POST", "/v1/promises", item) == 0
+        wait = limiter.acquire(
+            "key", "POST", "/v1/promises:batchCreate", {"items": [item, item]}
+        )
+
+        assert wait == pytest.approx(1.0)
+
+    def test_stops_retrying_after_max_retries(self):
+        limiter = RateLimiter(max_retries=2)
+
+        assert limiter.observe("k", "GET", "/x", None, 429, {}, attempt=1) is not None
+        assert limiter.observe("k", "GET", "/x", None, 429, {}, attempt=2) is None
+
+    def test_non_429_is_not_retried(self):
+        limiter = RateLimiter()
+
+        assert limiter.observe("k", "GET", "/x", None, 200, {}) is None
+
+
+class TestClientRetries:
+    def test_retries_429_after_retry_after(self, mock_client):
+        client, mock_http = mock_client
+        client._rate_limiter = RateLimiter()
+        mock_http.request.side_effect = [
+            make_response(429, {"error": "rate_limited"}, {"Retry-After": "2"}),
+            make_response(201, PROMISE_DATA),
+        ]
+
+        with patch("soz_ledger.client.time.sleep") as sleep:
+            p = client.promises.create(promisor_id="a", promisee_id="b", description="d")
+
+        assert p.id == "prm_abc123"
+        assert mock_http.request.call_count == 2
+        assert sleep.call_args.args[0] == pytest.approx(2, abs=0.1)
+
+    def test_gives_up_after_max_retries(self, mock_client):
+        client, mock_http = mock_client
+        client._rate_limiter = RateLimiter(max_retries=1)
+        mock_http.request.return_value = make_response(
+            429, {"error": "rate_limited"}, {"Retry-After": "1"}
+        )
+
+        with patch("soz_ledger.client.time.sleep"):
+            with pytest.raises(SozLedgerError) as exc_info:
+                client.scores.get("ent_1")
+
+        assert exc_info.value.status == 429
+        assert mock_http.request.call_count == 2
+
+    def test_no_limiter_keeps_single_request(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(429, {"error": "rate_limited"})
+
+        with pytest.raises(SozLedgerError):
+            client.scores.get("ent_1")
+
+        assert mock_http.request.call_count == 1
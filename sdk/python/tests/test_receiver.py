@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from soz_ledger.dedupe import MemoryDedupeStore
+from soz_ledger.receiver import WebhookReceiver
+from soz_ledger.signing import SignatureVerifier, sign, verify_signature
+
+SECRET = "whsec_test"
+
+
+def make_event(event_type: str = "promise.fulfilled", **data) -> dict:
+    return {
+        "event_type": event_type,
+        "event_id": "evt_1",
+        "timestamp": "2026-02-14T09:14:00Z",
+        "data": data,
+    }
+
+
+async def deliver(
+    app,
+    body: bytes,
+    signature: str | None = None,
+    method: str = "POST",
+    delivery_id: str | None = None,
+    timestamp: str | None = None,
+) -> int:
+    """Send one request through the ASGI app and return the response status."""
+    headers = [(b"content-type", b"application/json")]
+    if signature is not None:
+        headers.append((b"x-sozledger-signature", signature.encode()))
+    if delivery_id is not None:
+        headers.append((b"x-sozledger-delivery-id", delivery_id.encode()))
+    if timestamp is not None:
+        headers.append((b"x-sozledger-timestamp", timestamp.encode()))
+    scope = {"type": "http", "method": method, "path": "/", "headers": headers}
+    chunks = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:], "more_body": False},
+    ]
+    sent = []
+
+    async def receive():
+        return chunks.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"]
+
+
+def signed(event: dict) -> tuple[bytes, str]:
+    body = json.dumps(event).encode()
+    return body, sign(body, SECRET)
+
+
+class TestSigning:
+    def test_verify_signature(self):
+        body = b'{"a": 1}'
+
+        assert verify_signature(body, sign(body, SECRET), SECRET)
+        assert not verify_signature(body, sign(body, "other"), SECRET)
+        assert not verify_signature(body, None, SECRET)
+
+
+class TestWebhookReceiver:
+    def test_verified_event_is_acknowledged_and_dispatched(self):
+        receiver = WebhookReceiver(SECRET)
+        seen = []
+
+        @receiver.on("promise.fulfilled")
+        async def handle(event):
+            seen.append(event["data"]["promise"]["id"])
+
+        async def run():
+            status = await deliver(receiver, *signed(make_event(promise={"id": "prm_1"})))
+            await receiver.close()
+            return status
+
+        assert asyncio.run(run()) == 202
+        assert seen == ["prm_1"]
+        assert receiver.stats.accepted == 1
+        assert receiver.stats.dispatched == 1
+
+    def test_acknowledges_before_slow_handler_finishes(self):
+        release = threading.Event()
+        receiver = WebhookReceiver(SECRET, handlers={"score.updated": lambda e: release.wait(5)})
+
+        async def run():
+            status = await deliver(receiver, *signed(make_event("score.updated")))
+            assert receiver.stats.dispatched == 0
+            release.set()
+            await receiver.close()
+            return status
+
+        assert asyncio.run(run()) == 202
+        assert receiver.stats.dispatched == 1
+
+    def test_rejects_bad_signature_and_body(self):
+        receiver = WebhookReceiver(SECRET)
+        body, _ = signed(make_event())
+
+        async def run():
+            statuses = [
+                await deliver(receiver, body, sign(body, "wrong")),
+                await deliver(receiver, body),
+                await deliver(receiver, b"not json!!", sign(b"not json!!", SECRET)),
+                await deliver(receiver, body, method="GET"),
+            ]
+            await receiver.close()
+            return statuses
+
+        assert asyncio.run(run()) == [401, 401, 400, 405]
+        assert receiver.stats.rejected == 3
+
+    def test_full_queue_answers_503(self):
+        receiver = WebhookReceiver(SECRET, workers=1, max_queue=1)
+
+        async def run():
+            blocker = asyncio.Event()
+
+            async def slow(event):
+                await blocker.wait()
+
+            receiver.on("*")(slow)
+            body, signature = signed(make_event())
+            statuses = [await deliver(receiver, body, signature)]
+            await asyncio.sleep(0)  # the worker takes the first event
+            statuses += [await deliver(receiver, body, signature) for _ in range(2)]
+            blocker.set()
+            await receiver.close()
+            return statuses
+
+        assert asyncio.run(run()) == [202, 202, 503]
+        assert receiver.stats.overflowed == 1
+
+    def test_failing_handler_does_not_stop_others(self):
+        seen = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        receiver = WebhookReceiver(
+            SECRET, handlers={"promise.broken": [broken, seen.append]}
+        )
+
+        async def run():
+            await deliver(receiver, *signed(make_event("promise.broken")))
+            await receiver.close()
+
+        asyncio.run(run())
+
+        assert len(seen) == 1
+        assert receiver.stats.failed == 1
+        assert receiver.stats.dispatched == 1
+
+    def test_lifespan_starts_and_drains(self):
+        receiver = WebhookReceiver(SECRET)
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(receiver({"type": "lifespan"}, receive, send))
+
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+    def test_header_timestamp_must_be_fresh_and_match_the_body(self):
+        sent_at = datetime(2026, 2, 14, 9, 14, tzinfo=timezone.utc).timestamp()
+        verifier = SignatureVerifier(SECRET, max_age=300, clock=lambda: sent_at + 60)
+        receiver = WebhookReceiver(verifier)
+        body, signature = signed(make_event())
+
+        async def run():
+            statuses = [
+                await deliver(receiver, body, signature, timestamp="2026-02-14T09:14:00Z"),
+                await deliver(receiver, body, signature, timestamp="2026-02-14T09:15:00Z"),
+                await deliver(receiver, body, signature),
+            ]
+            await receiver.close()
+            return statuses
+
+        assert asyncio.run(run()) == [202, 401, 401]
+        assert receiver.stats.rejected == 2
+
+    def test_unknown_event_type_cannot_be_registered(self):
+        with pytest.raises(ValueError):
+            WebhookReceiver(SECRET).on("promise.teleported")
+
+
+class TestDedupe:
+    def test_retried_delivery_is_acknowledged_once(self):
+        seen = []
+        receiver = WebhookReceiver(
+            SECRET, handlers={"*": seen.append}, dedupe=MemoryDedupeStore()
+        )
+        body, signature = signed(make_event())
+
+        async def run():
+            statuses = [
+                await deliver(receiver, body, signature, delivery_id="evt_1"),
+                await deliver(receiver, body, signature, delivery_id="evt_1"),
+                await deliver(receiver, body, signature),  # falls back to event_id
+            ]
+            await receiver.close()
+            return statuses
+
+        assert asyncio.run(run()) == [202, 200, 200]
+        assert len(seen) == 1
+        assert receiver.stats.duplicates == 2
+
+    def test_overflowed_delivery_is_accepted_on_retry(self):
+        dedupe = MemoryDedupeStore()
+        receiver = WebhookReceiver(SECRET, workers=1, max_queue=1, dedupe=dedupe)
+
+        async def run():
+            blocker = asyncio.Event()
+
+            async def slow(event):
+                await blocker.wait()
+
+            receiver.on("*")(slow)
+            statuses = []
+            for event_id in ("evt_1", "evt_2", "evt_3"):
+                event = make_event()
+                event["event_id"] = event_id
+                statuses.append(await deliver(receiver, *signed(event)))
+                await asyncio.sleep(0)
+            blocker.set()
+            await receiver.close()
+            return statuses
+
+        assert asyncio.run(run()) == [202, 202, 503]
+        assert "evt_3" not in dedupe
+
+    def test_blocking_stores_run_off_the_event_loop(self):
+        class RecordingStore:
+            def __init__(self):
+                self.threads = []
+
+            def add(self, delivery_id):
+                self.threads.append(threading.get_ident())
+                return True
+
+            def discard(self, delivery_id):
+                pass
+
+        store = RecordingStore()
+        receiver = WebhookReceiver(SECRET, dedupe=store)
+
+        async def run():
+            await deliver(receiver, *signed(make_event()))
+            await receiver.close()
+
+        asyncio.run(run())
+
+        assert store.threads and threading.get_ident() not in store.threads
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from soz_ledger.errors import SozLedgerError
 from soz_ledger.models import ScoreHistoryResponse, TrustScore
 from tests.conftest import SCORE_DATA, SCORE_HISTORY_DATA, make_response
 
@@ -65,3 +66,62 @@ class TestScoresHistory:
         assert resp.history[0].level == "Reliable"
         assert resp.history[1].score == 85.5
         assert resp.history[1].timestamp == "2025-01-02T00:00:00Z"
+
+
+class TestScoresGetMany:
+    def test_posts_ids_to_batch_endpoint(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            200,
+            {
+                "results": [
+                    {"index": 0, "status": 200, "data": SCORE_DATA},
+                    {"index": 1, "status": 404, "error": {"error": "not_found"}},
+                ]
+            },
+        )
+
+        scores = client.scores.get_many(["ent_abc123", "ent_missing", "ent_abc123"])
+
+        mock_http.request.assert_called_once_with(
+            "POST",
+            "/v1/scores:batchGet",
+            json={"entity_ids": ["ent_abc123", "ent_missing"]},
+        )
+        assert list(scores) == ["ent_abc123", "ent_missing"]
+        assert isinstance(scores["ent_abc123"], TrustScore)
+        assert isinstance(scores["ent_missing"], SozLedgerError)
+        assert scores["ent_missing"].status == 404
+
+    def test_short_response_still_covers_every_id(self, mock_client):
+        client, mock_http = mock_client
+        mock_http.request.return_value = make_response(
+            200, {"results": [{"index": 1, "status": 200, "data": {"entity_id": "e1"}}]}
+        )
+
+        scores = client.scores.get_many(["e0", "e1", "e2"])
+
+        assert list(scores) == ["e0", "e1", "e2"]
+        assert isinstance(scores["e1"], TrustScore)
+        assert scores["e0"].code == scores["e2"].code == "missing_result"
+
+    def test_chunks_large_lists(self, mock_client):
+        client, mock_http = mock_client
+
+        def respond(method, path, json):
+            return make_response(
+                200,
+                {
+                    "results": [
+                        {"index": i, "status": 200, "data": {"entity_id": eid}}
+                        for i, eid in enumerate(json["entity_ids"])
+                    ]
+                },
+            )
+
+        mock_http.request.side_effect = respond
+
+        scores = client.scores.get_many([f"e{i}" for i in range(5)], chunk_size=2)
+
+        assert mock_http.request.call_count == 3
+        assert [s.entity_id for s in scores.values()] == [f"e{i}" for i in range(5)]
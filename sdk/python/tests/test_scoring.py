@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from soz_ledger import scoring
+from soz_ledger.local import LocalLedger
+from soz_ledger.models import Promise
+from soz_ledger.scoring import Outcome, OutcomeTable, ScoringEngine, trust_level
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+DAY = 86_400.0
+
+
+def history(*statuses: str, category: str = "delivery") -> list[Outcome]:
+    """Outcomes one day apart, the last resolved a day before ``NOW``."""
+    return [
+        Outcome(status, category, resolved_at=NOW - (len(statuses) - i) * DAY)
+        for i, status in enumerate(statuses)
+    ]
+
+
+@pytest.fixture()
+def engine():
+    return ScoringEngine(clock=lambda: NOW)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def vectorized(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(scoring, "np", None)
+    return request.param
+
+
+class TestScoringEngine:
+    def test_fulfillment_ratio_streak_and_categories(self, engine):
+        outcomes = history("fulfilled", "broken", "fulfilled", "fulfilled")
+        outcomes += history("expired", "fulfilled", category="payment")
+        outcomes.append(Outcome("active"))
+
+        score = engine.score("agent_1", outcomes)
+
+        assert score.overall_score == round(4 / 6, 4)
+        assert score.level == "Reliable"
+        assert score.total_promises == 7
+        assert score.fulfilled_count == 4
+        assert score.broken_count == 1
+        assert score.category_scores == {"delivery": 0.75, "payment": 0.5}
+        # Ordered by resolution time: the payment outcomes interleave.
+        assert score.streak == 2
+
+    def test_unrated_below_minimum(self, engine):
+        score = engine.score("agent_1", history("fulfilled"))
+
+        assert score.overall_score is None
+        assert score.level == "Unrated"
+        assert not score.rated
+
+    def test_recency_weighting(self):
+        outcomes = [
+            Outcome("broken", resolved_at=NOW - 30 * DAY),
+            *[Outcome("fulfilled", resolved_at=NOW) for _ in range(4)],
+        ]
+
+        flat = ScoringEngine(clock=lambda: NOW).score("a", outcomes)
+        weighted = ScoringEngine(half_life_days=30, clock=lambda: NOW).score("a", outcomes)
+
+        assert flat.overall_score == 0.8
+        assert weighted.overall_score == round(4 / 4.5, 4)
+
+    def test_what_if(self, engine):
+        base = history("fulfilled", "fulfilled", "fulfilled", "fulfilled", "broken")
+
+        current, kept, lost = engine.what_if(
+            "agent_1", base, [[Outcome("fulfilled")] * 5, [Outcome("broken")]]
+        )
+
+        assert current.overall_score == 0.8
+        assert kept.overall_score == 0.9
+        assert kept.streak == 5
+        assert lost.overall_score == round(4 / 6, 4)
+
+    def test_score_many_matches_score(self, vectorized):
+        engine = ScoringEngine(half_life_days=7, clock=lambda: NOW)
+        histories = {
+            "a": history("fulfilled", "broken", "fulfilled", "fulfilled", "fulfilled"),
+            "b": history("broken") + history("fulfilled", category="payment"),
+            "c": [],
+            "d": [Outcome("fulfilled", delay_hours=2.0), Outcome("fulfilled", delay_hours=4.0)]
+            + history("expired", "fulfilled", "fulfilled"),
+        }
+
+        scores = engine.score_many(histories)
+
+        assert list(scores) == list(histories)
+        for entity_id, outcomes in histories.items():
+            assert scores[entity_id] == engine.score(entity_id, outcomes)
+        assert scores["d"].avg_delay_hours == 3.0
+
+    def test_matches_local_ledger(self):
+        clock = [datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)]
+        ledger = LocalLedger(clock=lambda: clock[0])
+        client = ledger.client()
+        a = client.entities.create(name="a", type="agent")
+        b = client.entities.create(name="b", type="agent")
+        deadline = (clock[0] + timedelta(days=1)).isoformat()
+        for status, category in [
+            ("fulfilled", "delivery"),
+            ("broken", "delivery"),
+            ("fulfilled", "payment"),
+            ("fulfilled", "delivery"),
+            ("fulfilled", "payment"),
+            ("fulfilled", "delivery"),
+            ("active", "delivery"),
+        ]:
+            clock[0] += timedelta(minutes=1)
+            promise = client.promises.create(
+                promisor_id=a.id,
+                promisee_id=b.id,
+                description="d",
+                category=category,
+                deadline=deadline,
+            )
+            if status != "active":
+                client.promises.update_status_many([(promise.id, status)])
+        served = client.scores.get(a.id)
+
+        outcomes = map(Outcome.from_promise, ledger.store.list("promises", a.id))
+        local = ScoringEngine(clock=clock[0].timestamp).score(a.id, outcomes)
+
+        for field in (
+            "overall_score", "level", "rated", "total_promises", "fulfilled_count",
+            "broken_count", "avg_delay_hours", "category_scores", "streak",
+        ):
+            assert getattr(local, field) == getattr(served, field), field
+
+
+class TestOutcomeTable:
+    def test_extend_scores_like_appended_histories(self):
+        pytest.importorskip("numpy")
+        engine = ScoringEngine(clock=lambda: NOW)
+        base = {
+            "a": history("fulfilled", "fulfilled", "broken", "fulfilled", "fulfilled"),
+            "b": history("fulfilled", "fulfilled", "fulfilled", "fulfilled", "fulfilled"),
+        }
+        table = OutcomeTable.from_histories(base)
+
+        scenario = table.extend(
+            {"b": [Outcome("broken", category="uptime")], "c": [Outcome("fulfilled")] * 5}
+        )
+        scores = engine.score_table(scenario)
+
+        assert len(table) == 10
+        assert len(scenario) == 16
+        assert scores["a"] == engine.score("a", base["a"])
+        assert scores["b"] == engine.score("b", base["b"] + [Outcome("broken", category="uptime")])
+        assert scores["b"].streak == 0
+        assert scores["c"].overall_score == 1.0
+        assert engine.score_table(table)["b"].streak == 5
+
+
+class TestOutcome:
+    def test_from_promise(self):
+        promise = Promise(
+            id="p1",
+            promisor_id="a",
+            promisee_id="b",
+            description="d",
+            category="payment",
+            status="fulfilled",
+            deadline="2026-03-01T12:00:00Z",
+            fulfilled_at="2026-03-01T15:00:00Z",
+        )
+
+        outcome = Outcome.from_promise(promise)
+
+        assert outcome.category == "payment"
+        assert outcome.delay_hours == 3.0
+        assert outcome.resolved_at == NOW + 3 * 3600
+
+
+def test_trust_level_bands():
+    assert [trust_level(s) for s in (None, 0.3, 0.31, 0.8049, 0.959, 1.0)] == [
+        "Unrated", "Low Trust", "Developing", "Reliable", "Exceptional", "Exceptional",
+    ]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from soz_ledger.signing import SignatureVerifier, sign
+
+BODY = b'{"event_type": "promise.fulfilled"}'
+SENT_AT = "2026-02-14T09:14:00Z"
+NOW = datetime(2026, 2, 14, 9, 14, tzinfo=timezone.utc).timestamp()
+
+
+class TestSignatureVerifier:
+    def test_accepts_only_the_right_signature(self):
+        verifier = SignatureVerifier("whsec_a")
+
+        assert verifier.verify(BODY, sign(BODY, "whsec_a"))
+        assert not verifier.verify(BODY, sign(BODY, "whsec_b"))
+        assert not verifier.verify(BODY + b" ", sign(BODY, "whsec_a"))
+        assert not verifier.verify(BODY, "not-hex")
+        assert not verifier.verify(BODY, None)
+
+    def test_rotation_accepts_every_active_secret(self):
+        verifier = SignatureVerifier(["whsec_old", "whsec_new"])
+
+        assert verifier.verify(BODY, sign(BODY, "whsec_old"))
+        assert verifier.verify(BODY, sign(BODY, "whsec_new"))
+
+        verifier.remove_secret("whsec_old")
+        assert not verifier.verify(BODY, sign(BODY, "whsec_old"))
+        with pytest.raises(ValueError):
+            verifier.remove_secret("whsec_new")
+
+    def test_replay_window(self):
+        clock_now = [NOW + 60]
+        verifier = SignatureVerifier(
+            "whsec_a", max_age=300, max_skew=30, clock=lambda: clock_now[0]
+        )
+        signature = sign(BODY, "whsec_a")
+
+        assert verifier.verify(BODY, signature, SENT_AT)
+        assert not verifier.verify(BODY, signature)
+        assert not verifier.verify(BODY, signature, "yesterday")
+        clock_now[0] = NOW + 301
+        assert not verifier.verify(BODY, signature, SENT_AT)
+        clock_now[0] = NOW - 31
+        assert not verifier.verify(BODY, signature, SENT_AT)
+
+    @pytest.mark.parametrize("threads", [0, 2])
+    def test_verify_many_keeps_order(self, threads):
+        verifier = SignatureVerifier("whsec_a", threads=threads, parallel_threshold=1_000)
+        large = b"x" * 5_000
+        deliveries = [
+            (BODY, sign(BODY, "whsec_a"), None),
+            (large, sign(large, "whsec_a"), None),
+            (large, sign(large, "whsec_b"), None),
+            (BODY, None, None),
+        ]
+
+        assert verifier.verify_many(deliveries) == [True, True, False, False]
+        verifier.close()
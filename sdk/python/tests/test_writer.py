@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from soz_ledger.errors import SozLedgerError
+from soz_ledger.models import Promise
+from soz_ledger.writer import WriteBehindQueue
+
+
+def _ok(items):
+    return [Promise(id=f"prm_{i}", promisor_id="a", promisee_id="b", description="d")
+            for i in range(len(items))]
+
+
+@pytest.fixture()
+def client():
+    client = MagicMock()
+    client.promises.create_many.side_effect = _ok
+    client.promises.update_status_many.side_effect = _ok
+    return client
+
+
+class TestWriteBehindQueue:
+    def test_flush_sends_queued_operations(self, client):
+        writer = WriteBehindQueue(client)
+
+        writer.submit_evidence("prm_1", type="output", submitted_by="a", payload={"x": 1})
+        writer.fulfill("prm_1")
+        assert writer.flush(timeout=5)
+
+        client.evidence.submit.assert_called_once_with(
+            "prm_1", type="output", submitted_by="a", payload={"x": 1}
+        )
+        client.promises.update_status_many.assert_called_once_with([("prm_1", "fulfilled")])
+        assert writer.stats.queued == 2
+        assert writer.stats.sent == 2
+        writer.close()
+
+    def test_batches_creates_and_coalesces_status_updates(self, client):
+        writer = WriteBehindQueue(client)
+        batch = [
+            {"op": "create", "data": {"promisor_id": "a", "promisee_id": "b",
+                                      "description": str(i), "category": "custom"}}
+            for i in range(3)
+        ] + [
+            {"op": "status", "promise_id": "prm_1", "status": "disputed"},
+            {"op": "evidence", "promise_id": "prm_1",
+             "data": {"type": "log", "submitted_by": "a"}},
+            {"op": "status", "promise_id": "prm_1", "status": "broken"},
+        ]
+
+        writer._send(batch)
+        writer.close()
+
+        client.promises.create_many.assert_called_once()
+        assert len(client.promises.create_many.call_args.args[0]) == 3
+        client.evidence.submit.assert_called_once_with("prm_1", type="log", submitted_by="a")
+        client.promises.update_status_many.assert_called_once_with([("prm_1", "broken")])
+        assert writer.stats.coalesced == 1
+        assert writer.stats.sent == 5
+
+    def test_counts_per_item_and_batch_failures(self, client):
+        client.promises.update_status_many.side_effect = lambda items: [
+            SozLedgerError(409, {"error": "conflict"}) for _ in items
+        ]
+        client.evidence.submit.side_effect = SozLedgerError(0, {"error": "timeout"})
+        writer = WriteBehindQueue(client)
+
+        writer.submit_evidence("prm_1", type="log", submitted_by="a")
+        writer.fulfill("prm_1")
+        writer.close()
+
+        assert writer.stats.failed == 2
+        assert writer.stats.sent == 0
+
+    def test_unexpected_errors_do_not_stop_the_worker(self, client):
+        client.promises.update_status_many.side_effect = TypeError("bad kwargs")
+        client.evidence.submit.side_effect = ValueError("unwrapped")
+        writer = WriteBehindQueue(client, batch_size=1)
+
+        writer.fulfill("prm_1")
+        writer.submit_evidence("prm_1", type="manual", submitted_by="a")
+        assert writer.flush(timeout=5)
+        client.promises.update_status_many.side_effect = _ok
+        writer.fulfill("prm_2")
+        writer.close()
+
+        assert writer.stats.failed == 2
+        assert writer.stats.sent == 1
+
+    def test_records_are_batched(self, client):
+        client.promises.record_many.side_effect = _ok
+        writer = WriteBehindQueue(client)
+
+        writer.record(
+            "a", "b", "d", status="broken", evidence=[{"type": "log", "submitted_by": "a"}]
+        )
+        writer.record("a", "b", "e")
+        writer.close()
+
+        [records] = client.promises.record_many.call_args.args
+        assert records[0] == {
+            "promisor_id": "a",
+            "promisee_id": "b",
+            "description": "d",
+            "status": "broken",
+            "deadline": None,
+            "category": "custom",
+            "evidence": [{"type": "log", "submitted_by": "a"}],
+        }
+        assert writer.stats.sent == 2
+
+    def test_drop_policy_discards_when_full(self, client):
+        gate = threading.Event()
+        client.evidence.submit.side_effect = lambda *a, **k: gate.wait(5)
+        writer = WriteBehindQueue(client, max_size=1, batch_size=1, overflow="drop")
+
+        writer.submit_evidence("prm_0", type="log", submitted_by="a")
+        while writer._queue.qsize():  # wait for the worker to pick it up
+            pass
+        writer.fulfill("prm_1")
+        writer.fulfill("prm_2")
+        gate.set()
+        writer.close()
+
+        assert writer.stats.dropped == 1
+        assert writer.stats.queued == 2
+
+    def test_spill_policy_replays_from_disk(self, client, tmp_path):
+        gate = threading.Event()
+        client.evidence.submit.side_effect = lambda *a, **k: gate.wait(5)
+        spill = tmp_path / "spill.jsonl"
+        writer = WriteBehindQueue(
+            client, max_size=1, batch_size=1, overflow="spill", spill_path=str(spill)
+        )
+
+        writer.submit_evidence("prm_0", type="log", submitted_by="a")
+        while writer._queue.qsize():
+            pass
+        writer.fulfill("prm_1")
+        writer.fulfill("prm_2")
+        assert spill.read_text().count("\n") == 1
+        gate.set()
+        writer.close()
+
+        assert writer.stats.spilled == 1
+        sent = [c.args[0] for c in client.promises.update_status_many.call_args_list]
+        assert [("prm_2", "fulfilled")] in sent
+        assert not spill.exists()
+
+    def test_leftover_replay_file_is_sent_with_new_spill(self, client, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        replay = tmp_path / "spill.jsonl.replay"
+        replay.write_text(
+            '{"op": "status", "promise_id": "prm_1", "status": "fulfilled"}\n'
+            "not json\n"
+        )
+        spill.write_text('{"op": "status", "promise_id": "prm_2", "status": "broken"}\n')
+
+        writer = WriteBehindQueue(client, overflow="spill", spill_path=str(spill))
+        writer.close()
+
+        sent = [u for c in client.promises.update_status_many.call_args_list
+                for u in c.args[0]]
+        assert sent == [("prm_1", "fulfilled"), ("prm_2", "broken")]
+        assert writer.stats.failed == 1
+        assert not spill.exists()
+        assert not replay.exists()
+
+    def test_replay_keeps_operations_that_fail_retryably(self, client, tmp_path):
+        spill = tmp_path / "spill.jsonl"
+        spill.write_text(
+            '{"op": "status", "promise_id": "prm_1", "status": "fulfilled"}\n'
+            '{"op": "evidence", "promise_id": "prm_1",'
+            ' "data": {"type": "manual", "submitted_by": "a"}}\n'
+        )
+        client.promises.update_status_many.side_effect = SozLedgerError(
+            503, {"error": "unavailable"}
+        )
+        client.evidence.submit.side_effect = SozLedgerError(422, {"error": "invalid"})
+        writer = WriteBehindQueue(
+            client, overflow="spill", spill_path=str(spill), spill_retry_interval=60
+        )
+        replay = tmp_path / "spill.jsonl.replay"
+        for _ in range(500):
+            called = client.promises.update_status_many.called
+            if called and spill.exists() and not replay.exists():
+                break
+            time.sleep(0.01)
+        assert "prm_1" in spill.read_text()  # written back, not lost
+
+        client.promises.update_status_many.side_effect = _ok
+        writer.close()  # replays once more on the way out
+
+        assert client.promises.update_status_many.call_args.args == ([("prm_1", "fulfilled")],)
+        assert client.evidence.submit.call_count == 1  # rejected for good
+        assert writer.stats.failed == 1
+        assert writer.stats.sent == 1
+        assert not spill.exists()
+
+    def test_rejects_writes_after_close(self, client):
+        writer = WriteBehindQueue(client)
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.fulfill("prm_1")
+
+    def test_invalid_overflow_policy(self, client):
+        with pytest.raises(ValueError):
+            WriteBehindQueue(client, overflow="explode")
+        with pytest.raises(ValueError):
+            WriteBehindQueue(client, overflow="spill")